@@ -0,0 +1,81 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from tennis_simulation.benchmark import compare_results, results_to_json, run_suite
+
+
+def run(args: argparse.Namespace) -> int:
+    results = run_suite(
+        n_matches=args.matches,
+        repeats=args.repeats,
+        seed=args.seed,
+        include_batch=not args.no_batch,
+    )
+    for result in results:
+        rates = ", ".join(f"{unit}={value:,.0f}" for unit, value in result.rates.items())
+        print(f"{result.name:40s} {result.seconds:8.3f}s  {rates}")
+
+    payload = results_to_json(
+        results, matches=args.matches, repeats=args.repeats, seed=args.seed
+    )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(f"Wrote {len(results)} benchmarks to {args.output}")
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    regressions = compare_results(baseline, current, threshold=args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name} {regression.rate}: "
+            f"{regression.baseline:,.0f} -> {regression.current:,.0f} "
+            f"({regression.change:+.1%})"
+        )
+    if regressions:
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%}.")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure simulation throughput and compare benchmark runs."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmark suite.")
+    run_parser.add_argument("--matches", type=int, default=200)
+    run_parser.add_argument("--repeats", type=int, default=3)
+    run_parser.add_argument("--seed", type=int, default=12345)
+    run_parser.add_argument("--no-batch", action="store_true")
+    run_parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("benchmarks") / "latest.json",
+    )
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Flag throughput regressions between two result files."
+    )
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Fractional drop in any rate that counts as a regression.",
+    )
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
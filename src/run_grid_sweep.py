@@ -0,0 +1,160 @@
+import argparse
+import csv
+from pathlib import Path
+
+from tennis_simulation import ClutchConfig, MatchConfig, StreakConfig
+from tennis_simulation.cache import ResultCache
+from tennis_simulation.grid import (
+    grid_config,
+    grid_points,
+    latin_hypercube_points,
+    parse_parameter,
+    run_grid,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Estimate game/set/match win rates over a grid or Latin hypercube of point "
+            "probability, streak and clutch parameters, written as .npy columns."
+        )
+    )
+    parser.add_argument(
+        "--param",
+        action="append",
+        required=True,
+        metavar="NAME=SPEC",
+        help=(
+            "Repeatable. NAME is p, streak_intensity, streak_decay, streak_momentum_step, "
+            "clutch_primary_boost or clutch_secondary_boost; SPEC is low:high:levels, "
+            "a,b,c or a single value (--design lhs samples within low:high)."
+        ),
+    )
+    parser.add_argument("--design", choices=["grid", "lhs"], default="grid")
+    parser.add_argument(
+        "--points",
+        type=int,
+        default=100,
+        help="Latin hypercube points (--design lhs).",
+    )
+    parser.add_argument("--games", type=int, default=50000)
+    parser.add_argument("--sets", type=int, default=30000)
+    parser.add_argument("--matches", type=int, default=20000)
+    parser.add_argument("--best-of-sets", type=int, default=3, choices=[3, 5])
+    parser.add_argument("--p1-point-win-probability", type=float, default=0.55)
+    parser.add_argument("--streak-decay", type=float, default=0.9)
+    parser.add_argument("--streak-momentum-step", type=float, default=0.25)
+    parser.add_argument(
+        "--method",
+        choices=["monte-carlo", "exact", "solver"],
+        default="monte-carlo",
+        help="As in run_probability_sweep.py; 'exact' requires no streak/clutch parameters.",
+    )
+    parser.add_argument("--engine", choices=["scalar", "batch"], default="scalar")
+    parser.add_argument(
+        "--single-pass",
+        action="store_true",
+        help="Derive the game and set columns from the --matches run (scalar Monte Carlo).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run configs on this many worker processes.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("data") / "grid_sweep",
+        help="Directory for one <column>.npy per column and columns.txt.",
+    )
+    parser.add_argument(
+        "--csv",
+        type=Path,
+        default=None,
+        help="Also write every point as a CSV row once the grid is done.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help=(
+            "Checkpoint file for finished configs (default: <output>.checkpoint.jsonl), "
+            "deleted once the grid is written."
+        ),
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignore any existing checkpoint and recompute every config.",
+    )
+    parser.add_argument("--cache", type=Path, default=None)
+    parser.add_argument("--cache-max-mb", type=float, default=64.0)
+    parser.add_argument("--seed", type=int, default=12345)
+    args = parser.parse_args()
+
+    try:
+        parameters = [parse_parameter(text) for text in args.param]
+    except ValueError as error:
+        parser.error(str(error))
+    names = [parameter.name for parameter in parameters]
+    if len(set(names)) != len(names):
+        parser.error("Each parameter can only be given once.")
+    if args.single_pass and (args.method != "monte-carlo" or args.engine != "scalar"):
+        parser.error("--single-pass requires the scalar Monte Carlo engine.")
+
+    if args.design == "grid":
+        points = grid_points(parameters)
+    else:
+        points = latin_hypercube_points(parameters, args.points, args.seed)
+    template = MatchConfig(
+        best_of_sets=args.best_of_sets,
+        p1_point_win_probability=args.p1_point_win_probability,
+        streak=StreakConfig(decay=args.streak_decay, momentum_step=args.streak_momentum_step),
+        clutch=ClutchConfig(),
+    )
+    configs = {grid_config(template, point) for point in points}
+    if args.method == "exact" and any(
+        config.streak.enabled or config.clutch.enabled for config in configs
+    ):
+        parser.error("--method exact requires streak and clutch to be disabled.")
+
+    checkpoint = args.checkpoint or args.output.with_name(
+        args.output.name + ".checkpoint.jsonl"
+    )
+    if args.fresh and checkpoint.exists():
+        checkpoint.unlink()
+    cache = None
+    if args.cache is not None:
+        cache = ResultCache(args.cache, max_bytes=int(args.cache_max_mb * 1024 * 1024))
+
+    columns = run_grid(
+        points,
+        template=template,
+        output=args.output,
+        games=args.games,
+        sets=args.sets,
+        matches=args.matches,
+        seed=args.seed,
+        method=args.method,
+        engine=args.engine,
+        single_pass=args.single_pass,
+        workers=args.jobs,
+        checkpoint=checkpoint,
+        cache=cache,
+    )
+    if args.csv is not None:
+        args.csv.parent.mkdir(parents=True, exist_ok=True)
+        with args.csv.open("w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(list(columns))
+            for i in range(len(points)):
+                writer.writerow([f"{column[i]:.6g}" for column in columns.values()])
+    # The columns hold every result now; a leftover checkpoint would only go stale.
+    checkpoint.unlink(missing_ok=True)
+    print(f"Wrote {len(points)} points ({len(configs)} distinct configs) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import csv
+from pathlib import Path
+
+from tennis_simulation import ClutchConfig, MatchConfig, StreakConfig
+from tennis_simulation.pool import players_from_ratings, pool_matrix
+from tennis_simulation.tournament import Player
+
+
+def read_pool(path: Path) -> list[Player]:
+    """Players from a CSV with a ``name`` column and either ``rating`` (point log-odds
+    against an average player) or ``point_win_probability``."""
+    with path.open(newline="", encoding="utf-8") as csv_file:
+        rows = list(csv.DictReader(csv_file))
+    if rows and "rating" in rows[0]:
+        return players_from_ratings(
+            [row["name"] for row in rows], [float(row["rating"]) for row in rows]
+        )
+    return [Player(row["name"], float(row["point_win_probability"])) for row in rows]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Write every pairwise match win probability of a player pool to a "
+            "memory-mappable .npy matrix."
+        )
+    )
+    parser.add_argument("--players", type=Path, required=True)
+    parser.add_argument("--grid-points", type=int, default=4001)
+    parser.add_argument("--best-of-sets", type=int, default=3, choices=[3, 5])
+    parser.add_argument("--enable-streak", action="store_true")
+    parser.add_argument("--streak-intensity", type=float, default=0.0)
+    parser.add_argument("--streak-decay", type=float, default=0.9)
+    parser.add_argument("--streak-momentum-step", type=float, default=0.25)
+    parser.add_argument("--enable-clutch", action="store_true")
+    parser.add_argument("--clutch-primary-boost", type=float, default=0.0)
+    parser.add_argument("--clutch-secondary-boost", type=float, default=0.0)
+    parser.add_argument(
+        "--matches",
+        type=int,
+        default=20000,
+        help="Monte Carlo matches per grid point when streak is enabled.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("data") / "head_to_head.npy",
+    )
+    parser.add_argument("--seed", type=int, default=12345)
+    args = parser.parse_args()
+
+    streak = StreakConfig(
+        enabled=args.enable_streak,
+        intensity=args.streak_intensity,
+        decay=args.streak_decay,
+        momentum_step=args.streak_momentum_step,
+    )
+    clutch = ClutchConfig(
+        enabled=args.enable_clutch,
+        primary_boost=args.clutch_primary_boost,
+        secondary_boost=args.clutch_secondary_boost,
+    )
+    template = MatchConfig(best_of_sets=args.best_of_sets, streak=streak, clutch=clutch)
+    players = read_pool(args.players)
+    pool_matrix(
+        players,
+        template=template,
+        grid_points=args.grid_points,
+        samples=args.matches,
+        seed=args.seed,
+        path=args.output,
+    )
+    names = args.output.with_suffix(".names.txt")
+    names.write_text("".join(f"{player.name}\n" for player in players), encoding="utf-8")
+    print(f"Saved {len(players)}x{len(players)} matrix to {args.output} (rows in {names})")
+
+
+if __name__ == "__main__":
+    main()
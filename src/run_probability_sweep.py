@@ -1,15 +1,36 @@
 import argparse
 import csv
+import sys
+from contextlib import nullcontext
 from pathlib import Path
 
-from simulation import (
-    ClutchConfig,
-    MatchConfig,
-    StreakConfig,
-    estimate_game_win_rate,
-    estimate_match_profile,
-    estimate_set_win_rate,
+from simulation import ClutchConfig, MatchConfig, StreakConfig
+from tennis_simulation.cache import ResultCache
+from tennis_simulation.distributions import summary_columns
+from tennis_simulation.instrumentation import (
+    Instrumentation,
+    ProgressReporter,
+    instrumented,
 )
+from tennis_simulation.pressure import pressure_columns
+from tennis_simulation.reweighting import reweighted_sweep_values
+from tennis_simulation.sweep import (
+    ALL_METRIC,
+    GAME_METRIC,
+    MATCH_METRIC,
+    SET_METRIC,
+    load_checkpoint,
+    probability_sweep_jobs,
+    run_jobs,
+)
+
+# Rough points per sample of each metric (best of 3), to weight jobs for the ETA.
+NOMINAL_POINTS = {
+    GAME_METRIC: 6.5,
+    SET_METRIC: 60.0,
+    MATCH_METRIC: 160.0,
+    ALL_METRIC: 160.0,
+}
 
 
 def frange(start: float, stop: float, step: float) -> list[float]:
@@ -47,13 +68,373 @@ def main() -> None:
         default=Path("data") / "probability_sweep.csv",
     )
     parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Split match simulations across this many processes (scalar engine).",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["scalar", "batch"],
+        default="scalar",
+        help="'batch' runs all samples in lockstep with NumPy (requires numpy).",
+    )
+    parser.add_argument(
+        "--method",
+        choices=["monte-carlo", "exact", "solver"],
+        default="monte-carlo",
+        help=(
+            "'exact' solves the independent-points model analytically (no streak/clutch); "
+            "'solver' runs backward induction over every score, or with streak enabled "
+            "propagates (score, momentum) probability mass (requires numpy)."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run (probability, metric) jobs on this many worker processes.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help=(
+            "Checkpoint file for finished jobs (default: <output>.checkpoint.jsonl), "
+            "deleted once the CSV is written."
+        ),
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignore any existing checkpoint and recompute every row.",
+    )
+    parser.add_argument(
+        "--target-ci",
+        type=float,
+        default=None,
+        help=(
+            "Stop each estimate once its 95%% Wilson half-width is at most this value; "
+            "--games/--sets/--matches become sample budgets."
+        ),
+    )
+    parser.add_argument(
+        "--common-random-numbers",
+        action="store_true",
+        help=(
+            "Drive every probability with the same seeds so neighbouring rows share their "
+            "noise (smoother curve and differences)."
+        ),
+    )
+    parser.add_argument(
+        "--antithetic",
+        action="store_true",
+        help="Pair each sample with a mirror that flips every uniform draw U to 1 - U.",
+    )
+    parser.add_argument(
+        "--single-pass",
+        action="store_true",
+        help=(
+            "Derive the game and set columns from the games and sets played inside the "
+            "--matches run instead of separate --games/--sets simulations."
+        ),
+    )
+    parser.add_argument(
+        "--distributions",
+        action="store_true",
+        help=(
+            "Add the mean and 5/25/50/75/95th percentiles of points and games per match "
+            "and games per set, plus tiebreak frequency, from the --matches run."
+        ),
+    )
+    parser.add_argument(
+        "--pressure-stats",
+        action="store_true",
+        help=(
+            "Add P1's points played and won per match on serve and on return, overall and "
+            "at break, set and match points, in tiebreaks and in clutch situations, from "
+            "the --matches run."
+        ),
+    )
+    parser.add_argument(
+        "--importance-sampling",
+        action="store_true",
+        help=(
+            "Estimate win rates from points played at a fair coin, reweighted by each "
+            "sample's likelihood ratio: accurate for rare underdog wins. Adds standard "
+            "error columns; break point columns still come from the --matches run."
+        ),
+    )
+    parser.add_argument(
+        "--reweight-anchors",
+        type=str,
+        default=None,
+        help=(
+            "Comma-separated point probabilities (e.g. 0.35,0.5,0.65) to simulate; every "
+            "row is reweighted from the anchor runs by likelihood ratio instead of being "
+            "simulated. Adds effective sample size columns (independent points only)."
+        ),
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help=(
+            "SQLite result cache shared across runs: scalar Monte Carlo estimates already "
+            "computed for the same config, seed and sample count are reused."
+        ),
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=64.0,
+        help="Evict least recently used cache entries beyond this size.",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help=(
+            "Print points/s and an ETA to stderr every --progress-interval seconds, and "
+            "a per-phase time breakdown at the end."
+        ),
+    )
+    parser.add_argument("--progress-interval", type=float, default=10.0)
+    parser.add_argument(
+        "--metrics",
+        type=Path,
+        default=None,
+        help="Write counters and phase times as JSON to this file after every job.",
+    )
+    parser.add_argument(
+        "--time-points",
+        action="store_true",
+        help=(
+            "Also time every policy call and RNG draw (--progress/--metrics); this adds "
+            "overhead per point."
+        ),
+    )
     args = parser.parse_args()
 
+    if args.method == "exact" and (args.enable_streak or args.enable_clutch):
+        parser.error("--method exact requires streak and clutch to be disabled.")
+    if args.workers is not None and (args.method != "monte-carlo" or args.engine != "scalar"):
+        parser.error("--workers requires the scalar Monte Carlo engine.")
+    if args.target_ci is not None and (
+        args.method != "monte-carlo" or args.engine != "scalar" or args.workers is not None
+    ):
+        parser.error("--target-ci requires the scalar Monte Carlo engine without --workers.")
+    if args.antithetic and (
+        args.method != "monte-carlo" or args.engine != "scalar" or args.target_ci is not None
+    ):
+        parser.error("--antithetic requires the scalar Monte Carlo engine without --target-ci.")
+    if args.single_pass and (
+        args.method != "monte-carlo" or args.engine != "scalar" or args.target_ci is not None
+    ):
+        parser.error("--single-pass requires the scalar Monte Carlo engine without --target-ci.")
+    if args.distributions and (
+        args.method != "monte-carlo" or args.engine != "scalar" or args.target_ci is not None
+    ):
+        parser.error(
+            "--distributions requires the scalar Monte Carlo engine without --target-ci."
+        )
+    if args.pressure_stats and (
+        args.method != "monte-carlo" or args.engine != "scalar" or args.target_ci is not None
+    ):
+        parser.error(
+            "--pressure-stats requires the scalar Monte Carlo engine without --target-ci."
+        )
+    if args.importance_sampling and (
+        args.method != "monte-carlo"
+        or args.engine != "scalar"
+        or args.workers is not None
+        or args.target_ci is not None
+        or args.antithetic
+        or args.single_pass
+    ):
+        parser.error(
+            "--importance-sampling requires the scalar Monte Carlo engine without "
+            "--workers, --target-ci, --antithetic or --single-pass."
+        )
+    if args.reweight_anchors is not None and (
+        args.method != "monte-carlo"
+        or args.engine != "scalar"
+        or args.enable_streak
+        or args.enable_clutch
+        or args.workers is not None
+        or args.target_ci is not None
+        or args.antithetic
+        or args.single_pass
+        or args.distributions
+        or args.pressure_stats
+        or args.importance_sampling
+        or args.common_random_numbers
+        or args.jobs != 1
+        or args.cache is not None
+    ):
+        parser.error(
+            "--reweight-anchors requires the scalar Monte Carlo engine with streak and "
+            "clutch disabled, and none of --workers, --target-ci, --antithetic, "
+            "--single-pass, --distributions, --pressure-stats, --importance-sampling, "
+            "--common-random-numbers, --jobs or --cache."
+        )
+    anchors = None
+    if args.reweight_anchors is not None:
+        try:
+            anchors = [float(value) for value in args.reweight_anchors.split(",")]
+        except ValueError:
+            anchors = []
+        if not anchors or not all(0.0 < anchor < 1.0 for anchor in anchors):
+            parser.error(
+                "--reweight-anchors takes comma-separated probabilities strictly between "
+                "0 and 1."
+            )
+
     probabilities = frange(args.start, args.stop, args.step)
     args.output.parent.mkdir(parents=True, exist_ok=True)
+    checkpoint = args.checkpoint or args.output.with_name(
+        args.output.name + ".checkpoint.jsonl"
+    )
+    if args.fresh and checkpoint.exists():
+        checkpoint.unlink()
+
+    streak = StreakConfig(
+        enabled=args.enable_streak,
+        intensity=args.streak_intensity,
+        decay=args.streak_decay,
+        momentum_step=args.streak_momentum_step,
+    )
+    clutch = ClutchConfig(
+        enabled=args.enable_clutch,
+        primary_boost=args.clutch_primary_boost,
+        secondary_boost=args.clutch_secondary_boost,
+    )
+    template = MatchConfig(best_of_sets=args.best_of_sets, streak=streak, clutch=clutch)
+    jobs = probability_sweep_jobs(
+        probabilities=probabilities,
+        template=template,
+        games=args.games,
+        sets=args.sets,
+        matches=args.matches,
+        seed=args.seed,
+        method=args.method,
+        engine=args.engine,
+        match_workers=args.workers,
+        target_ci=args.target_ci,
+        common_random_numbers=args.common_random_numbers,
+        antithetic=args.antithetic,
+        single_pass=args.single_pass,
+        distributions=args.distributions,
+        pressure=args.pressure_stats,
+        importance_sampling=args.importance_sampling,
+    )
+
+    cache = None
+    if args.cache is not None:
+        cache = ResultCache(args.cache, max_bytes=int(args.cache_max_mb * 1024 * 1024))
+    instrumentation = None
+    reporter = None
+    on_result = None
+    on_anchor = None
+    if args.progress or args.metrics is not None or args.time_points:
+        instrumentation = Instrumentation(time_points=args.time_points)
+        done = load_checkpoint(checkpoint)
+
+        def work(job) -> float:
+            return job.samples * NOMINAL_POINTS[job.metric]
+
+        # Each anchor plays the games, sets and matches a sweep row would.
+        anchor_work = (
+            args.games * NOMINAL_POINTS[GAME_METRIC]
+            + args.sets * NOMINAL_POINTS[SET_METRIC]
+            + args.matches * NOMINAL_POINTS[MATCH_METRIC]
+        )
+        if anchors is not None:
+            total_work = len(anchors) * anchor_work
+        else:
+            total_work = sum(work(job) for job in jobs if job.key() not in done)
+        if args.progress:
+            reporter = ProgressReporter(
+                instrumentation, total_work, sys.stderr, args.progress_interval
+            )
+            reporter.start()
+
+        def on_result(job, values) -> None:
+            if reporter is not None:
+                reporter.advance(work(job))
+            if args.metrics is not None:
+                instrumentation.write_json(args.metrics)
+
+        def on_anchor(anchor) -> None:
+            if reporter is not None:
+                reporter.advance(anchor_work)
+            if args.metrics is not None:
+                instrumentation.write_json(args.metrics)
+
+    values_by_row: dict[int, list[float]] = {}
+    precision_by_row: dict[int, list[str]] = {}
+    try:
+        if anchors is not None:
+            # Rows are reweighted from the anchor runs, so there are no per-row jobs to
+            # checkpoint or cache.
+            with instrumented(instrumentation):
+                rows = reweighted_sweep_values(
+                    probabilities,
+                    template=template,
+                    anchors=anchors,
+                    games=args.games,
+                    sets=args.sets,
+                    matches=args.matches,
+                    seed=args.seed,
+                    on_anchor=on_anchor,
+                )
+            for i, (values, effective_sample_sizes) in enumerate(rows):
+                values_by_row[i] = values
+                precision_by_row[i] = [f"{size:.1f}" for size in effective_sample_sizes]
+        else:
+            results = run_jobs(
+                jobs,
+                workers=args.jobs,
+                checkpoint=checkpoint,
+                cache=cache,
+                instrumentation=instrumentation,
+                on_result=on_result,
+            )
+    finally:
+        if reporter is not None:
+            reporter.stop()
+    if args.reweight_anchors is None:
+        for job in jobs:
+            values = results[job]
+            if args.target_ci is not None:
+                *values, ci_low, ci_high, samples = values
+                precision_by_row.setdefault(job.row, []).extend(
+                    [f"{ci_low:.6f}", f"{ci_high:.6f}", str(int(samples))]
+                )
+            if args.importance_sampling:
+                *values, standard_error = values
+                precision_by_row.setdefault(job.row, []).append(f"{standard_error:.6g}")
+            values_by_row.setdefault(job.row, []).extend(values)
 
-    with args.output.open("w", newline="", encoding="utf-8") as csv_file:
+    csv_phase = instrumentation.phase("csv") if instrumentation is not None else nullcontext()
+    with csv_phase, args.output.open("w", newline="", encoding="utf-8") as csv_file:
         writer = csv.writer(csv_file)
+        precision_columns = []
+        if args.target_ci is not None:
+            for metric in ("game", "set", "match"):
+                precision_columns += [
+                    f"{metric}_win_rate_ci_low",
+                    f"{metric}_win_rate_ci_high",
+                    f"{metric}_samples",
+                ]
+        if args.importance_sampling:
+            precision_columns += [
+                f"{metric}_win_rate_standard_error" for metric in ("game", "set", "match")
+            ]
+        if args.reweight_anchors is not None:
+            precision_columns += [
+                f"{metric}_effective_sample_size" for metric in ("game", "set", "match")
+            ]
         writer.writerow(
             [
                 "point_win_probability",
@@ -67,59 +448,32 @@ def main() -> None:
                 "p1_break_point_conversion_rate",
                 "p1_break_point_save_rate",
             ]
+            + (summary_columns() if args.distributions else [])
+            + (pressure_columns() if args.pressure_stats else [])
+            + precision_columns
+        )
+        # Fixed decimals would print importance-sampled or reweighted tail probabilities
+        # as 0.000000.
+        value_format = (
+            ".6g"
+            if args.importance_sampling or args.reweight_anchors is not None
+            else ".6f"
         )
-
         for i, probability in enumerate(probabilities):
-            streak = StreakConfig(
-                enabled=args.enable_streak,
-                intensity=args.streak_intensity,
-                decay=args.streak_decay,
-                momentum_step=args.streak_momentum_step,
-            )
-            clutch = ClutchConfig(
-                enabled=args.enable_clutch,
-                primary_boost=args.clutch_primary_boost,
-                secondary_boost=args.clutch_secondary_boost,
-            )
-            config = MatchConfig(
-                best_of_sets=args.best_of_sets,
-                p1_point_win_probability=probability,
-                streak=streak,
-                clutch=clutch,
-            )
-            base_seed = args.seed + i * 1000
-            game_win_rate = estimate_game_win_rate(
-                p1_point_win_probability=probability,
-                n_games=args.games,
-                seed=base_seed,
-                config=config,
-            )
-            set_win_rate = estimate_set_win_rate(
-                config=config,
-                n_sets=args.sets,
-                seed=base_seed + 1,
-            )
-            match_win_rate, break_point_metrics = estimate_match_profile(
-                config=config,
-                n_matches=args.matches,
-                seed=base_seed + 2,
-            )
-
             writer.writerow(
-                [
-                    f"{probability:.4f}",
-                    f"{game_win_rate:.6f}",
-                    f"{set_win_rate:.6f}",
-                    f"{match_win_rate:.6f}",
-                    f"{break_point_metrics.p1_break_points_earned_per_match:.6f}",
-                    f"{break_point_metrics.p1_break_points_converted_per_match:.6f}",
-                    f"{break_point_metrics.p1_break_points_faced_per_match:.6f}",
-                    f"{break_point_metrics.p1_break_points_saved_per_match:.6f}",
-                    f"{break_point_metrics.p1_break_point_conversion_rate:.6f}",
-                    f"{break_point_metrics.p1_break_point_save_rate:.6f}",
-                ]
+                [f"{probability:.4f}"]
+                + [format(value, value_format) for value in values_by_row[i]]
+                + precision_by_row.get(i, [])
             )
+    # The CSV holds every result now; a leftover checkpoint would only go stale.
+    checkpoint.unlink(missing_ok=True)
 
+    if instrumentation is not None:
+        if args.metrics is not None:
+            instrumentation.write_json(args.metrics)
+        if reporter is not None:
+            reporter.report()
+            print(instrumentation.breakdown(), file=sys.stderr)
     print(f"Wrote {len(probabilities)} rows to {args.output}")
 
 
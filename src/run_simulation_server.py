@@ -0,0 +1,60 @@
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+from tennis_simulation.cache import ResultCache
+from tennis_simulation.server import SimulationServer, serve_stdio, serve_unix_socket
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Serve JSON-lines match win rate requests from a warm process pool, over a "
+            "Unix socket or stdin/stdout."
+        )
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help="Listen on this Unix socket (default: read stdin, answer on stdout).",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=2000,
+        help="Matches per worker task; partial results are sent as chunks finish.",
+    )
+    parser.add_argument("--max-chunks-in-flight", type=int, default=None)
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help="SQLite result cache (see tennis_simulation.cache) for seeded requests.",
+    )
+    args = parser.parse_args()
+
+    cache = ResultCache(args.cache) if args.cache is not None else None
+    server = SimulationServer(
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        max_chunks_in_flight=args.max_chunks_in_flight,
+        cache=cache,
+    )
+    try:
+        if args.socket is not None:
+            if args.socket.exists():
+                args.socket.unlink()
+            print(f"Listening on {args.socket}", file=sys.stderr)
+            asyncio.run(serve_unix_socket(server, str(args.socket)))
+        else:
+            asyncio.run(serve_stdio(server, sys.stdin.buffer, sys.stdout.buffer))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
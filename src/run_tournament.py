@@ -0,0 +1,96 @@
+import argparse
+import csv
+from pathlib import Path
+
+from tennis_simulation import ClutchConfig, MatchConfig, StreakConfig
+from tennis_simulation.tournament import Player, simulate_tournament
+
+
+def read_draw(path: Path) -> list[Player | None]:
+    """Bracket order from a CSV with ``name`` and ``point_win_probability`` columns.
+
+    Rows named ``BYE`` (or with an empty name) are byes.
+    """
+    draw: list[Player | None] = []
+    with path.open(newline="", encoding="utf-8") as csv_file:
+        for row in csv.DictReader(csv_file):
+            name = (row.get("name") or "").strip()
+            if not name or name.upper() == "BYE":
+                draw.append(None)
+            else:
+                draw.append(Player(name, float(row["point_win_probability"])))
+    return draw
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Replay a single-elimination draw from memoized head-to-head match win "
+            "probabilities and write each player's round-reach probabilities."
+        )
+    )
+    parser.add_argument("--draw", type=Path, required=True)
+    parser.add_argument("--replays", type=int, default=20000)
+    parser.add_argument("--best-of-sets", type=int, default=3, choices=[3, 5])
+    parser.add_argument("--enable-streak", action="store_true")
+    parser.add_argument("--streak-intensity", type=float, default=0.0)
+    parser.add_argument("--streak-decay", type=float, default=0.9)
+    parser.add_argument("--streak-momentum-step", type=float, default=0.25)
+    parser.add_argument("--enable-clutch", action="store_true")
+    parser.add_argument("--clutch-primary-boost", type=float, default=0.0)
+    parser.add_argument("--clutch-secondary-boost", type=float, default=0.0)
+    parser.add_argument(
+        "--matches",
+        type=int,
+        default=20000,
+        help="Monte Carlo matches per evaluated point probability when streak is enabled.",
+    )
+    parser.add_argument(
+        "--grid-points",
+        type=int,
+        default=401,
+        help=(
+            "Interpolate pairings from a match win curve with this many points once the "
+            "draw has more distinct pairings than that."
+        ),
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("data") / "tournament.csv",
+    )
+    parser.add_argument("--seed", type=int, default=12345)
+    args = parser.parse_args()
+
+    streak = StreakConfig(
+        enabled=args.enable_streak,
+        intensity=args.streak_intensity,
+        decay=args.streak_decay,
+        momentum_step=args.streak_momentum_step,
+    )
+    clutch = ClutchConfig(
+        enabled=args.enable_clutch,
+        primary_boost=args.clutch_primary_boost,
+        secondary_boost=args.clutch_secondary_boost,
+    )
+    template = MatchConfig(best_of_sets=args.best_of_sets, streak=streak, clutch=clutch)
+    result = simulate_tournament(
+        read_draw(args.draw),
+        n_replays=args.replays,
+        template=template,
+        seed=args.seed,
+        samples=args.matches,
+        grid_points=args.grid_points,
+    )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with args.output.open("w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["name", *result.round_names])
+        for name, *probabilities in result.rows():
+            writer.writerow([name, *(f"{value:.6f}" for value in probabilities)])
+    print(f"Saved {len(result.players)} players x {result.replays} replays to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,15 @@
 from .config import ClutchConfig, MatchConfig, StreakConfig
+from .distributions import Histogram, MatchDistributions
 from .engine import (
     BreakPointMetrics,
     BreakPointStats,
     MatchResult,
+    OutcomeStats,
     estimate_break_point_metrics,
     estimate_game_win_rate,
+    estimate_match_distributions,
     estimate_match_profile,
+    estimate_match_statistics,
     estimate_match_win_rate,
     estimate_set_win_rate,
     run_monte_carlo,
@@ -13,17 +17,24 @@ from .engine import (
     simulate_match,
     simulate_set,
 )
+from .pressure import PressureStats
 
 __all__ = [
     "ClutchConfig",
     "BreakPointMetrics",
     "BreakPointStats",
+    "Histogram",
     "MatchConfig",
+    "MatchDistributions",
     "MatchResult",
+    "OutcomeStats",
+    "PressureStats",
     "StreakConfig",
     "estimate_break_point_metrics",
     "estimate_game_win_rate",
+    "estimate_match_distributions",
     "estimate_match_profile",
+    "estimate_match_statistics",
     "estimate_match_win_rate",
     "estimate_set_win_rate",
     "run_monte_carlo",
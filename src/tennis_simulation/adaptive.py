@@ -0,0 +1,201 @@
+import math
+import random
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from .config import MatchConfig
+from .engine import (
+    BreakPointMetrics,
+    BreakPointStats,
+    _break_point_metrics,
+    _simulate_standard_game,
+    _validate_match_config,
+    simulate_match,
+    simulate_set,
+)
+from .events import get_context_table
+from .policies import build_policy
+
+Z_95 = 1.959963984540054
+
+
+def wilson_interval(successes: int, trials: int, z: float = Z_95) -> tuple[float, float]:
+    if trials <= 0:
+        return 0.0, 1.0
+    p_hat = successes / trials
+    z2 = z * z
+    denominator = 1.0 + z2 / trials
+    center = (p_hat + z2 / (2.0 * trials)) / denominator
+    spread = z * math.sqrt(p_hat * (1.0 - p_hat) / trials + z2 / (4.0 * trials * trials))
+    spread /= denominator
+    return max(0.0, center - spread), min(1.0, center + spread)
+
+
+@dataclass(frozen=True)
+class RunningEstimate:
+    successes: int = 0
+    trials: int = 0
+    z: float = Z_95
+
+    @property
+    def estimate(self) -> float:
+        return self.successes / self.trials if self.trials else 0.0
+
+    @property
+    def standard_error(self) -> float:
+        if self.trials == 0:
+            return math.inf
+        p_hat = self.estimate
+        return math.sqrt(p_hat * (1.0 - p_hat) / self.trials)
+
+    @property
+    def interval(self) -> tuple[float, float]:
+        return wilson_interval(self.successes, self.trials, self.z)
+
+    @property
+    def half_width(self) -> float:
+        low, high = self.interval
+        return (high - low) / 2.0
+
+
+def iter_game_outcomes(config: MatchConfig, seed: int | None = None) -> Iterator[bool]:
+    """Endless P1-wins-game outcomes, in the same order as estimate_game_win_rate draws them."""
+    _validate_match_config(config)
+    rng = random.Random(seed)
+    table = get_context_table(config)
+    while True:
+        policy = build_policy(config)
+        policy.reset_match()
+        yield (
+            _simulate_standard_game(
+                policy=policy,
+                config=config,
+                rng=rng,
+                p1_sets=0,
+                p2_sets=0,
+                p1_games=0,
+                p2_games=0,
+                p1_serving=True,
+                context_table=table,
+            )
+            == 1
+        )
+
+
+def iter_set_outcomes(config: MatchConfig, seed: int | None = None) -> Iterator[bool]:
+    """Endless P1-wins-set outcomes, in the same order as estimate_set_win_rate draws them."""
+    _validate_match_config(config)
+    rng = random.Random(seed)
+    table = get_context_table(config)
+    while True:
+        policy = build_policy(config)
+        policy.reset_match()
+        p1_serving = rng.random() < 0.5
+        set_winner, _, _, _ = simulate_set(
+            config=config,
+            rng=rng,
+            policy=policy,
+            p1_serving_first_game=p1_serving,
+            context_table=table,
+        )
+        yield set_winner == 1
+
+
+def iter_match_outcomes(
+    config: MatchConfig,
+    seed: int | None = None,
+    break_point_stats: BreakPointStats | None = None,
+) -> Iterator[bool]:
+    """Endless P1-wins-match outcomes, in the same order as run_monte_carlo draws them."""
+    _validate_match_config(config)
+    rng = random.Random(seed)
+    while True:
+        match_seed = rng.randint(0, 10**9)
+        result = simulate_match(
+            config=config, seed=match_seed, break_point_stats=break_point_stats
+        )
+        yield result.winner == "Player 1"
+
+
+def running_estimates(
+    outcomes: Iterable[bool], report_every: int = 1000, z: float = Z_95
+) -> Iterator[RunningEstimate]:
+    """Anytime view of ``outcomes``: a fresh estimate every ``report_every`` samples."""
+    if report_every <= 0:
+        raise ValueError("report_every must be greater than 0.")
+    successes = 0
+    trials = 0
+    for outcome in outcomes:
+        trials += 1
+        if outcome:
+            successes += 1
+        if trials % report_every == 0:
+            yield RunningEstimate(successes=successes, trials=trials, z=z)
+
+
+def estimate_to_precision(
+    outcomes: Iterable[bool],
+    target_half_width: float,
+    max_samples: int,
+    min_samples: int = 100,
+    check_every: int = 500,
+    z: float = Z_95,
+) -> RunningEstimate:
+    """Consume ``outcomes`` until the Wilson half-width is at most ``target_half_width``.
+
+    Stops at ``max_samples`` regardless; check ``half_width`` on the result to see whether
+    the target was met.
+    """
+    if target_half_width <= 0.0:
+        raise ValueError("target_half_width must be greater than 0.")
+    if max_samples <= 0:
+        raise ValueError("max_samples must be greater than 0.")
+
+    successes = 0
+    trials = 0
+    for outcome in outcomes:
+        trials += 1
+        if outcome:
+            successes += 1
+        if trials >= max_samples:
+            break
+        if trials >= min_samples and trials % check_every == 0:
+            low, high = wilson_interval(successes, trials, z)
+            if (high - low) / 2.0 <= target_half_width:
+                break
+    return RunningEstimate(successes=successes, trials=trials, z=z)
+
+
+def adaptive_game_win_rate(
+    config: MatchConfig,
+    target_half_width: float,
+    max_games: int,
+    seed: int | None = None,
+) -> RunningEstimate:
+    return estimate_to_precision(
+        iter_game_outcomes(config, seed), target_half_width, max_games
+    )
+
+
+def adaptive_set_win_rate(
+    config: MatchConfig,
+    target_half_width: float,
+    max_sets: int,
+    seed: int | None = None,
+) -> RunningEstimate:
+    return estimate_to_precision(iter_set_outcomes(config, seed), target_half_width, max_sets)
+
+
+def adaptive_match_profile(
+    config: MatchConfig,
+    target_half_width: float,
+    max_matches: int,
+    seed: int | None = None,
+) -> tuple[RunningEstimate, BreakPointMetrics]:
+    stats = BreakPointStats()
+    estimate = estimate_to_precision(
+        iter_match_outcomes(config, seed, break_point_stats=stats),
+        target_half_width,
+        max_matches,
+    )
+    return estimate, _break_point_metrics(stats, estimate.trials)
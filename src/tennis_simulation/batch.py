@@ -0,0 +1,403 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from .config import MatchConfig
+from .engine import (
+    BreakPointMetrics,
+    BreakPointStats,
+    _break_point_metrics,
+    _validate_match_config,
+)
+from .instrumentation import active_instrumentation
+
+_STOP_AFTER_GAME = "game"
+_STOP_AFTER_SET = "set"
+_STOP_AFTER_MATCH = "match"
+
+
+@dataclass
+class BatchMatchResults:
+    p1_sets: np.ndarray
+    p2_sets: np.ndarray
+    p1_games_current_set: np.ndarray
+    p2_games_current_set: np.ndarray
+    p1_won: np.ndarray
+    break_point_stats: BreakPointStats
+    points_played: int = 0
+
+    @property
+    def p1_wins(self) -> int:
+        return int(np.count_nonzero(self.p1_won))
+
+    @property
+    def p2_wins(self) -> int:
+        return int(self.p1_won.size - np.count_nonzero(self.p1_won))
+
+
+@dataclass
+class _BatchState:
+    ids: np.ndarray
+    p1_sets: np.ndarray
+    p2_sets: np.ndarray
+    p1_games: np.ndarray
+    p2_games: np.ndarray
+    p1_points: np.ndarray
+    p2_points: np.ndarray
+    p1_serving: np.ndarray
+    in_tiebreak: np.ndarray
+    momentum: np.ndarray
+
+    def keep(self, mask: np.ndarray) -> None:
+        for name in self.__dataclass_fields__:
+            setattr(self, name, getattr(self, name)[mask])
+
+
+def _initial_state(n: int, p1_serving: np.ndarray) -> _BatchState:
+    zeros = np.zeros(n, dtype=np.int32)
+    return _BatchState(
+        ids=np.arange(n),
+        p1_sets=zeros.copy(),
+        p2_sets=zeros.copy(),
+        p1_games=zeros.copy(),
+        p2_games=zeros.copy(),
+        p1_points=zeros.copy(),
+        p2_points=zeros.copy(),
+        p1_serving=p1_serving,
+        in_tiebreak=np.zeros(n, dtype=bool),
+        momentum=np.zeros(n, dtype=np.float64),
+    )
+
+
+def _context_flags(
+    config: MatchConfig, state: _BatchState
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized mirror of events.build_point_context.
+
+    Returns (is_break_point, is_primary_clutch, is_secondary_clutch).
+    """
+    sets_needed = config.best_of_sets // 2 + 1
+    p1_points = state.p1_points
+    p2_points = state.p2_points
+    tiebreak = state.in_tiebreak
+
+    points_to_win = np.where(tiebreak, config.tiebreak_points_to_win, 4)
+    win_margin = np.where(tiebreak, config.tiebreak_win_margin, 2)
+    p1_game_point = (p1_points + 1 >= points_to_win) & (
+        p1_points + 1 - p2_points >= win_margin
+    )
+    p2_game_point = (p2_points + 1 >= points_to_win) & (
+        p2_points + 1 - p1_points >= win_margin
+    )
+
+    p1_set_point = (tiebreak & p1_game_point) | (
+        (state.p1_games + 1 >= config.games_to_win_set)
+        & (state.p1_games + 1 - state.p2_games >= config.set_win_margin)
+    )
+    # events._would_win_set returns the game winner's side in a tiebreak, so a P2 tiebreak
+    # game point is never flagged as a set point; mirror that.
+    p2_set_point = ~(tiebreak & p2_game_point) & (
+        (state.p2_games + 1 >= config.games_to_win_set)
+        & (state.p2_games + 1 - state.p1_games >= config.set_win_margin)
+    )
+    is_match_point = (p1_set_point & (state.p1_sets + 1 == sets_needed)) | (
+        p2_set_point & (state.p2_sets + 1 == sets_needed)
+    )
+
+    serving = state.p1_serving
+    is_break_point = ~tiebreak & (
+        (p1_game_point & ~serving) | (p2_game_point & serving)
+    )
+    is_primary_clutch = is_break_point | p1_set_point | p2_set_point | is_match_point
+
+    server_points = np.where(serving, p1_points, p2_points)
+    returner_points = np.where(serving, p2_points, p1_points)
+    is_secondary_clutch = (
+        ((server_points == 0) & (returner_points == 2))
+        | (
+            (server_points >= 2)
+            & (returner_points >= 2)
+            & (server_points == returner_points)
+        )
+    ) & ~is_primary_clutch
+    return is_break_point, is_primary_clutch, is_secondary_clutch
+
+
+def _point_probabilities(
+    config: MatchConfig,
+    state: _BatchState,
+    is_primary_clutch: np.ndarray | None,
+    is_secondary_clutch: np.ndarray | None,
+) -> np.ndarray | float:
+    # Mirrors build_policy: IndependentPolicy -> StreakinessPolicy -> ClutchPolicy,
+    # clamping after each layer.
+    probability: np.ndarray | float = min(1.0, max(0.0, config.p1_point_win_probability))
+    if config.streak.enabled:
+        probability = np.clip(
+            probability + config.streak.intensity * state.momentum, 0.0, 1.0
+        )
+    if config.clutch.enabled:
+        boost = np.where(
+            is_primary_clutch,
+            config.clutch.primary_boost,
+            np.where(is_secondary_clutch, config.clutch.secondary_boost, 0.0),
+        )
+        probability = np.clip(probability + boost, 0.0, 1.0)
+    return probability
+
+
+def _run_batch(
+    config: MatchConfig,
+    n: int,
+    rng: np.random.Generator,
+    p1_serving: np.ndarray,
+    stop_after: str,
+    break_point_stats: BreakPointStats | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]:
+    """Advance ``n`` independent matches one point per step until each reaches ``stop_after``.
+
+    Returns per-match (p1_won, p1_sets, p2_sets, p1_games, p2_games) at the stopping point,
+    plus the total number of points played. With an active Instrumentation the run is timed
+    as the ``batch`` phase and its matches, sets, games, tiebreaks and points are counted.
+    """
+    instrumentation = active_instrumentation()
+    if instrumentation is None:
+        return _advance_batch(config, n, rng, p1_serving, stop_after, break_point_stats)
+    counts = dict.fromkeys(("matches", "sets", "games", "tiebreaks"), 0)
+    with instrumentation.phase("batch"):
+        result = _advance_batch(
+            config, n, rng, p1_serving, stop_after, break_point_stats, counts
+        )
+    for name, amount in counts.items():
+        instrumentation.count(name, amount)
+    instrumentation.count("points", result[-1])
+    return result
+
+
+def _advance_batch(
+    config: MatchConfig,
+    n: int,
+    rng: np.random.Generator,
+    p1_serving: np.ndarray,
+    stop_after: str,
+    break_point_stats: BreakPointStats | None = None,
+    counts: dict[str, int] | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]:
+    sets_needed = config.best_of_sets // 2 + 1
+    needs_flags = config.clutch.enabled or break_point_stats is not None
+
+    out_p1_won = np.zeros(n, dtype=bool)
+    out_p1_sets = np.zeros(n, dtype=np.int32)
+    out_p2_sets = np.zeros(n, dtype=np.int32)
+    out_p1_games = np.zeros(n, dtype=np.int32)
+    out_p2_games = np.zeros(n, dtype=np.int32)
+
+    state = _initial_state(n, p1_serving)
+    state.in_tiebreak[:] = config.tiebreak_at == 0
+    points_played = 0
+
+    while state.ids.size:
+        points_played += state.ids.size
+        if needs_flags:
+            is_break_point, is_primary, is_secondary = _context_flags(config, state)
+        else:
+            is_break_point = is_primary = is_secondary = None
+
+        probability = _point_probabilities(config, state, is_primary, is_secondary)
+        p1_won_point = rng.random(state.ids.size) < probability
+
+        if break_point_stats is not None:
+            faced = is_break_point & state.p1_serving
+            earned = is_break_point & ~state.p1_serving
+            break_point_stats.p1_break_points_faced += int(np.count_nonzero(faced))
+            break_point_stats.p1_break_points_saved += int(
+                np.count_nonzero(faced & p1_won_point)
+            )
+            break_point_stats.p1_break_points_earned += int(np.count_nonzero(earned))
+            break_point_stats.p1_break_points_converted += int(
+                np.count_nonzero(earned & p1_won_point)
+            )
+
+        if config.streak.enabled:
+            direction = np.where(p1_won_point, 1.0, -1.0)
+            state.momentum = np.clip(
+                state.momentum * config.streak.decay
+                + direction * config.streak.momentum_step,
+                -1.0,
+                1.0,
+            )
+
+        state.p1_points += p1_won_point
+        state.p2_points += ~p1_won_point
+
+        tiebreak = state.in_tiebreak
+        points_to_win = np.where(tiebreak, config.tiebreak_points_to_win, 4)
+        win_margin = np.where(tiebreak, config.tiebreak_win_margin, 2)
+        p1_game = (state.p1_points >= points_to_win) & (
+            state.p1_points - state.p2_points >= win_margin
+        )
+        p2_game = (state.p2_points >= points_to_win) & (
+            state.p2_points - state.p1_points >= win_margin
+        )
+        game_over = p1_game | p2_game
+        if not game_over.any():
+            continue
+        if counts is not None:
+            counts["games"] += int(np.count_nonzero(game_over))
+            counts["tiebreaks"] += int(np.count_nonzero(game_over & tiebreak))
+
+        if stop_after == _STOP_AFTER_GAME:
+            finished = game_over
+            winner_is_p1 = p1_game
+        else:
+            state.p1_games += p1_game
+            state.p2_games += p2_game
+            state.p1_points[game_over] = 0
+            state.p2_points[game_over] = 0
+            state.p1_serving ^= game_over
+
+            p1_set = p1_game & (
+                tiebreak
+                | (
+                    (state.p1_games >= config.games_to_win_set)
+                    & (state.p1_games - state.p2_games >= config.set_win_margin)
+                )
+            )
+            p2_set = p2_game & (
+                tiebreak
+                | (
+                    (state.p2_games >= config.games_to_win_set)
+                    & (state.p2_games - state.p1_games >= config.set_win_margin)
+                )
+            )
+            set_over = p1_set | p2_set
+            if counts is not None:
+                counts["sets"] += int(np.count_nonzero(set_over))
+
+            if stop_after == _STOP_AFTER_SET:
+                finished = set_over
+                winner_is_p1 = p1_set
+            else:
+                state.p1_sets += p1_set
+                state.p2_sets += p2_set
+                finished = (state.p1_sets == sets_needed) | (state.p2_sets == sets_needed)
+                winner_is_p1 = state.p1_sets == sets_needed
+                if counts is not None:
+                    counts["matches"] += int(np.count_nonzero(finished))
+
+        if finished.any():
+            done_ids = state.ids[finished]
+            out_p1_won[done_ids] = winner_is_p1[finished]
+            out_p1_sets[done_ids] = state.p1_sets[finished]
+            out_p2_sets[done_ids] = state.p2_sets[finished]
+            out_p1_games[done_ids] = state.p1_games[finished]
+            out_p2_games[done_ids] = state.p2_games[finished]
+
+        if stop_after != _STOP_AFTER_GAME:
+            state.p1_games[set_over] = 0
+            state.p2_games[set_over] = 0
+            state.in_tiebreak = np.where(
+                game_over,
+                (state.p1_games == config.tiebreak_at)
+                & (state.p2_games == config.tiebreak_at),
+                state.in_tiebreak,
+            )
+
+        if finished.any():
+            state.keep(~finished)
+
+    return out_p1_won, out_p1_sets, out_p2_sets, out_p1_games, out_p2_games, points_played
+
+
+def simulate_matches_batch(
+    config: MatchConfig,
+    n_matches: int,
+    seed: int | None = None,
+) -> BatchMatchResults:
+    if n_matches <= 0:
+        raise ValueError("n_matches must be greater than 0.")
+
+    _validate_match_config(config)
+    rng = np.random.default_rng(seed)
+    p1_serving = rng.random(n_matches) < 0.5
+    stats = BreakPointStats()
+    p1_won, p1_sets, p2_sets, p1_games, p2_games, points_played = _run_batch(
+        config=config,
+        n=n_matches,
+        rng=rng,
+        p1_serving=p1_serving,
+        stop_after=_STOP_AFTER_MATCH,
+        break_point_stats=stats,
+    )
+    return BatchMatchResults(
+        p1_sets=p1_sets,
+        p2_sets=p2_sets,
+        p1_games_current_set=p1_games,
+        p2_games_current_set=p2_games,
+        p1_won=p1_won,
+        break_point_stats=stats,
+        points_played=points_played,
+    )
+
+
+def run_monte_carlo_batch(
+    n_matches: int,
+    config: MatchConfig,
+    seed: int | None = None,
+) -> tuple[int, int]:
+    results = simulate_matches_batch(config=config, n_matches=n_matches, seed=seed)
+    return results.p1_wins, results.p2_wins
+
+
+def estimate_game_win_rate_batch(
+    p1_point_win_probability: float,
+    n_games: int,
+    seed: int | None = None,
+    config: MatchConfig | None = None,
+) -> float:
+    if n_games <= 0:
+        raise ValueError("n_games must be greater than 0.")
+    if not 0.0 <= p1_point_win_probability <= 1.0:
+        raise ValueError("p1_point_win_probability must be between 0 and 1.")
+
+    active_config = (
+        config
+        if config is not None
+        else MatchConfig(p1_point_win_probability=p1_point_win_probability)
+    )
+    _validate_match_config(active_config)
+    rng = np.random.default_rng(seed)
+    p1_won, _, _, _, _, _ = _run_batch(
+        config=active_config,
+        n=n_games,
+        rng=rng,
+        p1_serving=np.ones(n_games, dtype=bool),
+        stop_after=_STOP_AFTER_GAME,
+    )
+    return int(np.count_nonzero(p1_won)) / n_games
+
+
+def estimate_set_win_rate_batch(
+    config: MatchConfig, n_sets: int, seed: int | None = None
+) -> float:
+    if n_sets <= 0:
+        raise ValueError("n_sets must be greater than 0.")
+
+    _validate_match_config(config)
+    rng = np.random.default_rng(seed)
+    p1_won, _, _, _, _, _ = _run_batch(
+        config=config,
+        n=n_sets,
+        rng=rng,
+        p1_serving=rng.random(n_sets) < 0.5,
+        stop_after=_STOP_AFTER_SET,
+    )
+    return int(np.count_nonzero(p1_won)) / n_sets
+
+
+def estimate_match_profile_batch(
+    config: MatchConfig, n_matches: int, seed: int | None = None
+) -> tuple[float, BreakPointMetrics]:
+    results = simulate_matches_batch(config=config, n_matches=n_matches, seed=seed)
+    metrics = _break_point_metrics(results.break_point_stats, n_matches)
+    return results.p1_wins / n_matches, metrics
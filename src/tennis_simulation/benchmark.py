@@ -0,0 +1,239 @@
+import platform
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable
+
+from .config import ClutchConfig, MatchConfig, StreakConfig
+from .engine import run_monte_carlo, simulate_match
+from .instrumentation import Instrumentation
+from .policies import ProbabilityPolicy, build_policy
+from .state import PointContext
+from .sweep import probability_sweep_jobs, run_jobs
+
+POLICY_VARIANTS: dict[str, tuple[StreakConfig, ClutchConfig]] = {
+    "independent": (StreakConfig(), ClutchConfig()),
+    "streak": (StreakConfig(enabled=True, intensity=0.03), ClutchConfig()),
+    "clutch": (
+        StreakConfig(),
+        ClutchConfig(enabled=True, primary_boost=0.02, secondary_boost=0.01),
+    ),
+    "streak+clutch": (
+        StreakConfig(enabled=True, intensity=0.03),
+        ClutchConfig(enabled=True, primary_boost=0.02, secondary_boost=0.01),
+    ),
+}
+FORMATS = (3, 5)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    seconds: float
+    counts: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def rates(self) -> dict[str, float]:
+        if self.seconds <= 0.0:
+            return {}
+        return {
+            f"{unit}_per_second": count / self.seconds
+            for unit, count in self.counts.items()
+        }
+
+    def to_dict(self) -> dict:
+        return {"seconds": self.seconds, "counts": self.counts, "rates": self.rates}
+
+
+@dataclass
+class Regression:
+    name: str
+    rate: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1.0
+
+
+class _CountingPolicy(ProbabilityPolicy):
+    def __init__(self, inner: ProbabilityPolicy) -> None:
+        self.inner = inner
+        self.points = 0
+
+    @property
+    def context_fields(self) -> frozenset[str] | None:
+        return self.inner.context_fields
+
+    def reset_match(self) -> None:
+        self.inner.reset_match()
+
+    def point_probability(self, context: PointContext) -> float:
+        return self.inner.point_probability(context)
+
+    def on_point_end(self, context: PointContext, p1_won_point: bool) -> None:
+        self.points += 1
+        self.inner.on_point_end(context, p1_won_point)
+
+
+def _match_seeds(n_matches: int, seed: int) -> list[int]:
+    # Same seed stream as run_monte_carlo.
+    rng = random.Random(seed)
+    return [rng.randint(0, 10**9) for _ in range(n_matches)]
+
+
+def count_points(config: MatchConfig, match_seeds: list[int]) -> int:
+    """Points played by these seeded matches, counted outside any timed run."""
+    policy = _CountingPolicy(build_policy(config))
+    for match_seed in match_seeds:
+        simulate_match(config=config, seed=match_seed, policy=policy)
+    return policy.points
+
+
+def _best_time(run: Callable[[], object], repeats: int) -> float:
+    # One untimed warm-up run fills the per-config context table and policy caches.
+    run()
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _scenario_config(policy_name: str, best_of_sets: int) -> MatchConfig:
+    streak, clutch = POLICY_VARIANTS[policy_name]
+    return MatchConfig(
+        best_of_sets=best_of_sets,
+        p1_point_win_probability=0.55,
+        streak=streak,
+        clutch=clutch,
+    )
+
+
+def bench_simulate_match(
+    config: MatchConfig, n_matches: int, seed: int, repeats: int
+) -> tuple[float, int]:
+    seeds = _match_seeds(n_matches, seed)
+
+    def run() -> None:
+        for match_seed in seeds:
+            simulate_match(config=config, seed=match_seed)
+
+    return _best_time(run, repeats), count_points(config, seeds)
+
+
+def bench_run_monte_carlo(
+    config: MatchConfig, n_matches: int, seed: int, repeats: int
+) -> tuple[float, int]:
+    seconds = _best_time(
+        lambda: run_monte_carlo(n_matches=n_matches, config=config, seed=seed), repeats
+    )
+    return seconds, count_points(config, _match_seeds(n_matches, seed))
+
+
+def bench_batch(
+    config: MatchConfig, n_matches: int, seed: int, repeats: int
+) -> tuple[float, int]:
+    from .batch import simulate_matches_batch
+
+    seconds = _best_time(lambda: simulate_matches_batch(config, n_matches, seed), repeats)
+    return seconds, simulate_matches_batch(config, n_matches, seed).points_played
+
+
+def bench_sweep(
+    config: MatchConfig, n_samples: int, seed: int, repeats: int
+) -> tuple[float, dict[str, int]]:
+    """A three-row sweep through run_jobs with ``config``'s format and policies."""
+    jobs = probability_sweep_jobs(
+        probabilities=[0.45, 0.5, 0.55],
+        template=config,
+        games=n_samples,
+        sets=n_samples,
+        matches=n_samples,
+        seed=seed,
+    )
+    seconds = _best_time(lambda: run_jobs(jobs), repeats)
+    # Counted in a separate untimed run, so the timed runs carry no instrumentation.
+    instrumentation = Instrumentation()
+    run_jobs(jobs, instrumentation=instrumentation)
+    counters = instrumentation.counters
+    return seconds, {"matches": counters["matches"], "points": counters["points"]}
+
+
+def run_suite(
+    n_matches: int = 200,
+    repeats: int = 3,
+    seed: int = 12345,
+    include_batch: bool = True,
+) -> list[BenchmarkResult]:
+    engines: dict[str, Callable[[MatchConfig, int, int, int], tuple[float, int]]] = {
+        "simulate_match": bench_simulate_match,
+        "run_monte_carlo": bench_run_monte_carlo,
+    }
+    if include_batch:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            engines["batch"] = bench_batch
+
+    results = []
+    for engine_name, bench in engines.items():
+        for policy_name in POLICY_VARIANTS:
+            for best_of_sets in FORMATS:
+                config = _scenario_config(policy_name, best_of_sets)
+                seconds, points = bench(config, n_matches, seed, repeats)
+                results.append(
+                    BenchmarkResult(
+                        name=f"{engine_name}/{policy_name}/bo{best_of_sets}",
+                        seconds=seconds,
+                        counts={"matches": n_matches, "points": points},
+                    )
+                )
+    for policy_name in POLICY_VARIANTS:
+        for best_of_sets in FORMATS:
+            config = _scenario_config(policy_name, best_of_sets)
+            seconds, counts = bench_sweep(config, max(1, n_matches // 2), seed, repeats)
+            results.append(
+                BenchmarkResult(
+                    name=f"sweep/{policy_name}/bo{best_of_sets}",
+                    seconds=seconds,
+                    counts=counts,
+                )
+            )
+    return results
+
+
+def results_to_json(results: list[BenchmarkResult], **settings) -> dict:
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "settings": settings,
+        },
+        "results": {result.name: result.to_dict() for result in results},
+    }
+
+
+def compare_results(
+    baseline: dict, current: dict, threshold: float = 0.1
+) -> list[Regression]:
+    """Rates in ``current`` that dropped more than ``threshold`` (fractional) below ``baseline``."""
+    regressions = []
+    for name, current_entry in current["results"].items():
+        baseline_entry = baseline["results"].get(name)
+        if baseline_entry is None:
+            continue
+        for rate, current_value in current_entry["rates"].items():
+            baseline_value = baseline_entry["rates"].get(rate)
+            if not baseline_value:
+                continue
+            regression = Regression(name, rate, baseline_value, current_value)
+            if regression.change < -threshold:
+                regressions.append(regression)
+    return regressions
@@ -0,0 +1,128 @@
+import hashlib
+import json
+import sqlite3
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from .config import MatchConfig
+
+# Part of every key: bump it when an engine change alters the results of a seeded run.
+ENGINE_VERSION = 1
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def result_key(
+    estimator: str, config: MatchConfig, seed: int, samples: int, **options
+) -> str:
+    """Stable hash of everything that determines an estimator's result."""
+    payload = {
+        "estimator": estimator,
+        "config": asdict(config),
+        "seed": seed,
+        "samples": samples,
+        "options": options,
+        "engine_version": ENGINE_VERSION,
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ResultCache:
+    """JSON results in a local SQLite file, keyed by ``result_key``.
+
+    Once the stored keys and values exceed ``max_bytes`` the least recently read or written
+    entries are evicted. The connection opens on first use and is not pickled, so a cache
+    can be handed to worker processes (each opens its own connection to the same file).
+    """
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be greater than 0.")
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30.0)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str):
+        """The stored value, or None on a miss."""
+        connection = self._connect()
+        row = connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        with connection:
+            connection.execute(
+                "UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+        return json.loads(row[0])
+
+    def put(self, key: str, value) -> None:
+        encoded = json.dumps(value)
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (key, encoded, len(key) + len(encoded), time.time()),
+            )
+            self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        oldest = connection.execute(
+            "SELECT key, size FROM results ORDER BY last_used"
+        ).fetchall()
+        for key, size in oldest:
+            if total <= self.max_bytes:
+                break
+            connection.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+
+    def size_bytes(self) -> int:
+        connection = self._connect()
+        return connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def clear(self) -> None:
+        connection = self._connect()
+        with connection:
+            connection.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        return {"path": self.path, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: dict) -> None:
+        self.path = state["path"]
+        self.max_bytes = state["max_bytes"]
+        self._connection = None
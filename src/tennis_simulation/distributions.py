@@ -0,0 +1,132 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Histogram:
+    """Counts of non-negative integers: ``counts[value]`` is how often ``value`` was seen.
+
+    Memory grows with the largest value, not with the number of values recorded.
+    """
+
+    counts: list[int] = field(default_factory=list)
+
+    def record(self, value: int) -> None:
+        counts = self.counts
+        if value >= len(counts):
+            counts.extend([0] * (value + 1 - len(counts)))
+        counts[value] += 1
+
+    def add(self, other: "Histogram") -> None:
+        counts = self.counts
+        if len(other.counts) > len(counts):
+            counts.extend([0] * (len(other.counts) - len(counts)))
+        for value, count in enumerate(other.counts):
+            counts[value] += count
+
+    def total(self) -> int:
+        return sum(self.counts)
+
+    def mean(self) -> float:
+        total = self.total()
+        if total == 0:
+            return 0.0
+        return sum(value * count for value, count in enumerate(self.counts)) / total
+
+    def quantile(self, q: float) -> int:
+        """Smallest value with at least a fraction ``q`` of the counts at or below it."""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be between 0 and 1.")
+        total = self.total()
+        if total == 0:
+            raise ValueError("Histogram is empty.")
+        target = q * total
+        cumulative = 0
+        for value, count in enumerate(self.counts):
+            cumulative += count
+            if count and cumulative >= target:
+                return value
+        return len(self.counts) - 1
+
+
+@dataclass
+class MatchDistributions:
+    """Length and scoreline distributions of simulated matches, merged exactly with ``add``.
+
+    The engine adds each game's points as it ends, each set at its end and each match with
+    ``record_match``; scorelines are (P1, P2) games per set and sets per match.
+    """
+
+    points_per_match: Histogram = field(default_factory=Histogram)
+    games_per_match: Histogram = field(default_factory=Histogram)
+    games_per_set: Histogram = field(default_factory=Histogram)
+    tiebreaks_per_match: Histogram = field(default_factory=Histogram)
+    set_scorelines: dict[tuple[int, int], int] = field(default_factory=dict)
+    match_scorelines: dict[tuple[int, int], int] = field(default_factory=dict)
+    sets_played: int = 0
+    tiebreaks_played: int = 0
+    # Running totals of the match in progress.
+    match_points: int = 0
+    match_games: int = 0
+    match_tiebreaks: int = 0
+
+    def record_set(self, p1_games: int, p2_games: int, tiebreak: bool) -> None:
+        games = p1_games + p2_games
+        self.games_per_set.record(games)
+        scoreline = (p1_games, p2_games)
+        self.set_scorelines[scoreline] = self.set_scorelines.get(scoreline, 0) + 1
+        self.sets_played += 1
+        self.tiebreaks_played += tiebreak
+        self.match_games += games
+        self.match_tiebreaks += tiebreak
+
+    def record_match(self, p1_sets: int, p2_sets: int) -> None:
+        self.points_per_match.record(self.match_points)
+        self.games_per_match.record(self.match_games)
+        self.tiebreaks_per_match.record(self.match_tiebreaks)
+        scoreline = (p1_sets, p2_sets)
+        self.match_scorelines[scoreline] = self.match_scorelines.get(scoreline, 0) + 1
+        self.match_points = 0
+        self.match_games = 0
+        self.match_tiebreaks = 0
+
+    def tiebreak_set_rate(self) -> float:
+        if self.sets_played == 0:
+            return 0.0
+        return self.tiebreaks_played / self.sets_played
+
+    def add(self, other: "MatchDistributions") -> None:
+        self.points_per_match.add(other.points_per_match)
+        self.games_per_match.add(other.games_per_match)
+        self.games_per_set.add(other.games_per_set)
+        self.tiebreaks_per_match.add(other.tiebreaks_per_match)
+        for scoreline, count in other.set_scorelines.items():
+            self.set_scorelines[scoreline] = self.set_scorelines.get(scoreline, 0) + count
+        for scoreline, count in other.match_scorelines.items():
+            self.match_scorelines[scoreline] = self.match_scorelines.get(scoreline, 0) + count
+        self.sets_played += other.sets_played
+        self.tiebreaks_played += other.tiebreaks_played
+
+
+SUMMARY_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+SUMMARY_HISTOGRAMS = ("points_per_match", "games_per_match", "games_per_set")
+
+
+def summary_columns() -> list[str]:
+    columns = []
+    for name in SUMMARY_HISTOGRAMS:
+        columns.append(f"{name}_mean")
+        columns += [f"{name}_p{round(q * 100):02d}" for q in SUMMARY_QUANTILES]
+    return columns + ["tiebreaks_per_match_mean", "tiebreak_set_rate"]
+
+
+def summary_values(distributions: MatchDistributions) -> list[float]:
+    """Mean and SUMMARY_QUANTILES of each summary histogram, in ``summary_columns`` order."""
+    values = []
+    for name in SUMMARY_HISTOGRAMS:
+        histogram = getattr(distributions, name)
+        values.append(histogram.mean())
+        values += [float(histogram.quantile(q)) for q in SUMMARY_QUANTILES]
+    return values + [
+        distributions.tiebreaks_per_match.mean(),
+        distributions.tiebreak_set_rate(),
+    ]
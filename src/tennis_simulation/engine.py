@@ -1,10 +1,17 @@
 import random
-from dataclasses import dataclass
-from typing import Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Iterator, Tuple
 
+from .cache import ResultCache, result_key
 from .config import MatchConfig
-from .events import build_point_context
-from .policies import IndependentPolicy, ProbabilityPolicy, build_policy
+from .distributions import MatchDistributions
+from .eventlog import EventLogWriter
+from .events import ContextTable, get_context_table
+from .instrumentation import active_instrumentation
+from .policies import NO_CONTEXT_FIELDS, IndependentPolicy, ProbabilityPolicy, build_policy
+from .pressure import PressureStats
+from .seeding import AntitheticRandom, derive_seed, resolve_root_seed
 
 
 @dataclass
@@ -33,6 +40,15 @@ class BreakPointStats:
             return 0.0
         return self.p1_break_points_saved / self.p1_break_points_faced
 
+    @classmethod
+    def from_pressure(cls, pressure: PressureStats) -> "BreakPointStats":
+        return cls(
+            p1_break_points_earned=pressure.played("break_point", p1_serving=False),
+            p1_break_points_converted=pressure.won("break_point", p1_serving=False),
+            p1_break_points_faced=pressure.played("break_point", p1_serving=True),
+            p1_break_points_saved=pressure.won("break_point", p1_serving=True),
+        )
+
     def add(self, other: "BreakPointStats") -> None:
         self.p1_break_points_earned += other.p1_break_points_earned
         self.p1_break_points_converted += other.p1_break_points_converted
@@ -40,6 +56,72 @@ class BreakPointStats:
         self.p1_break_points_saved += other.p1_break_points_saved
 
 
+@dataclass
+class OutcomeStats:
+    """Game and set outcomes seen inside simulated matches, split by server."""
+
+    p1_service_games_played: int = 0
+    p1_service_games_won: int = 0
+    p1_return_games_played: int = 0
+    p1_return_games_won: int = 0
+    tiebreaks_played: int = 0
+    tiebreaks_won: int = 0
+    sets_p1_served_first: int = 0
+    sets_won_p1_served_first: int = 0
+    sets_p2_served_first: int = 0
+    sets_won_p2_served_first: int = 0
+
+    def record_game(self, p1_serving: bool, p1_won: bool) -> None:
+        if p1_serving:
+            self.p1_service_games_played += 1
+            self.p1_service_games_won += p1_won
+        else:
+            self.p1_return_games_played += 1
+            self.p1_return_games_won += p1_won
+
+    def record_set(self, p1_served_first: bool, p1_won: bool) -> None:
+        if p1_served_first:
+            self.sets_p1_served_first += 1
+            self.sets_won_p1_served_first += p1_won
+        else:
+            self.sets_p2_served_first += 1
+            self.sets_won_p2_served_first += p1_won
+
+    def service_game_win_rate(self) -> float:
+        if self.p1_service_games_played == 0:
+            return 0.0
+        return self.p1_service_games_won / self.p1_service_games_played
+
+    def return_game_win_rate(self) -> float:
+        if self.p1_return_games_played == 0:
+            return 0.0
+        return self.p1_return_games_won / self.p1_return_games_played
+
+    def set_win_rate(self) -> float:
+        """P1 set win rate with a fair coin for the first server, as estimate_set_win_rate."""
+        if self.sets_p1_served_first == 0 or self.sets_p2_served_first == 0:
+            sets = self.sets_p1_served_first + self.sets_p2_served_first
+            if sets == 0:
+                return 0.0
+            return (self.sets_won_p1_served_first + self.sets_won_p2_served_first) / sets
+        return 0.5 * (
+            self.sets_won_p1_served_first / self.sets_p1_served_first
+            + self.sets_won_p2_served_first / self.sets_p2_served_first
+        )
+
+    def add(self, other: "OutcomeStats") -> None:
+        self.p1_service_games_played += other.p1_service_games_played
+        self.p1_service_games_won += other.p1_service_games_won
+        self.p1_return_games_played += other.p1_return_games_played
+        self.p1_return_games_won += other.p1_return_games_won
+        self.tiebreaks_played += other.tiebreaks_played
+        self.tiebreaks_won += other.tiebreaks_won
+        self.sets_p1_served_first += other.sets_p1_served_first
+        self.sets_won_p1_served_first += other.sets_won_p1_served_first
+        self.sets_p2_served_first += other.sets_p2_served_first
+        self.sets_won_p2_served_first += other.sets_won_p2_served_first
+
+
 @dataclass
 class BreakPointMetrics:
     p1_break_points_earned_per_match: float
@@ -50,6 +132,63 @@ class BreakPointMetrics:
     p1_break_point_save_rate: float
 
 
+def _break_point_metrics(stats: BreakPointStats, n_matches: int) -> BreakPointMetrics:
+    return BreakPointMetrics(
+        p1_break_points_earned_per_match=stats.p1_break_points_earned / n_matches,
+        p1_break_points_converted_per_match=stats.p1_break_points_converted / n_matches,
+        p1_break_points_faced_per_match=stats.p1_break_points_faced / n_matches,
+        p1_break_points_saved_per_match=stats.p1_break_points_saved / n_matches,
+        p1_break_point_conversion_rate=stats.conversion_rate(),
+        p1_break_point_save_rate=stats.save_rate(),
+    )
+
+
+def _sample_seeds(
+    seed: int | None, n_samples: int, antithetic: bool = False
+) -> Iterator[tuple[int, bool]]:
+    """(seed, mirrored) per sample. With ``antithetic``, odd samples replay the previous
+    sample's seed with every uniform flipped; otherwise this is the original seed stream."""
+    rng = random.Random(seed)
+    sample_seed = 0
+    for index in range(n_samples):
+        mirrored = antithetic and index % 2 == 1
+        if not mirrored:
+            sample_seed = rng.randint(0, 10**9)
+        yield sample_seed, mirrored
+
+
+def _sample_rngs(
+    seed: int | None, n_samples: int, antithetic: bool = False
+) -> Iterator[random.Random]:
+    """One generator per sample: a shared stream, or antithetic pairs of seeded streams."""
+    if not antithetic:
+        rng = random.Random(seed)
+        for _ in range(n_samples):
+            yield rng
+        return
+    for sample_seed, mirrored in _sample_seeds(seed, n_samples, antithetic=True):
+        yield AntitheticRandom(sample_seed) if mirrored else random.Random(sample_seed)
+
+
+def _cache_key(
+    cache: ResultCache | None,
+    estimator: str,
+    config: MatchConfig,
+    seed: int | None,
+    samples: int,
+    workers: int | None = None,
+    antithetic: bool = False,
+) -> str | None:
+    """Result cache key, or None when the result is not cached (no cache or no seed)."""
+    if cache is None or seed is None:
+        return None
+    # Chunked runs use per-match derived seeds, a different stream from serial runs.
+    seed_stream = "sequential" if workers is None else "derived"
+    return result_key(
+        estimator, config, seed, samples, seed_stream=seed_stream, antithetic=antithetic
+    )
+
+
 def _validate_match_config(config: MatchConfig) -> None:
     if not 0.0 <= config.p1_point_win_probability <= 1.0:
         raise ValueError("p1_point_win_probability must be between 0 and 1.")
@@ -73,33 +212,26 @@ def _simulate_standard_game(
     p1_games: int,
     p2_games: int,
     p1_serving: bool,
-    break_point_stats: BreakPointStats | None = None,
+    pressure_stats: PressureStats | None = None,
+    context_table: ContextTable | None = None,
+    distributions: MatchDistributions | None = None,
 ) -> int:
+    table = context_table if context_table is not None else get_context_table(config)
+    if pressure_stats is None and policy.context_fields == NO_CONTEXT_FIELDS:
+        contexts = table.blank_contexts
+    else:
+        contexts = table.game_contexts(p1_sets, p2_sets, p1_games, p2_games, p1_serving)
+    pressure_counts = pressure_stats.counts if pressure_stats is not None else None
+    floor = table.standard_floor
     p1_points = 0
     p2_points = 0
+    folds = 0
     while True:
-        context = build_point_context(
-            config=config,
-            p1_sets=p1_sets,
-            p2_sets=p2_sets,
-            p1_games=p1_games,
-            p2_games=p2_games,
-            p1_points=p1_points,
-            p2_points=p2_points,
-            p1_serving=p1_serving,
-            in_tiebreak=False,
-        )
+        context = contexts[p1_points][p2_points]
         p1_won_point = _play_point(policy, context, rng)
 
-        if break_point_stats is not None and context.is_break_point:
-            if p1_serving:
-                break_point_stats.p1_break_points_faced += 1
-                if p1_won_point:
-                    break_point_stats.p1_break_points_saved += 1
-            else:
-                break_point_stats.p1_break_points_earned += 1
-                if p1_won_point:
-                    break_point_stats.p1_break_points_converted += 1
+        if pressure_counts is not None:
+            pressure_counts[context.pressure_index + p1_won_point] += 1
 
         if p1_won_point:
             p1_points += 1
@@ -107,9 +239,20 @@ def _simulate_standard_game(
             p2_points += 1
 
         if p1_points >= 4 and p1_points - p2_points >= 2:
-            return 1
+            winner = 1
+            break
         if p2_points >= 4 and p2_points - p1_points >= 2:
-            return 2
+            winner = 2
+            break
+        # Past deuce only the lead matters; folding keeps the score inside the table.
+        if p1_points > floor and p2_points > floor:
+            p1_points -= 1
+            p2_points -= 1
+            folds += 1
+
+    if distributions is not None:
+        distributions.match_points += p1_points + p2_points + 2 * folds
+    return winner
 
 
 def _simulate_tiebreak(
@@ -121,36 +264,46 @@ def _simulate_tiebreak(
     p1_games: int,
     p2_games: int,
     p1_serving: bool,
+    context_table: ContextTable | None = None,
+    distributions: MatchDistributions | None = None,
+    pressure_stats: PressureStats | None = None,
 ) -> int:
+    table = context_table if context_table is not None else get_context_table(config)
+    if pressure_stats is None and policy.context_fields == NO_CONTEXT_FIELDS:
+        contexts = table.blank_contexts
+    else:
+        contexts = table.game_contexts(p1_sets, p2_sets, p1_games, p2_games, p1_serving)
+    pressure_counts = pressure_stats.counts if pressure_stats is not None else None
+    floor = table.tiebreak_floor
+    points_to_win = config.tiebreak_points_to_win
+    win_margin = config.tiebreak_win_margin
     p1_points = 0
     p2_points = 0
+    folds = 0
     while True:
-        context = build_point_context(
-            config=config,
-            p1_sets=p1_sets,
-            p2_sets=p2_sets,
-            p1_games=p1_games,
-            p2_games=p2_games,
-            p1_points=p1_points,
-            p2_points=p2_points,
-            p1_serving=p1_serving,
-            in_tiebreak=True,
-        )
-        if _play_point(policy, context, rng):
+        context = contexts[p1_points][p2_points]
+        p1_won_point = _play_point(policy, context, rng)
+        if pressure_counts is not None:
+            pressure_counts[context.pressure_index + p1_won_point] += 1
+        if p1_won_point:
             p1_points += 1
         else:
             p2_points += 1
 
-        if (
-            p1_points >= config.tiebreak_points_to_win
-            and p1_points - p2_points >= config.tiebreak_win_margin
-        ):
-            return 1
-        if (
-            p2_points >= config.tiebreak_points_to_win
-            and p2_points - p1_points >= config.tiebreak_win_margin
-        ):
-            return 2
+        if p1_points >= points_to_win and p1_points - p2_points >= win_margin:
+            winner = 1
+            break
+        if p2_points >= points_to_win and p2_points - p1_points >= win_margin:
+            winner = 2
+            break
+        if p1_points > floor and p2_points > floor:
+            p1_points -= 1
+            p2_points -= 1
+            folds += 1
+
+    if distributions is not None:
+        distributions.match_points += p1_points + p2_points + 2 * folds
+    return winner
 
 
 def simulate_game(
@@ -179,13 +332,21 @@ def simulate_set(
     p2_sets: int = 0,
     p1_serving_first_game: bool = True,
     break_point_stats: BreakPointStats | None = None,
+    context_table: ContextTable | None = None,
+    outcome_stats: OutcomeStats | None = None,
+    distributions: MatchDistributions | None = None,
+    pressure_stats: PressureStats | None = None,
 ) -> Tuple[int, int, int, bool]:
     _validate_match_config(config)
     active_policy = policy if policy is not None else build_policy(config)
+    table = context_table if context_table is not None else get_context_table(config)
+    # Break points are read from a pressure collector covering just this set.
+    pressure = PressureStats() if break_point_stats is not None else pressure_stats
 
     p1_games = 0
     p2_games = 0
     p1_serving = p1_serving_first_game
+    tiebreak_played = False
 
     while True:
         if p1_games == config.tiebreak_at and p2_games == config.tiebreak_at:
@@ -198,11 +359,18 @@ def simulate_set(
                 p1_games=p1_games,
                 p2_games=p2_games,
                 p1_serving=p1_serving,
+                context_table=table,
+                distributions=distributions,
+                pressure_stats=pressure,
             )
+            tiebreak_played = True
             if tiebreak_winner == 1:
                 p1_games += 1
             else:
                 p2_games += 1
+            if outcome_stats is not None:
+                outcome_stats.tiebreaks_played += 1
+                outcome_stats.tiebreaks_won += tiebreak_winner == 1
             p1_serving = not p1_serving
             break
 
@@ -215,12 +383,16 @@ def simulate_set(
             p1_games=p1_games,
             p2_games=p2_games,
             p1_serving=p1_serving,
-            break_point_stats=break_point_stats,
+            pressure_stats=pressure,
+            context_table=table,
+            distributions=distributions,
         )
         if game_winner == 1:
             p1_games += 1
         else:
             p2_games += 1
+        if outcome_stats is not None:
+            outcome_stats.record_game(p1_serving, game_winner == 1)
 
         p1_serving = not p1_serving
 
@@ -236,6 +408,14 @@ def simulate_set(
             break
 
     set_winner = 1 if p1_games > p2_games else 2
+    if break_point_stats is not None:
+        break_point_stats.add(BreakPointStats.from_pressure(pressure))
+        if pressure_stats is not None:
+            pressure_stats.add(pressure)
+    if outcome_stats is not None:
+        outcome_stats.record_set(p1_serving_first_game, set_winner == 1)
+    if distributions is not None:
+        distributions.record_set(p1_games, p2_games, tiebreak_played)
     return set_winner, p1_games, p2_games, p1_serving
 
 
@@ -244,11 +424,27 @@ def simulate_match(
     seed: int | None = None,
     policy: ProbabilityPolicy | None = None,
     break_point_stats: BreakPointStats | None = None,
+    antithetic: bool = False,
+    outcome_stats: OutcomeStats | None = None,
+    event_log: EventLogWriter | None = None,
+    distributions: MatchDistributions | None = None,
+    pressure_stats: PressureStats | None = None,
 ) -> MatchResult:
     _validate_match_config(config)
-    rng = random.Random(seed)
+    rng = AntitheticRandom(seed) if antithetic else random.Random(seed)
     active_policy = policy if policy is not None else build_policy(config)
+    if event_log is not None:
+        active_policy = event_log.wrap(active_policy)
+    instrumentation = active_instrumentation()
+    tracked = distributions
+    if instrumentation is not None:
+        active_policy, rng = instrumentation.wrap(active_policy, rng)
+        if tracked is None:
+            # Only read for the instrumentation counters.
+            tracked = MatchDistributions()
     active_policy.reset_match()
+    table = get_context_table(config)
+    pressure = PressureStats() if break_point_stats is not None else pressure_stats
 
     sets_needed = config.best_of_sets // 2 + 1
     p1_sets = 0
@@ -265,13 +461,24 @@ def simulate_match(
             p1_sets=p1_sets,
             p2_sets=p2_sets,
             p1_serving_first_game=p1_serving,
-            break_point_stats=break_point_stats,
+            context_table=table,
+            outcome_stats=outcome_stats,
+            distributions=tracked,
+            pressure_stats=pressure,
         )
         if set_winner == 1:
             p1_sets += 1
         else:
             p2_sets += 1
 
+    if break_point_stats is not None:
+        break_point_stats.add(BreakPointStats.from_pressure(pressure))
+        if pressure_stats is not None:
+            pressure_stats.add(pressure)
+    if instrumentation is not None:
+        instrumentation.record_match(tracked, p1_sets + p2_sets)
+    if distributions is not None:
+        distributions.record_match(p1_sets, p2_sets)
     winner = "Player 1" if p1_sets > p2_sets else "Player 2"
     return MatchResult(
         p1_sets=p1_sets,
@@ -282,22 +489,132 @@ def simulate_match(
     )
 
 
+def _simulate_match_chunk(
+    config: MatchConfig,
+    root_seed: int,
+    start: int,
+    stop: int,
+    antithetic: bool = False,
+    with_distributions: bool = False,
+) -> tuple[int, int, PressureStats, OutcomeStats, MatchDistributions | None]:
+    """Play matches ``start..stop`` of a seeded run; each match seed depends only on its index."""
+    p1_wins = 0
+    p2_wins = 0
+    chunk_stats = PressureStats()
+    chunk_outcomes = OutcomeStats()
+    chunk_distributions = MatchDistributions() if with_distributions else None
+    for match_index in range(start, stop):
+        result = simulate_match(
+            config=config,
+            seed=derive_seed(root_seed, match_index // 2 if antithetic else match_index),
+            antithetic=antithetic and match_index % 2 == 1,
+            outcome_stats=chunk_outcomes,
+            distributions=chunk_distributions,
+            pressure_stats=chunk_stats,
+        )
+        if result.winner == "Player 1":
+            p1_wins += 1
+        else:
+            p2_wins += 1
+    return p1_wins, p2_wins, chunk_stats, chunk_outcomes, chunk_distributions
+
+
+def _run_monte_carlo_chunked(
+    n_matches: int,
+    config: MatchConfig,
+    seed: int | None,
+    workers: int,
+    chunk_size: int | None,
+    antithetic: bool = False,
+    distributions: MatchDistributions | None = None,
+) -> tuple[int, int, PressureStats, OutcomeStats]:
+    if workers <= 0:
+        raise ValueError("workers must be greater than 0.")
+    if chunk_size is None:
+        chunk_size = max(1, -(-n_matches // (workers * 4)))
+    elif chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0.")
+
+    root_seed = resolve_root_seed(seed)
+    instrumentation = active_instrumentation()
+    # Worker processes do not report to this process's instrumentation, so their matches
+    # are counted from the chunk distributions instead.
+    count_chunks = instrumentation is not None and workers > 1
+    with_distributions = distributions is not None or count_chunks
+    bounds = [
+        (start, min(start + chunk_size, n_matches))
+        for start in range(0, n_matches, chunk_size)
+    ]
+    if workers == 1:
+        chunks = [
+            _simulate_match_chunk(
+                config, root_seed, start, stop, antithetic, with_distributions
+            )
+            for start, stop in bounds
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(bounds))) as executor:
+            chunks = list(
+                executor.map(
+                    _simulate_match_chunk,
+                    [config] * len(bounds),
+                    [root_seed] * len(bounds),
+                    [start for start, _ in bounds],
+                    [stop for _, stop in bounds],
+                    [antithetic] * len(bounds),
+                    [with_distributions] * len(bounds),
+                )
+            )
+
+    p1_wins = 0
+    p2_wins = 0
+    aggregate_stats = PressureStats()
+    aggregate_outcomes = OutcomeStats()
+    for chunk_p1_wins, chunk_p2_wins, chunk_stats, chunk_outcomes, chunk_distributions in chunks:
+        p1_wins += chunk_p1_wins
+        p2_wins += chunk_p2_wins
+        aggregate_stats.add(chunk_stats)
+        aggregate_outcomes.add(chunk_outcomes)
+        if count_chunks:
+            instrumentation.record_distributions(chunk_distributions)
+        if distributions is not None:
+            distributions.add(chunk_distributions)
+    return p1_wins, p2_wins, aggregate_stats, aggregate_outcomes
+
+
 def run_monte_carlo(
     n_matches: int,
     config: MatchConfig,
     seed: int | None = None,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    antithetic: bool = False,
+    event_log: EventLogWriter | None = None,
+    distributions: MatchDistributions | None = None,
 ) -> tuple[int, int]:
     if n_matches <= 0:
         raise ValueError("n_matches must be greater than 0.")
 
     _validate_match_config(config)
-    rng = random.Random(seed)
+    if workers is not None and event_log is not None:
+        raise ValueError("event_log cannot be combined with workers.")
+    if workers is not None:
+        p1_wins, p2_wins, _, _ = _run_monte_carlo_chunked(
+            n_matches, config, seed, workers, chunk_size, antithetic, distributions
+        )
+        return p1_wins, p2_wins
+
     p1_wins = 0
     p2_wins = 0
 
-    for _ in range(n_matches):
-        match_seed = rng.randint(0, 10**9)
-        result = simulate_match(config=config, seed=match_seed)
+    for match_seed, mirrored in _sample_seeds(seed, n_matches, antithetic):
+        result = simulate_match(
+            config=config,
+            seed=match_seed,
+            antithetic=mirrored,
+            event_log=event_log,
+            distributions=distributions,
+        )
         if result.winner == "Player 1":
             p1_wins += 1
         else:
@@ -310,31 +627,49 @@ def _run_monte_carlo_with_break_point_stats(
     n_matches: int,
     config: MatchConfig,
     seed: int | None = None,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    antithetic: bool = False,
+    outcome_stats: OutcomeStats | None = None,
+    event_log: EventLogWriter | None = None,
+    distributions: MatchDistributions | None = None,
+    pressure_stats: PressureStats | None = None,
 ) -> tuple[int, int, BreakPointStats]:
+    """Wins and break point counts; every pressure counter is added to ``pressure_stats``."""
     if n_matches <= 0:
         raise ValueError("n_matches must be greater than 0.")
 
     _validate_match_config(config)
-    rng = random.Random(seed)
-    p1_wins = 0
-    p2_wins = 0
-    aggregate_stats = BreakPointStats()
-
-    for _ in range(n_matches):
-        match_seed = rng.randint(0, 10**9)
-        match_break_point_stats = BreakPointStats()
-        result = simulate_match(
-            config=config,
-            seed=match_seed,
-            break_point_stats=match_break_point_stats,
+    if workers is not None and event_log is not None:
+        raise ValueError("event_log cannot be combined with workers.")
+    if workers is not None:
+        p1_wins, p2_wins, aggregate_stats, chunk_outcomes = _run_monte_carlo_chunked(
+            n_matches, config, seed, workers, chunk_size, antithetic, distributions
         )
-        aggregate_stats.add(match_break_point_stats)
-        if result.winner == "Player 1":
-            p1_wins += 1
-        else:
-            p2_wins += 1
+        if outcome_stats is not None:
+            outcome_stats.add(chunk_outcomes)
+    else:
+        p1_wins = 0
+        p2_wins = 0
+        aggregate_stats = PressureStats()
+        for match_seed, mirrored in _sample_seeds(seed, n_matches, antithetic):
+            result = simulate_match(
+                config=config,
+                seed=match_seed,
+                antithetic=mirrored,
+                outcome_stats=outcome_stats,
+                event_log=event_log,
+                distributions=distributions,
+                pressure_stats=aggregate_stats,
+            )
+            if result.winner == "Player 1":
+                p1_wins += 1
+            else:
+                p2_wins += 1
 
-    return p1_wins, p2_wins, aggregate_stats
+    if pressure_stats is not None:
+        pressure_stats.add(aggregate_stats)
+    return p1_wins, p2_wins, BreakPointStats.from_pressure(aggregate_stats)
 
 
 def estimate_game_win_rate(
@@ -342,6 +677,8 @@ def estimate_game_win_rate(
     n_games: int,
     seed: int | None = None,
     config: MatchConfig | None = None,
+    antithetic: bool = False,
+    cache: ResultCache | None = None,
 ) -> float:
     if n_games <= 0:
         raise ValueError("n_games must be greater than 0.")
@@ -354,10 +691,19 @@ def estimate_game_win_rate(
         else MatchConfig(p1_point_win_probability=p1_point_win_probability)
     )
     _validate_match_config(active_config)
-    rng = random.Random(seed)
+    key = _cache_key(cache, "game_win_rate", active_config, seed, n_games, antithetic=antithetic)
+    cached = cache.get(key) if key is not None else None
+    if cached is not None:
+        return cached
+
+    table = get_context_table(active_config)
+    instrumentation = active_instrumentation()
+    tracked = MatchDistributions() if instrumentation is not None else None
     p1_wins = 0
-    for _ in range(n_games):
+    for rng in _sample_rngs(seed, n_games, antithetic):
         policy = build_policy(active_config)
+        if instrumentation is not None:
+            policy, rng = instrumentation.wrap(policy, rng)
         policy.reset_match()
         if (
             _simulate_standard_game(
@@ -369,24 +715,45 @@ def estimate_game_win_rate(
                 p1_games=0,
                 p2_games=0,
                 p1_serving=True,
+                context_table=table,
+                distributions=tracked,
             )
             == 1
         ):
             p1_wins += 1
-    return p1_wins / n_games
+    if instrumentation is not None:
+        instrumentation.count("games", n_games)
+        instrumentation.count("points", tracked.match_points)
+    win_rate = p1_wins / n_games
+    if key is not None:
+        cache.put(key, win_rate)
+    return win_rate
 
 
 def estimate_set_win_rate(
-    config: MatchConfig, n_sets: int, seed: int | None = None
+    config: MatchConfig,
+    n_sets: int,
+    seed: int | None = None,
+    antithetic: bool = False,
+    cache: ResultCache | None = None,
 ) -> float:
     if n_sets <= 0:
         raise ValueError("n_sets must be greater than 0.")
 
     _validate_match_config(config)
-    rng = random.Random(seed)
+    key = _cache_key(cache, "set_win_rate", config, seed, n_sets, antithetic=antithetic)
+    cached = cache.get(key) if key is not None else None
+    if cached is not None:
+        return cached
+
+    table = get_context_table(config)
+    instrumentation = active_instrumentation()
+    tracked = MatchDistributions() if instrumentation is not None else None
     p1_wins = 0
-    for _ in range(n_sets):
+    for rng in _sample_rngs(seed, n_sets, antithetic):
         policy = build_policy(config)
+        if instrumentation is not None:
+            policy, rng = instrumentation.wrap(policy, rng)
         policy.reset_match()
         p1_serving = rng.random() < 0.5
         set_winner, _, _, _ = simulate_set(
@@ -396,52 +763,174 @@ def estimate_set_win_rate(
             p1_sets=0,
             p2_sets=0,
             p1_serving_first_game=p1_serving,
+            context_table=table,
+            distributions=tracked,
         )
         if set_winner == 1:
             p1_wins += 1
-    return p1_wins / n_sets
+    if instrumentation is not None:
+        # No match is recorded, so the running totals cover the whole run.
+        instrumentation.count("sets", tracked.sets_played)
+        instrumentation.count("games", tracked.match_games)
+        instrumentation.count("tiebreaks", tracked.match_tiebreaks)
+        instrumentation.count("points", tracked.match_points)
+    win_rate = p1_wins / n_sets
+    if key is not None:
+        cache.put(key, win_rate)
+    return win_rate
 
 
 def estimate_match_win_rate(
-    config: MatchConfig, n_matches: int, seed: int | None = None
+    config: MatchConfig,
+    n_matches: int,
+    seed: int | None = None,
+    workers: int | None = None,
+    antithetic: bool = False,
+    cache: ResultCache | None = None,
 ) -> float:
-    p1_wins, _ = run_monte_carlo(n_matches=n_matches, config=config, seed=seed)
-    return p1_wins / n_matches
+    key = _cache_key(cache, "match_win_rate", config, seed, n_matches, workers, antithetic)
+    cached = cache.get(key) if key is not None else None
+    if cached is not None:
+        return cached
+
+    p1_wins, _ = run_monte_carlo(
+        n_matches=n_matches,
+        config=config,
+        seed=seed,
+        workers=workers,
+        antithetic=antithetic,
+    )
+    win_rate = p1_wins / n_matches
+    if key is not None:
+        cache.put(key, win_rate)
+    return win_rate
 
 
 def estimate_break_point_metrics(
-    config: MatchConfig, n_matches: int, seed: int | None = None
+    config: MatchConfig,
+    n_matches: int,
+    seed: int | None = None,
+    workers: int | None = None,
+    antithetic: bool = False,
+    cache: ResultCache | None = None,
 ) -> BreakPointMetrics:
+    key = _cache_key(
+        cache, "break_point_metrics", config, seed, n_matches, workers, antithetic
+    )
+    cached = cache.get(key) if key is not None else None
+    if cached is not None:
+        return BreakPointMetrics(**cached)
+
     _, _, stats = _run_monte_carlo_with_break_point_stats(
         n_matches=n_matches,
         config=config,
         seed=seed,
+        workers=workers,
+        antithetic=antithetic,
     )
-    return BreakPointMetrics(
-        p1_break_points_earned_per_match=stats.p1_break_points_earned / n_matches,
-        p1_break_points_converted_per_match=stats.p1_break_points_converted / n_matches,
-        p1_break_points_faced_per_match=stats.p1_break_points_faced / n_matches,
-        p1_break_points_saved_per_match=stats.p1_break_points_saved / n_matches,
-        p1_break_point_conversion_rate=stats.conversion_rate(),
-        p1_break_point_save_rate=stats.save_rate(),
-    )
+    metrics = _break_point_metrics(stats, n_matches)
+    if key is not None:
+        cache.put(key, asdict(metrics))
+    return metrics
 
 
 def estimate_match_profile(
-    config: MatchConfig, n_matches: int, seed: int | None = None
+    config: MatchConfig,
+    n_matches: int,
+    seed: int | None = None,
+    workers: int | None = None,
+    antithetic: bool = False,
+    distributions: MatchDistributions | None = None,
+    cache: ResultCache | None = None,
+    pressure_stats: PressureStats | None = None,
 ) -> tuple[float, BreakPointMetrics]:
+    if cache is not None and distributions is not None:
+        raise ValueError("cache cannot be combined with distributions.")
+    if cache is not None and pressure_stats is not None:
+        raise ValueError("cache cannot be combined with pressure_stats.")
+    key = _cache_key(cache, "match_profile", config, seed, n_matches, workers, antithetic)
+    cached = cache.get(key) if key is not None else None
+    if cached is not None:
+        match_win_rate, metrics = cached
+        return match_win_rate, BreakPointMetrics(**metrics)
+
     p1_wins, _, stats = _run_monte_carlo_with_break_point_stats(
         n_matches=n_matches,
         config=config,
         seed=seed,
+        workers=workers,
+        antithetic=antithetic,
+        distributions=distributions,
+        pressure_stats=pressure_stats,
     )
     match_win_rate = p1_wins / n_matches
-    metrics = BreakPointMetrics(
-        p1_break_points_earned_per_match=stats.p1_break_points_earned / n_matches,
-        p1_break_points_converted_per_match=stats.p1_break_points_converted / n_matches,
-        p1_break_points_faced_per_match=stats.p1_break_points_faced / n_matches,
-        p1_break_points_saved_per_match=stats.p1_break_points_saved / n_matches,
-        p1_break_point_conversion_rate=stats.conversion_rate(),
-        p1_break_point_save_rate=stats.save_rate(),
-    )
+    metrics = _break_point_metrics(stats, n_matches)
+    if key is not None:
+        cache.put(key, [match_win_rate, asdict(metrics)])
     return match_win_rate, metrics
+
+
+def estimate_match_statistics(
+    config: MatchConfig,
+    n_matches: int,
+    seed: int | None = None,
+    workers: int | None = None,
+    antithetic: bool = False,
+    distributions: MatchDistributions | None = None,
+    cache: ResultCache | None = None,
+    pressure_stats: PressureStats | None = None,
+) -> tuple[float, float, float, BreakPointMetrics]:
+    """Game, set and match win rates plus break point metrics from one match run.
+
+    The game rate is P1's service-game win rate and the set rate weights both first servers
+    equally, the quantities estimate_game_win_rate and estimate_set_win_rate measure. The
+    match columns equal estimate_match_profile for the same seed.
+    """
+    if cache is not None and distributions is not None:
+        raise ValueError("cache cannot be combined with distributions.")
+    if cache is not None and pressure_stats is not None:
+        raise ValueError("cache cannot be combined with pressure_stats.")
+    key = _cache_key(cache, "match_statistics", config, seed, n_matches, workers, antithetic)
+    cached = cache.get(key) if key is not None else None
+    if cached is not None:
+        game_win_rate, set_win_rate, match_win_rate, metrics = cached
+        return game_win_rate, set_win_rate, match_win_rate, BreakPointMetrics(**metrics)
+
+    outcome_stats = OutcomeStats()
+    p1_wins, _, stats = _run_monte_carlo_with_break_point_stats(
+        n_matches=n_matches,
+        config=config,
+        seed=seed,
+        workers=workers,
+        antithetic=antithetic,
+        outcome_stats=outcome_stats,
+        distributions=distributions,
+        pressure_stats=pressure_stats,
+    )
+    game_win_rate = outcome_stats.service_game_win_rate()
+    set_win_rate = outcome_stats.set_win_rate()
+    match_win_rate = p1_wins / n_matches
+    metrics = _break_point_metrics(stats, n_matches)
+    if key is not None:
+        cache.put(key, [game_win_rate, set_win_rate, match_win_rate, asdict(metrics)])
+    return game_win_rate, set_win_rate, match_win_rate, metrics
+
+
+def estimate_match_distributions(
+    config: MatchConfig,
+    n_matches: int,
+    seed: int | None = None,
+    workers: int | None = None,
+    antithetic: bool = False,
+) -> MatchDistributions:
+    """Length and scoreline distributions of the matches run_monte_carlo plays for ``seed``."""
+    distributions = MatchDistributions()
+    run_monte_carlo(
+        n_matches=n_matches,
+        config=config,
+        seed=seed,
+        workers=workers,
+        antithetic=antithetic,
+        distributions=distributions,
+    )
+    return distributions
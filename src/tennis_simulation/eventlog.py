@@ -0,0 +1,172 @@
+import struct
+from pathlib import Path
+
+from .policies import ProbabilityPolicy
+from .state import PointContext
+
+MAGIC = b"TENNISPTS\x00"
+VERSION = 1
+# Magic, format version, record size; padded so records start on a 16-byte boundary.
+_HEADER = struct.Struct("<10sHI")
+HEADER_SIZE = 16
+# match_id, p1_sets, p2_sets, p1_games, p2_games, p1_points, p2_points, flags, padding.
+_RECORD = struct.Struct("<QBBBBBBBx")
+RECORD_SIZE = _RECORD.size
+
+FLAG_P1_SERVING = 1 << 0
+FLAG_TIEBREAK = 1 << 1
+FLAG_BREAK_POINT = 1 << 2
+FLAG_SET_POINT = 1 << 3
+FLAG_MATCH_POINT = 1 << 4
+FLAG_PRIMARY_CLUTCH = 1 << 5
+FLAG_SECONDARY_CLUTCH = 1 << 6
+FLAG_P1_WON = 1 << 7
+
+
+def context_flags(context: PointContext, p1_won_point: bool) -> int:
+    return (
+        context.p1_serving * FLAG_P1_SERVING
+        | context.in_tiebreak * FLAG_TIEBREAK
+        | context.is_break_point * FLAG_BREAK_POINT
+        | context.is_set_point * FLAG_SET_POINT
+        | context.is_match_point * FLAG_MATCH_POINT
+        | context.is_primary_clutch * FLAG_PRIMARY_CLUTCH
+        | context.is_secondary_clutch * FLAG_SECONDARY_CLUTCH
+        | p1_won_point * FLAG_P1_WON
+    )
+
+
+class EventLogWriter:
+    """Write every played point to ``path`` as a fixed-width little-endian record.
+
+    Records are packed into a preallocated buffer and written ``buffer_records`` at a time.
+    Scores are the ones the policy sees, so long deuces and tiebreaks are folded (see
+    ``events.points_fold_floor``). Read the file back with ``read_event_log``.
+    """
+
+    def __init__(self, path: Path, buffer_records: int = 65536, first_match_id: int = 0):
+        if buffer_records <= 0:
+            raise ValueError("buffer_records must be greater than 0.")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, RECORD_SIZE).ljust(HEADER_SIZE, b"\0"))
+        self._buffer = bytearray(buffer_records * RECORD_SIZE)
+        self._offset = 0
+        self.next_match_id = first_match_id
+        self.match_id = first_match_id - 1
+        self.points_written = 0
+
+    def start_match(self) -> int:
+        self.match_id = self.next_match_id
+        self.next_match_id += 1
+        return self.match_id
+
+    def record(self, context: PointContext, p1_won_point: bool) -> None:
+        _RECORD.pack_into(
+            self._buffer,
+            self._offset,
+            self.match_id,
+            context.p1_sets,
+            context.p2_sets,
+            context.p1_games,
+            context.p2_games,
+            context.p1_points,
+            context.p2_points,
+            context_flags(context, p1_won_point),
+        )
+        self._offset += RECORD_SIZE
+        self.points_written += 1
+        if self._offset == len(self._buffer):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._offset:
+            self._file.write(memoryview(self._buffer)[: self._offset])
+            self._offset = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def wrap(self, policy: ProbabilityPolicy) -> ProbabilityPolicy:
+        return RecordingPolicy(policy, self)
+
+    def __enter__(self) -> "EventLogWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class RecordingPolicy(ProbabilityPolicy):
+    """Delegates to ``inner`` and logs each point; every ``reset_match`` starts a new match id."""
+
+    def __init__(self, inner: ProbabilityPolicy, writer: EventLogWriter) -> None:
+        self.inner = inner
+        self.writer = writer
+        # Bound directly so logging adds no call layer to the probability lookup.
+        self.point_probability = inner.point_probability
+
+    def point_probability(self, context: PointContext) -> float:
+        return self.inner.point_probability(context)
+
+    def on_point_end(self, context: PointContext, p1_won_point: bool) -> None:
+        self.writer.record(context, p1_won_point)
+        self.inner.on_point_end(context, p1_won_point)
+
+    def reset_match(self) -> None:
+        self.writer.start_match()
+        self.inner.reset_match()
+
+
+def point_dtype():
+    import numpy as np
+
+    return np.dtype(
+        {
+            "names": [
+                "match_id",
+                "p1_sets",
+                "p2_sets",
+                "p1_games",
+                "p2_games",
+                "p1_points",
+                "p2_points",
+                "flags",
+            ],
+            "formats": ["<u8", "u1", "u1", "u1", "u1", "u1", "u1", "u1"],
+            "offsets": [0, 8, 9, 10, 11, 12, 13, 14],
+            "itemsize": RECORD_SIZE,
+        }
+    )
+
+
+def read_event_log(path: Path):
+    """Memory-map an event log as a read-only NumPy structured array (requires numpy)."""
+    import numpy as np
+
+    path = Path(path)
+    with path.open("rb") as log_file:
+        header = log_file.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE:
+        raise ValueError(f"{path} is not a point event log.")
+    magic, version, record_size = _HEADER.unpack_from(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a point event log.")
+    if version != VERSION or record_size != RECORD_SIZE:
+        raise ValueError(f"{path} has unsupported event log version {version}.")
+
+    n_records = (path.stat().st_size - HEADER_SIZE) // RECORD_SIZE
+    if n_records == 0:
+        return np.zeros(0, dtype=point_dtype())
+    return np.memmap(
+        path, dtype=point_dtype(), mode="r", offset=HEADER_SIZE, shape=(n_records,)
+    )
+
+
+def has_flag(records, flag: int):
+    """Boolean mask of the records with ``flag`` (one of the FLAG_* constants) set."""
+    return (records["flags"] & flag) != 0
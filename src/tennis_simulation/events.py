@@ -1,4 +1,8 @@
+from functools import lru_cache
+
 from .config import MatchConfig
+from .instrumentation import active_instrumentation
+from .pressure import pressure_index
 from .state import PointContext
 
 
@@ -110,4 +114,156 @@ def build_point_context(
         is_break_point=is_break_point,
         is_set_point=is_set_point,
         is_match_point=is_match_point,
+        pressure_index=pressure_index(
+            p1_serving,
+            is_break_point,
+            is_set_point,
+            is_match_point,
+            in_tiebreak,
+            is_primary_clutch,
+            is_secondary_clutch,
+        ),
+    )
+
+
+def points_fold_floor(points_to_win: int, win_margin: int) -> int:
+    """Lowest point count at which subtracting a point from both players changes no flag.
+
+    Past it only the lead matters (deuce, long tiebreaks), so e.g. 5-4 is folded onto 4-3.
+    """
+    return max(points_to_win - win_margin, points_to_win - 1, 2)
+
+
+def games_fold_floor(config: MatchConfig) -> int:
+    """Same idea for games: beyond it no tiebreak can follow and only the lead matters."""
+    return max(
+        config.games_to_win_set - config.set_win_margin,
+        config.games_to_win_set - 1,
+        config.tiebreak_at + 1,
+        0,
+    )
+
+
+class ContextTable:
+    """Shared, immutable PointContexts for every reachable score of one MatchConfig.
+
+    Grids are built per game score on first use and indexed ``grid[p1_points][p2_points]``
+    with points folded onto ``standard_floor`` / ``tiebreak_floor``; terminal scores are None.
+    ``blank_contexts`` is a grid of None for policies that read no context field.
+    """
+
+    def __init__(self, config: MatchConfig) -> None:
+        self.config = config
+        self.standard_floor = points_fold_floor(4, 2)
+        self.tiebreak_floor = points_fold_floor(
+            config.tiebreak_points_to_win, config.tiebreak_win_margin
+        )
+        self.games_floor = games_fold_floor(config)
+        size = max(self.standard_floor + 2, self.tiebreak_floor + config.tiebreak_win_margin)
+        self.blank_contexts: list[list[None]] = [[None] * size for _ in range(size)]
+        self._grids: dict[tuple[int, int, int, int, bool], list[list[PointContext | None]]] = {}
+
+    def fold_games(self, p1_games: int, p2_games: int) -> tuple[int, int]:
+        shift = min(p1_games, p2_games) - self.games_floor
+        if shift > 0:
+            return p1_games - shift, p2_games - shift
+        return p1_games, p2_games
+
+    def game_contexts(
+        self,
+        p1_sets: int,
+        p2_sets: int,
+        p1_games: int,
+        p2_games: int,
+        p1_serving: bool,
+    ) -> list[list[PointContext | None]]:
+        p1_games, p2_games = self.fold_games(p1_games, p2_games)
+        key = (p1_sets, p2_sets, p1_games, p2_games, p1_serving)
+        grid = self._grids.get(key)
+        if grid is None:
+            instrumentation = active_instrumentation()
+            if instrumentation is None:
+                grid = self._build_grid(*key)
+            else:
+                with instrumentation.phase("context_tables"):
+                    grid = self._build_grid(*key)
+                instrumentation.count(
+                    "contexts_built", sum(context is not None for row in grid for context in row)
+                )
+            self._grids[key] = grid
+        return grid
+
+    def _build_grid(
+        self,
+        p1_sets: int,
+        p2_sets: int,
+        p1_games: int,
+        p2_games: int,
+        p1_serving: bool,
+    ) -> list[list[PointContext | None]]:
+        config = self.config
+        in_tiebreak = p1_games == config.tiebreak_at and p2_games == config.tiebreak_at
+        if in_tiebreak:
+            target = config.tiebreak_points_to_win
+            margin = config.tiebreak_win_margin
+            floor = self.tiebreak_floor
+        else:
+            target, margin, floor = 4, 2, self.standard_floor
+
+        size = floor + margin
+        grid: list[list[PointContext | None]] = [[None] * size for _ in range(size)]
+        for p1_points in range(size):
+            for p2_points in range(size):
+                if min(p1_points, p2_points) > floor:
+                    continue
+                if (p1_points >= target and p1_points - p2_points >= margin) or (
+                    p2_points >= target and p2_points - p1_points >= margin
+                ):
+                    continue
+                grid[p1_points][p2_points] = build_point_context(
+                    config=config,
+                    p1_sets=p1_sets,
+                    p2_sets=p2_sets,
+                    p1_games=p1_games,
+                    p2_games=p2_games,
+                    p1_points=p1_points,
+                    p2_points=p2_points,
+                    p1_serving=p1_serving,
+                    in_tiebreak=in_tiebreak,
+                )
+        return grid
+
+
+@lru_cache(maxsize=16)
+def _format_context_table(
+    best_of_sets: int,
+    games_to_win_set: int,
+    set_win_margin: int,
+    tiebreak_at: int,
+    tiebreak_points_to_win: int,
+    tiebreak_win_margin: int,
+) -> ContextTable:
+    return ContextTable(
+        MatchConfig(
+            best_of_sets=best_of_sets,
+            games_to_win_set=games_to_win_set,
+            set_win_margin=set_win_margin,
+            tiebreak_at=tiebreak_at,
+            tiebreak_points_to_win=tiebreak_points_to_win,
+            tiebreak_win_margin=tiebreak_win_margin,
+        )
+    )
+
+
+@lru_cache(maxsize=64)
+def get_context_table(config: MatchConfig) -> ContextTable:
+    # Flags depend only on the scoring format, so configs that differ in point probability,
+    # streak or clutch settings (e.g. every row of a sweep) share one table.
+    return _format_context_table(
+        config.best_of_sets,
+        config.games_to_win_set,
+        config.set_win_margin,
+        config.tiebreak_at,
+        config.tiebreak_points_to_win,
+        config.tiebreak_win_margin,
     )
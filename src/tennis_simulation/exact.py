@@ -0,0 +1,293 @@
+from typing import Callable
+
+from .config import MatchConfig
+from .engine import BreakPointMetrics, _validate_match_config
+
+# Below this |p - q| the gambler's-ruin closed forms lose precision to cancellation,
+# so the fair-coin limit is used instead.
+_FAIR_TOLERANCE = 1e-9
+
+# (p1 wins & p1 serves next set, p1 wins & p2 serves next set,
+#  p2 wins & p1 serves next set, p2 wins & p2 serves next set,
+#  expected p1 service games, expected p1 return games)
+_SetOutcome = tuple[float, float, float, float, float, float]
+
+
+def _validate_exact_config(config: MatchConfig) -> None:
+    _validate_match_config(config)
+    if config.streak.enabled or config.clutch.enabled:
+        raise ValueError(
+            "Exact probabilities require independent points (streak and clutch disabled)."
+        )
+
+
+def _ruin_win_probability(p: float, lead: int, margin: int) -> float:
+    """P(reaching +margin before -margin) for a +/-1 walk starting at ``lead``."""
+    q = 1.0 - p
+    if p < q:
+        return 1.0 - _ruin_win_probability(q, -lead, margin)
+    if p - q < _FAIR_TOLERANCE:
+        return (lead + margin) / (2 * margin)
+    ratio = q / p
+    return (1.0 - ratio ** (lead + margin)) / (1.0 - ratio ** (2 * margin))
+
+
+def _ruin_expected_steps(p: float, lead: int, margin: int) -> float:
+    """Expected steps for a +/-1 walk starting at ``lead`` to hit +/-margin."""
+    q = 1.0 - p
+    if p < q:
+        return _ruin_expected_steps(q, -lead, margin)
+    start = lead + margin
+    width = 2 * margin
+    if p - q < _FAIR_TOLERANCE:
+        return float(start * (width - start))
+    ratio = q / p
+    return (width - start) / (p - q) - width / (p - q) * (
+        1.0 - (1.0 - ratio**start) / (1.0 - ratio**width)
+    )
+
+
+def _race_win_probability(p: float, target: int, margin: int) -> float:
+    """P(P1 first reaches ``target`` points with a lead of ``margin``)."""
+    memo: dict[tuple[int, int], float] = {}
+
+    def solve(p1_points: int, p2_points: int) -> float:
+        if p1_points >= target and p1_points - p2_points >= margin:
+            return 1.0
+        if p2_points >= target and p2_points - p1_points >= margin:
+            return 0.0
+        # Past this line only the lead matters: the race is a gambler's ruin.
+        if min(p1_points, p2_points) >= target - margin:
+            return _ruin_win_probability(p, p1_points - p2_points, margin)
+        key = (p1_points, p2_points)
+        if key not in memo:
+            memo[key] = p * solve(p1_points + 1, p2_points) + (1.0 - p) * solve(
+                p1_points, p2_points + 1
+            )
+        return memo[key]
+
+    return solve(0, 0)
+
+
+def _expected_standard_game_reward(
+    p: float, reward: Callable[[int, int], float]
+) -> float:
+    """Expected total ``reward(p1_points, p2_points)`` over the points of a standard game."""
+    q = 1.0 - p
+    deuce_reward = reward(3, 3)
+    p1_advantage_reward = reward(4, 3)
+    p2_advantage_reward = reward(3, 4)
+    deuce_value = (deuce_reward + p * p1_advantage_reward + q * p2_advantage_reward) / (
+        1.0 - 2.0 * p * q
+    )
+    memo: dict[tuple[int, int], float] = {}
+
+    def solve(p1_points: int, p2_points: int) -> float:
+        if p1_points >= 4 and p1_points - p2_points >= 2:
+            return 0.0
+        if p2_points >= 4 and p2_points - p1_points >= 2:
+            return 0.0
+        if p1_points == 3 and p2_points == 3:
+            return deuce_value
+        key = (p1_points, p2_points)
+        if key not in memo:
+            memo[key] = (
+                reward(p1_points, p2_points)
+                + p * solve(p1_points + 1, p2_points)
+                + q * solve(p1_points, p2_points + 1)
+            )
+        return memo[key]
+
+    return solve(0, 0)
+
+
+def _is_p1_game_point(p1_points: int, p2_points: int) -> bool:
+    return p1_points + 1 >= 4 and p1_points + 1 - p2_points >= 2
+
+
+def _is_p2_game_point(p1_points: int, p2_points: int) -> bool:
+    return p2_points + 1 >= 4 and p2_points + 1 - p1_points >= 2
+
+
+def _set_outcomes(
+    config: MatchConfig, game_probability: float, tiebreak_probability: float
+) -> dict[bool, _SetOutcome]:
+    """Outcome distribution of a set for each first server, as a game-level Markov chain."""
+    target = config.games_to_win_set
+    margin = config.set_win_margin
+    memo: dict[tuple[int, int, bool], _SetOutcome] = {}
+
+    def finished(p1_won: bool, p1_serving_next: bool) -> _SetOutcome:
+        return (
+            float(p1_won and p1_serving_next),
+            float(p1_won and not p1_serving_next),
+            float(not p1_won and p1_serving_next),
+            float(not p1_won and not p1_serving_next),
+            0.0,
+            0.0,
+        )
+
+    def after_game(p1_games: int, p2_games: int, p1_serving: bool, tiebreak: bool) -> _SetOutcome:
+        if (
+            tiebreak
+            or (p1_games >= target and p1_games - p2_games >= margin)
+            or (p2_games >= target and p2_games - p1_games >= margin)
+        ):
+            return finished(p1_games > p2_games, p1_serving)
+        return solve(p1_games, p2_games, p1_serving)
+
+    def solve(p1_games: int, p2_games: int, p1_serving: bool) -> _SetOutcome:
+        key = (p1_games, p2_games, p1_serving)
+        if key in memo:
+            return memo[key]
+
+        if p1_games == config.tiebreak_at and p2_games == config.tiebreak_at:
+            won = after_game(p1_games + 1, p2_games, not p1_serving, True)
+            lost = after_game(p1_games, p2_games + 1, not p1_serving, True)
+            probability = tiebreak_probability
+            service_games = 0.0
+            return_games = 0.0
+        elif (
+            min(p1_games, p2_games) >= target - margin
+            and max(p1_games, p2_games) > config.tiebreak_at
+        ):
+            # No tiebreak is reachable any more: the rest of the set is a gambler's ruin on
+            # the game lead, and the number of remaining games has a fixed parity.
+            lead = p1_games - p2_games
+            win = _ruin_win_probability(game_probability, lead, margin)
+            games_left = _ruin_expected_steps(game_probability, lead, margin)
+            odd = (margin - lead) % 2
+            p1_serving_next = p1_serving != bool(odd)
+            served_by_first = (games_left + odd) / 2.0
+            served_by_second = games_left - served_by_first
+            outcome = (
+                win if p1_serving_next else 0.0,
+                0.0 if p1_serving_next else win,
+                (1.0 - win) if p1_serving_next else 0.0,
+                0.0 if p1_serving_next else (1.0 - win),
+                served_by_first if p1_serving else served_by_second,
+                served_by_second if p1_serving else served_by_first,
+            )
+            memo[key] = outcome
+            return outcome
+        else:
+            won = after_game(p1_games + 1, p2_games, not p1_serving, False)
+            lost = after_game(p1_games, p2_games + 1, not p1_serving, False)
+            probability = game_probability
+            service_games = 1.0 if p1_serving else 0.0
+            return_games = 0.0 if p1_serving else 1.0
+
+        outcome = tuple(
+            probability * won_value + (1.0 - probability) * lost_value
+            for won_value, lost_value in zip(won, lost)
+        )
+        outcome = outcome[:4] + (outcome[4] + service_games, outcome[5] + return_games)
+        memo[key] = outcome
+        return outcome
+
+    return {True: solve(0, 0, True), False: solve(0, 0, False)}
+
+
+def _match_solution(config: MatchConfig) -> tuple[float, float, float, float]:
+    """Return (set win rate, match win rate, expected p1 service games, expected p1 return games)."""
+    p = config.p1_point_win_probability
+    game_probability = _race_win_probability(p, 4, 2)
+    tiebreak_probability = _race_win_probability(
+        p, config.tiebreak_points_to_win, config.tiebreak_win_margin
+    )
+    set_outcomes = _set_outcomes(config, game_probability, tiebreak_probability)
+    sets_needed = config.best_of_sets // 2 + 1
+    memo: dict[tuple[int, int, bool], tuple[float, float, float]] = {}
+
+    def solve(p1_sets: int, p2_sets: int, p1_serving: bool) -> tuple[float, float, float]:
+        if p1_sets == sets_needed:
+            return 1.0, 0.0, 0.0
+        if p2_sets == sets_needed:
+            return 0.0, 0.0, 0.0
+        key = (p1_sets, p2_sets, p1_serving)
+        if key not in memo:
+            outcome = set_outcomes[p1_serving]
+            branches = (
+                (outcome[0], solve(p1_sets + 1, p2_sets, True)),
+                (outcome[1], solve(p1_sets + 1, p2_sets, False)),
+                (outcome[2], solve(p1_sets, p2_sets + 1, True)),
+                (outcome[3], solve(p1_sets, p2_sets + 1, False)),
+            )
+            memo[key] = (
+                sum(weight * result[0] for weight, result in branches),
+                outcome[4] + sum(weight * result[1] for weight, result in branches),
+                outcome[5] + sum(weight * result[2] for weight, result in branches),
+            )
+        return memo[key]
+
+    # simulate_match picks the first server with a fair coin.
+    serving_first = solve(0, 0, True)
+    returning_first = solve(0, 0, False)
+    set_win_rate = 0.5 * (sum(set_outcomes[True][:2]) + sum(set_outcomes[False][:2]))
+    return (
+        set_win_rate,
+        0.5 * (serving_first[0] + returning_first[0]),
+        0.5 * (serving_first[1] + returning_first[1]),
+        0.5 * (serving_first[2] + returning_first[2]),
+    )
+
+
+def exact_game_win_rate(
+    p1_point_win_probability: float, config: MatchConfig | None = None
+) -> float:
+    if not 0.0 <= p1_point_win_probability <= 1.0:
+        raise ValueError("p1_point_win_probability must be between 0 and 1.")
+    if config is not None:
+        _validate_exact_config(config)
+    return _race_win_probability(p1_point_win_probability, 4, 2)
+
+
+def exact_tiebreak_win_rate(config: MatchConfig) -> float:
+    _validate_exact_config(config)
+    return _race_win_probability(
+        config.p1_point_win_probability,
+        config.tiebreak_points_to_win,
+        config.tiebreak_win_margin,
+    )
+
+
+def exact_set_win_rate(config: MatchConfig) -> float:
+    _validate_exact_config(config)
+    set_win_rate, _, _, _ = _match_solution(config)
+    return set_win_rate
+
+
+def exact_match_win_rate(config: MatchConfig) -> float:
+    _validate_exact_config(config)
+    _, match_win_rate, _, _ = _match_solution(config)
+    return match_win_rate
+
+
+def exact_match_profile(config: MatchConfig) -> tuple[float, BreakPointMetrics]:
+    _validate_exact_config(config)
+    p = config.p1_point_win_probability
+    _, match_win_rate, service_games, return_games = _match_solution(config)
+
+    # Points inside a game do not depend on how the match got there, so per-match counts
+    # are expected games of each kind times expected break points per game.
+    earned = _expected_standard_game_reward(p, lambda a, b: float(_is_p1_game_point(a, b)))
+    faced = _expected_standard_game_reward(p, lambda a, b: float(_is_p2_game_point(a, b)))
+    earned_per_match = return_games * earned
+    converted_per_match = earned_per_match * p
+    faced_per_match = service_games * faced
+    saved_per_match = faced_per_match * p
+
+    metrics = BreakPointMetrics(
+        p1_break_points_earned_per_match=earned_per_match,
+        p1_break_points_converted_per_match=converted_per_match,
+        p1_break_points_faced_per_match=faced_per_match,
+        p1_break_points_saved_per_match=saved_per_match,
+        p1_break_point_conversion_rate=p if earned_per_match > 0 else 0.0,
+        p1_break_point_save_rate=p if faced_per_match > 0 else 0.0,
+    )
+    return match_win_rate, metrics
+
+
+def exact_break_point_metrics(config: MatchConfig) -> BreakPointMetrics:
+    _, metrics = exact_match_profile(config)
+    return metrics
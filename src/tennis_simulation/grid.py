@@ -0,0 +1,277 @@
+import itertools
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+
+from .cache import ResultCache
+from .config import ClutchConfig, MatchConfig, StreakConfig
+from .sweep import (
+    ALL_METRIC,
+    GAME_METRIC,
+    MATCH_METRIC,
+    SET_METRIC,
+    SweepJob,
+    append_checkpoint,
+    compute_job,
+    load_checkpoint,
+)
+
+# Grid parameter name -> (MatchConfig section, field); None is MatchConfig itself.
+GRID_PARAMETERS = {
+    "p": (None, "p1_point_win_probability"),
+    "streak_intensity": ("streak", "intensity"),
+    "streak_decay": ("streak", "decay"),
+    "streak_momentum_step": ("streak", "momentum_step"),
+    "clutch_primary_boost": ("clutch", "primary_boost"),
+    "clutch_secondary_boost": ("clutch", "secondary_boost"),
+}
+
+# Game, set and match jobs of a config concatenate to these values in both modes.
+VALUE_COLUMNS = (
+    "game_win_rate",
+    "set_win_rate",
+    "match_win_rate",
+    "p1_break_points_earned_per_match",
+    "p1_break_points_converted_per_match",
+    "p1_break_points_faced_per_match",
+    "p1_break_points_saved_per_match",
+    "p1_break_point_conversion_rate",
+    "p1_break_point_save_rate",
+)
+
+
+@dataclass(frozen=True)
+class GridParameter:
+    name: str
+    low: float
+    high: float
+    # Evenly spaced grid levels from low to high, unless ``values`` lists them.
+    levels: int = 1
+    values: tuple[float, ...] = ()
+
+    def grid_values(self) -> list[float]:
+        if self.values:
+            return list(self.values)
+        if self.levels == 1:
+            return [self.low]
+        step = (self.high - self.low) / (self.levels - 1)
+        return [round(self.low + i * step, 10) for i in range(self.levels)]
+
+
+def parse_parameter(text: str) -> GridParameter:
+    """``name=low:high:levels``, ``name=low:high`` (Latin hypercube bounds), ``name=a,b,c``
+    or ``name=value``."""
+    name, separator, spec = text.partition("=")
+    name = name.strip()
+    if not separator or name not in GRID_PARAMETERS:
+        raise ValueError(
+            f"Expected NAME=SPEC with NAME one of {', '.join(GRID_PARAMETERS)}: {text!r}"
+        )
+    if ":" in spec:
+        parts = [float(part) for part in spec.split(":")]
+        if len(parts) not in (2, 3):
+            raise ValueError(f"Expected low:high or low:high:levels: {text!r}")
+        levels = int(parts[2]) if len(parts) == 3 else 2
+        if levels < 1:
+            raise ValueError(f"levels must be at least 1: {text!r}")
+        return GridParameter(name, parts[0], parts[1], levels)
+    values = tuple(float(part) for part in spec.split(","))
+    return GridParameter(name, min(values), max(values), len(values), values)
+
+
+def grid_points(parameters: list[GridParameter]) -> list[dict[str, float]]:
+    """Every combination of the parameters' levels, the last parameter varying fastest."""
+    names = [parameter.name for parameter in parameters]
+    return [
+        dict(zip(names, combination))
+        for combination in itertools.product(*(p.grid_values() for p in parameters))
+    ]
+
+
+def latin_hypercube_points(
+    parameters: list[GridParameter], n_points: int, seed: int | None = None
+) -> list[dict[str, float]]:
+    """``n_points`` points with each parameter's [low, high] cut into ``n_points`` equal
+    strata and every stratum used exactly once (at a random position within it)."""
+    if n_points <= 0:
+        raise ValueError("n_points must be greater than 0.")
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for parameter in parameters:
+        strata = rng.permutation(n_points) + rng.random(n_points)
+        columns[parameter.name] = (
+            parameter.low + strata / n_points * (parameter.high - parameter.low)
+        )
+    return [
+        {name: float(column[i]) for name, column in columns.items()} for i in range(n_points)
+    ]
+
+
+def grid_config(template: MatchConfig, point: dict[str, float]) -> MatchConfig:
+    """``template`` with the point's parameters applied.
+
+    Naming a streak (clutch) parameter enables streak (clutch). Settings that cannot change
+    any point probability are normalized away, so e.g. every decay at intensity 0 maps to
+    the same config: streak with intensity 0, or clutch with both boosts 0, becomes the
+    default (disabled) section.
+    """
+    sections = {"streak": {}, "clutch": {}}
+    top_level = {}
+    for name, value in point.items():
+        section, field_name = GRID_PARAMETERS[name]
+        (top_level if section is None else sections[section])[field_name] = value
+    streak = template.streak
+    if sections["streak"]:
+        streak = replace(streak, enabled=True, **sections["streak"])
+    if not streak.enabled or streak.intensity == 0.0:
+        streak = StreakConfig()
+    clutch = template.clutch
+    if sections["clutch"]:
+        clutch = replace(clutch, enabled=True, **sections["clutch"])
+    if not clutch.enabled or (clutch.primary_boost == 0.0 and clutch.secondary_boost == 0.0):
+        clutch = ClutchConfig()
+    return replace(template, streak=streak, clutch=clutch, **top_level)
+
+
+def grid_jobs(
+    config: MatchConfig,
+    index: int,
+    games: int,
+    sets: int,
+    matches: int,
+    seed: int,
+    method: str = "monte-carlo",
+    engine: str = "scalar",
+    single_pass: bool = False,
+) -> list[SweepJob]:
+    """The sweep jobs of one config. Every config uses the same seeds (common random
+    numbers), so a job's checkpoint key only depends on the config."""
+    if single_pass:
+        return [
+            SweepJob(index, ALL_METRIC, config, matches, seed + 2, method, engine)
+        ]
+    metrics = [(GAME_METRIC, games), (SET_METRIC, sets), (MATCH_METRIC, matches)]
+    return [
+        SweepJob(index, metric, config, samples, seed + offset, method, engine)
+        for offset, (metric, samples) in enumerate(metrics)
+    ]
+
+
+def _compute_config_jobs(
+    jobs: list[SweepJob], cache: ResultCache | None
+) -> list[list[float]]:
+    # One task per config, so its jobs share the worker's context tables and solver caches.
+    return [compute_job(job, cache) for job in jobs]
+
+
+def open_grid_columns(
+    directory: Path, names: list[str], n_points: int
+) -> dict[str, np.memmap]:
+    """One float64 ``<name>.npy`` per column, NaN until written, plus ``columns.txt``."""
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "columns.txt").write_text(
+        "".join(f"{name}\n" for name in names), encoding="utf-8"
+    )
+    columns = {}
+    for name in names:
+        column = np.lib.format.open_memmap(
+            directory / f"{name}.npy", mode="w+", dtype=np.float64, shape=(n_points,)
+        )
+        column[:] = np.nan
+        columns[name] = column
+    return columns
+
+
+def load_grid_columns(directory: Path) -> dict[str, np.memmap]:
+    """The columns of a grid sweep, in ``columns.txt`` order, memory-mapped read-only."""
+    names = (directory / "columns.txt").read_text(encoding="utf-8").split()
+    return {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in names}
+
+
+def run_grid(
+    points: list[dict[str, float]],
+    template: MatchConfig,
+    output: Path,
+    games: int,
+    sets: int,
+    matches: int,
+    seed: int,
+    method: str = "monte-carlo",
+    engine: str = "scalar",
+    single_pass: bool = False,
+    workers: int = 1,
+    checkpoint: Path | None = None,
+    cache: ResultCache | None = None,
+) -> dict[str, np.memmap]:
+    """Simulate every point and stream its values into columns under ``output``.
+
+    Points that map to the same config (see ``grid_config``) are simulated once. Each
+    config's values are written to every one of its rows as soon as its jobs finish, and
+    appended to ``checkpoint`` so an interrupted grid resumes where it stopped.
+    """
+    if workers <= 0:
+        raise ValueError("workers must be greater than 0.")
+    if not points:
+        raise ValueError("At least one point is required.")
+
+    configs = [grid_config(template, point) for point in points]
+    rows_by_config: dict[MatchConfig, list[int]] = {}
+    for row, config in enumerate(configs):
+        rows_by_config.setdefault(config, []).append(row)
+    groups = [
+        grid_jobs(config, index, games, sets, matches, seed, method, engine, single_pass)
+        for index, config in enumerate(rows_by_config)
+    ]
+
+    parameter_names = list(points[0])
+    columns = open_grid_columns(output, parameter_names + list(VALUE_COLUMNS), len(points))
+    for name in parameter_names:
+        columns[name][:] = [point[name] for point in points]
+
+    def write(jobs: list[SweepJob], values: list[list[float]]) -> None:
+        row_values = [value for job_values in values for value in job_values]
+        rows = rows_by_config[jobs[0].config]
+        for name, value in zip(VALUE_COLUMNS, row_values):
+            columns[name][rows] = value
+
+    done = load_checkpoint(checkpoint) if checkpoint is not None else {}
+    pending = []
+    for jobs in groups:
+        if all(job.key() in done for job in jobs):
+            write(jobs, [done[job.key()] for job in jobs])
+        else:
+            pending.append(jobs)
+
+    checkpoint_file = None
+    if checkpoint is not None:
+        checkpoint.parent.mkdir(parents=True, exist_ok=True)
+        checkpoint_file = checkpoint.open("a", encoding="utf-8")
+
+    def record(jobs: list[SweepJob], values: list[list[float]]) -> None:
+        write(jobs, values)
+        if checkpoint_file is not None:
+            for job, job_values in zip(jobs, values):
+                append_checkpoint(checkpoint_file, job, job_values)
+
+    try:
+        if workers == 1:
+            for jobs in pending:
+                record(jobs, _compute_config_jobs(jobs, cache))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(_compute_config_jobs, jobs, cache): jobs
+                    for jobs in pending
+                }
+                while futures:
+                    finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        record(futures.pop(future), future.result())
+    finally:
+        if checkpoint_file is not None:
+            checkpoint_file.close()
+        for column in columns.values():
+            column.flush()
+    return columns
@@ -0,0 +1,206 @@
+import math
+from dataclasses import dataclass
+
+from .config import MatchConfig
+from .engine import (
+    _sample_rngs,
+    _sample_seeds,
+    _simulate_standard_game,
+    _validate_match_config,
+    simulate_match,
+    simulate_set,
+)
+from .events import get_context_table
+from .policies import ProbabilityPolicy, build_policy
+from .state import PointContext
+
+
+@dataclass(frozen=True)
+class ImportanceEstimate:
+    estimate: float
+    standard_error: float
+    samples: int
+    # (sum of weights)^2 / sum of squared weights over all samples.
+    effective_sample_size: float
+    tilt: float
+
+
+def tilted_probability(probability: float, tilt: float) -> float:
+    """``probability`` with its log-odds shifted by ``tilt``; 0 and 1 are left as they are."""
+    if probability <= 0.0 or probability >= 1.0:
+        return probability
+    return 1.0 / (1.0 + math.exp(-(math.log(probability / (1.0 - probability)) + tilt)))
+
+
+def default_tilt(config: MatchConfig) -> float:
+    """Log-odds shift that makes the base point probability a fair coin."""
+    probability = config.p1_point_win_probability
+    if probability <= 0.0 or probability >= 1.0:
+        return 0.0
+    return -math.log(probability / (1.0 - probability))
+
+
+class ImportanceSamplingPolicy(ProbabilityPolicy):
+    """Plays ``inner``'s points at a tilted probability and tracks the likelihood ratio.
+
+    ``weight`` is the product over the points since ``reset_match`` of
+    P(outcome | inner) / P(outcome | tilted), so weighting each sample by it gives unbiased
+    estimates under ``inner``.
+    """
+
+    def __init__(self, inner: ProbabilityPolicy, tilt: float) -> None:
+        self.inner = inner
+        self.tilt = tilt
+        self.weight = 1.0
+        self._probability = 0.0
+        self._tilted = 0.0
+
+    @property
+    def context_fields(self) -> frozenset[str] | None:
+        return self.inner.context_fields
+
+    def reset_match(self) -> None:
+        self.weight = 1.0
+        self.inner.reset_match()
+
+    def point_probability(self, context: PointContext) -> float:
+        probability = self.inner.point_probability(context)
+        self._probability = probability
+        self._tilted = tilted_probability(probability, self.tilt)
+        return self._tilted
+
+    def on_point_end(self, context: PointContext, p1_won_point: bool) -> None:
+        if p1_won_point:
+            self.weight *= self._probability / self._tilted
+        else:
+            self.weight *= (1.0 - self._probability) / (1.0 - self._tilted)
+        self.inner.on_point_end(context, p1_won_point)
+
+
+class _WeightedOutcomes:
+    def __init__(self) -> None:
+        self.samples = 0
+        self.weight_sum = 0.0
+        self.weight_square_sum = 0.0
+        # Weighted sums of the P1-won and P2-won indicators and their squares.
+        self.p1_sum = 0.0
+        self.p1_square_sum = 0.0
+        self.p2_sum = 0.0
+        self.p2_square_sum = 0.0
+
+    def record(self, weight: float, p1_won: bool) -> None:
+        self.samples += 1
+        self.weight_sum += weight
+        self.weight_square_sum += weight * weight
+        if p1_won:
+            self.p1_sum += weight
+            self.p1_square_sum += weight * weight
+        else:
+            self.p2_sum += weight
+            self.p2_square_sum += weight * weight
+
+    def estimate(self, tilt: float) -> ImportanceEstimate:
+        """P1 win probability, estimated from the outcome the tilt favours: P1 wins for
+        tilt >= 0 (P1 is the underdog), otherwise one minus the weighted P2 wins."""
+        n = self.samples
+        if tilt >= 0.0:
+            mean = self.p1_sum / n
+            square_mean = self.p1_square_sum / n
+            estimate = mean
+        else:
+            mean = self.p2_sum / n
+            square_mean = self.p2_square_sum / n
+            estimate = 1.0 - mean
+        variance = max(0.0, square_mean - mean * mean)
+        effective = 0.0
+        if self.weight_square_sum > 0.0:
+            effective = self.weight_sum * self.weight_sum / self.weight_square_sum
+        return ImportanceEstimate(
+            estimate=min(1.0, max(0.0, estimate)),
+            standard_error=math.sqrt(variance / n),
+            samples=n,
+            effective_sample_size=effective,
+            tilt=tilt,
+        )
+
+
+def _resolve_tilt(config: MatchConfig, tilt: float | None) -> float:
+    return default_tilt(config) if tilt is None else tilt
+
+
+def importance_game_win_rate(
+    config: MatchConfig,
+    n_games: int,
+    seed: int | None = None,
+    tilt: float | None = None,
+) -> ImportanceEstimate:
+    """estimate_game_win_rate's quantity, sampled at log-odds + ``tilt`` (default: fair)."""
+    if n_games <= 0:
+        raise ValueError("n_games must be greater than 0.")
+    _validate_match_config(config)
+    tilt = _resolve_tilt(config, tilt)
+    table = get_context_table(config)
+    outcomes = _WeightedOutcomes()
+    for rng in _sample_rngs(seed, n_games):
+        policy = ImportanceSamplingPolicy(build_policy(config), tilt)
+        policy.reset_match()
+        winner = _simulate_standard_game(
+            policy=policy,
+            config=config,
+            rng=rng,
+            p1_sets=0,
+            p2_sets=0,
+            p1_games=0,
+            p2_games=0,
+            p1_serving=True,
+            context_table=table,
+        )
+        outcomes.record(policy.weight, winner == 1)
+    return outcomes.estimate(tilt)
+
+
+def importance_set_win_rate(
+    config: MatchConfig,
+    n_sets: int,
+    seed: int | None = None,
+    tilt: float | None = None,
+) -> ImportanceEstimate:
+    if n_sets <= 0:
+        raise ValueError("n_sets must be greater than 0.")
+    _validate_match_config(config)
+    tilt = _resolve_tilt(config, tilt)
+    table = get_context_table(config)
+    outcomes = _WeightedOutcomes()
+    for rng in _sample_rngs(seed, n_sets):
+        policy = ImportanceSamplingPolicy(build_policy(config), tilt)
+        policy.reset_match()
+        # The first server is a fair coin under both measures, so it carries no weight.
+        p1_serving = rng.random() < 0.5
+        set_winner, _, _, _ = simulate_set(
+            config=config,
+            rng=rng,
+            policy=policy,
+            p1_serving_first_game=p1_serving,
+            context_table=table,
+        )
+        outcomes.record(policy.weight, set_winner == 1)
+    return outcomes.estimate(tilt)
+
+
+def importance_match_win_rate(
+    config: MatchConfig,
+    n_matches: int,
+    seed: int | None = None,
+    tilt: float | None = None,
+) -> ImportanceEstimate:
+    """P1 match win probability from matches seeded as run_monte_carlo, played tilted."""
+    if n_matches <= 0:
+        raise ValueError("n_matches must be greater than 0.")
+    _validate_match_config(config)
+    tilt = _resolve_tilt(config, tilt)
+    outcomes = _WeightedOutcomes()
+    policy = ImportanceSamplingPolicy(build_policy(config), tilt)
+    for match_seed, _ in _sample_seeds(seed, n_matches):
+        result = simulate_match(config=config, seed=match_seed, policy=policy)
+        outcomes.record(policy.weight, result.winner == "Player 1")
+    return outcomes.estimate(tilt)
@@ -0,0 +1,176 @@
+import math
+from functools import lru_cache
+
+from .config import MatchConfig
+from .events import get_context_table
+from .solver import MatchStateSolver, get_match_solver
+from .state import MatchState
+
+
+class InPlayTable:
+    """P1 match-win probability for every reachable live score, in one flat array.
+
+    Built once from a ``MatchStateSolver``; a lookup folds the score (long deuces, tiebreaks
+    and advantage sets) and indexes the array, so it costs the same at any score.
+    """
+
+    def __init__(self, config: MatchConfig, solver: MatchStateSolver | None = None) -> None:
+        solver = solver if solver is not None else get_match_solver(config)
+        table = get_context_table(config)
+        self.config = config
+        self.sets_needed = config.best_of_sets // 2 + 1
+        self.standard_floor = table.standard_floor
+        self.tiebreak_floor = table.tiebreak_floor
+        self.games_floor = table.games_floor
+        self.games_size = table.games_floor + config.set_win_margin
+        self.points_size = max(
+            table.standard_floor + 2, table.tiebreak_floor + config.tiebreak_win_margin
+        )
+
+        size = self.sets_needed**2 * self.games_size**2 * 2 * self.points_size**2
+        self.values = [math.nan] * size
+        for key, points in solver.match_win_probabilities().items():
+            p1_sets, p2_sets, p1_games, p2_games, p1_serving = key
+            for (p1_points, p2_points), probability in points.items():
+                index = self._index(
+                    p1_sets, p2_sets, p1_games, p2_games, p1_serving, p1_points, p2_points
+                )
+                self.values[index] = probability
+        self._array = None
+
+    def _index(
+        self,
+        p1_sets: int,
+        p2_sets: int,
+        p1_games: int,
+        p2_games: int,
+        p1_serving: bool,
+        p1_points: int,
+        p2_points: int,
+    ) -> int:
+        index = p1_sets * self.sets_needed + p2_sets
+        index = (index * self.games_size + p1_games) * self.games_size + p2_games
+        index = index * 2 + p1_serving
+        return (index * self.points_size + p1_points) * self.points_size + p2_points
+
+    def win_probability(
+        self,
+        state: MatchState,
+        p1_points: int = 0,
+        p2_points: int = 0,
+        p1_serving: bool = True,
+        in_tiebreak: bool | None = None,
+    ) -> float:
+        """P1's match-win probability from a live score; raises ValueError if it is not one."""
+        config = self.config
+        tiebreak = state.p1_games == config.tiebreak_at and state.p2_games == config.tiebreak_at
+        if in_tiebreak is not None and in_tiebreak != tiebreak:
+            raise ValueError("in_tiebreak does not match the game score.")
+        sets_needed = self.sets_needed
+        if not (0 <= state.p1_sets < sets_needed and 0 <= state.p2_sets < sets_needed):
+            raise ValueError("Set score is not a live score.")
+        if min(state.p1_games, state.p2_games, p1_points, p2_points) < 0:
+            raise ValueError("Scores must not be negative.")
+
+        p1_games = state.p1_games
+        p2_games = state.p2_games
+        shift = min(p1_games, p2_games) - self.games_floor
+        if shift > 0:
+            p1_games -= shift
+            p2_games -= shift
+        floor = self.tiebreak_floor if tiebreak else self.standard_floor
+        shift = min(p1_points, p2_points) - floor
+        if shift > 0:
+            p1_points -= shift
+            p2_points -= shift
+
+        probability = math.nan
+        in_range = max(p1_games, p2_games) < self.games_size
+        if in_range and max(p1_points, p2_points) < self.points_size:
+            probability = self.values[
+                self._index(
+                    state.p1_sets,
+                    state.p2_sets,
+                    p1_games,
+                    p2_games,
+                    p1_serving,
+                    p1_points,
+                    p2_points,
+                )
+            ]
+        if math.isnan(probability):
+            raise ValueError("Score is not reachable in a live match.")
+        return probability
+
+    def win_probabilities(
+        self, p1_sets, p2_sets, p1_games, p2_games, p1_points, p2_points, p1_serving
+    ):
+        """Vectorized ``win_probability`` over array-likes (requires numpy).
+
+        Scores that are not live (finished games, sets or matches) come back as NaN.
+        """
+        import numpy as np
+
+        if self._array is None:
+            self._array = np.asarray(self.values)
+        p1_sets, p2_sets, p1_games, p2_games, p1_points, p2_points = (
+            np.asarray(values, dtype=np.int64)
+            for values in (p1_sets, p2_sets, p1_games, p2_games, p1_points, p2_points)
+        )
+        p1_serving = np.asarray(p1_serving, dtype=bool)
+
+        tiebreak = (p1_games == self.config.tiebreak_at) & (p2_games == self.config.tiebreak_at)
+        shift = np.maximum(np.minimum(p1_games, p2_games) - self.games_floor, 0)
+        p1_games = p1_games - shift
+        p2_games = p2_games - shift
+        floor = np.where(tiebreak, self.tiebreak_floor, self.standard_floor)
+        shift = np.maximum(np.minimum(p1_points, p2_points) - floor, 0)
+        p1_points = p1_points - shift
+        p2_points = p2_points - shift
+
+        valid = (
+            (p1_sets >= 0)
+            & (p1_sets < self.sets_needed)
+            & (p2_sets >= 0)
+            & (p2_sets < self.sets_needed)
+            & (np.minimum(p1_games, p2_games) >= 0)
+            & (np.maximum(p1_games, p2_games) < self.games_size)
+            & (np.minimum(p1_points, p2_points) >= 0)
+            & (np.maximum(p1_points, p2_points) < self.points_size)
+        )
+        index = self._index(
+            np.where(valid, p1_sets, 0),
+            np.where(valid, p2_sets, 0),
+            np.where(valid, p1_games, 0),
+            np.where(valid, p2_games, 0),
+            np.where(valid, p1_serving, False).astype(np.int64),
+            np.where(valid, p1_points, 0),
+            np.where(valid, p2_points, 0),
+        )
+        return np.where(valid, self._array[index], np.nan)
+
+
+@lru_cache(maxsize=32)
+def get_in_play_table(config: MatchConfig) -> InPlayTable:
+    return InPlayTable(config)
+
+
+def in_play_win_probability(
+    config: MatchConfig,
+    state: MatchState,
+    p1_points: int = 0,
+    p2_points: int = 0,
+    p1_serving: bool = True,
+    in_tiebreak: bool | None = None,
+) -> float:
+    return get_in_play_table(config).win_probability(
+        state, p1_points, p2_points, p1_serving, in_tiebreak
+    )
+
+
+def in_play_win_probabilities(
+    config: MatchConfig, p1_sets, p2_sets, p1_games, p2_games, p1_points, p2_points, p1_serving
+):
+    return get_in_play_table(config).win_probabilities(
+        p1_sets, p2_sets, p1_games, p2_games, p1_points, p2_points, p1_serving
+    )
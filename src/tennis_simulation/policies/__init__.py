@@ -1,13 +1,19 @@
-from .base import ProbabilityPolicy
+from .base import CLUTCH_CONTEXT_FIELDS, NO_CONTEXT_FIELDS, ProbabilityPolicy
 from .clutch import ClutchPolicy
 from .combined import build_policy
+from .fused import FusedPolicy, fuse_policy, fused_policy
 from .independent import IndependentPolicy
 from .streakiness import StreakinessPolicy
 
 __all__ = [
+    "CLUTCH_CONTEXT_FIELDS",
+    "NO_CONTEXT_FIELDS",
     "ProbabilityPolicy",
     "ClutchPolicy",
+    "FusedPolicy",
     "IndependentPolicy",
     "StreakinessPolicy",
     "build_policy",
+    "fuse_policy",
+    "fused_policy",
 ]
@@ -7,7 +7,17 @@ def clamp_probability(value: float) -> float:
     return max(0.0, min(1.0, value))
 
 
+# context_fields of a policy that ignores the score entirely.
+NO_CONTEXT_FIELDS: frozenset[str] = frozenset()
+CLUTCH_CONTEXT_FIELDS = frozenset({"is_primary_clutch", "is_secondary_clutch"})
+
+
 class ProbabilityPolicy(ABC):
+    # PointContext fields point_probability and on_point_end read; None means any of them.
+    # A policy declaring NO_CONTEXT_FIELDS may be handed None instead of a context, which
+    # lets the engine skip context lookups altogether.
+    context_fields: frozenset[str] | None = None
+
     @abstractmethod
     def point_probability(self, context: PointContext) -> float:
         """Return P(Player 1 wins next point) for this context."""
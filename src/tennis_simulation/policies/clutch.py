@@ -1,6 +1,6 @@
 from ..config import ClutchConfig
 from ..state import PointContext
-from .base import ProbabilityPolicy, clamp_probability
+from .base import CLUTCH_CONTEXT_FIELDS, ProbabilityPolicy, clamp_probability
 
 
 class ClutchPolicy(ProbabilityPolicy):
@@ -8,6 +8,11 @@ class ClutchPolicy(ProbabilityPolicy):
         self.inner = inner
         self.config = config
 
+    @property
+    def context_fields(self) -> frozenset[str] | None:
+        inner_fields = self.inner.context_fields
+        return None if inner_fields is None else inner_fields | CLUTCH_CONTEXT_FIELDS
+
     def reset_match(self) -> None:
         self.inner.reset_match()
 
@@ -1,11 +1,19 @@
 from ..config import MatchConfig
 from .base import ProbabilityPolicy
 from .clutch import ClutchPolicy
+from .fused import fused_policy
 from .independent import IndependentPolicy
 from .streakiness import StreakinessPolicy
 
 
-def build_policy(config: MatchConfig) -> ProbabilityPolicy:
+def build_policy(config: MatchConfig, fused: bool = True) -> ProbabilityPolicy:
+    # A bare IndependentPolicy is already a single call; only wrapper chains gain from fusing.
+    if fused and (config.streak.enabled or config.clutch.enabled):
+        return fused_policy(
+            config.p1_point_win_probability,
+            streak=config.streak if config.streak.enabled else None,
+            clutch=config.clutch if config.clutch.enabled else None,
+        )
     policy: ProbabilityPolicy = IndependentPolicy(config.p1_point_win_probability)
     if config.streak.enabled:
         policy = StreakinessPolicy(policy, config.streak)
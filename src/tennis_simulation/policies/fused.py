@@ -0,0 +1,131 @@
+from ..config import ClutchConfig, StreakConfig
+from ..state import PointContext
+from .base import (
+    CLUTCH_CONTEXT_FIELDS,
+    NO_CONTEXT_FIELDS,
+    ProbabilityPolicy,
+    clamp_probability,
+)
+from .clutch import ClutchPolicy
+from .independent import IndependentPolicy
+from .streakiness import StreakinessPolicy
+
+
+class FusedPolicy(ProbabilityPolicy):
+    """Independent -> Streakiness -> Clutch flattened into one policy.
+
+    Produces exactly the same probabilities as the wrapper chain (same operations, same
+    order), with one call per hook instead of one per layer. Each combination of streak
+    and clutch has its own subclass, whose hooks read plain instance attributes, so
+    instances copy and pickle like the chain; ``fused_policy`` picks the right one. This
+    base class is the combination with neither.
+    """
+
+    has_streak = False
+    has_clutch = False
+
+    def __init__(
+        self,
+        base_probability: float,
+        streak: StreakConfig | None = None,
+        clutch: ClutchConfig | None = None,
+    ) -> None:
+        if (streak is not None) != self.has_streak or (clutch is not None) != self.has_clutch:
+            raise ValueError(
+                f"{type(self).__name__} does not fuse this streak/clutch combination; "
+                "use fused_policy."
+            )
+        self.base_probability = clamp_probability(base_probability)
+        self.streak = streak
+        self.clutch = clutch
+        self.context_fields = NO_CONTEXT_FIELDS if clutch is None else CLUTCH_CONTEXT_FIELDS
+        self.momentum = 0.0
+        if streak is not None:
+            self.intensity = streak.intensity
+            self.decay = streak.decay
+            self.momentum_step = streak.momentum_step
+        if clutch is not None:
+            self.primary_boost = clutch.primary_boost
+            self.secondary_boost = clutch.secondary_boost
+
+    def point_probability(self, context: PointContext) -> float:
+        return self.base_probability
+
+
+class _StreakMixin:
+    def reset_match(self) -> None:
+        self.momentum = 0.0
+
+    def on_point_end(self, context: PointContext, p1_won_point: bool) -> None:
+        direction = 1.0 if p1_won_point else -1.0
+        momentum = (self.momentum * self.decay) + (direction * self.momentum_step)
+        self.momentum = max(-1.0, min(1.0, momentum))
+
+
+class _FusedStreakPolicy(_StreakMixin, FusedPolicy):
+    has_streak = True
+
+    def point_probability(self, context: PointContext) -> float:
+        return max(0.0, min(1.0, self.base_probability + self.intensity * self.momentum))
+
+
+class _FusedClutchPolicy(FusedPolicy):
+    has_clutch = True
+
+    def point_probability(self, context: PointContext) -> float:
+        probability = self.base_probability
+        if context.is_primary_clutch:
+            probability += self.primary_boost
+        elif context.is_secondary_clutch:
+            probability += self.secondary_boost
+        return max(0.0, min(1.0, probability))
+
+
+class _FusedStreakClutchPolicy(_StreakMixin, FusedPolicy):
+    has_streak = True
+    has_clutch = True
+
+    def point_probability(self, context: PointContext) -> float:
+        probability = max(
+            0.0, min(1.0, self.base_probability + self.intensity * self.momentum)
+        )
+        if context.is_primary_clutch:
+            probability += self.primary_boost
+        elif context.is_secondary_clutch:
+            probability += self.secondary_boost
+        return max(0.0, min(1.0, probability))
+
+
+# (streak given, clutch given) -> specialized class.
+_VARIANTS = {
+    (False, False): FusedPolicy,
+    (True, False): _FusedStreakPolicy,
+    (False, True): _FusedClutchPolicy,
+    (True, True): _FusedStreakClutchPolicy,
+}
+
+
+def fused_policy(
+    base_probability: float,
+    streak: StreakConfig | None = None,
+    clutch: ClutchConfig | None = None,
+) -> FusedPolicy:
+    """The FusedPolicy subclass for whichever of ``streak`` and ``clutch`` are given."""
+    variant = _VARIANTS[streak is not None, clutch is not None]
+    return variant(base_probability, streak=streak, clutch=clutch)
+
+
+def fuse_policy(policy: ProbabilityPolicy) -> ProbabilityPolicy:
+    """Fuse a built-in wrapper chain; any other policy is returned unchanged."""
+    clutch = None
+    streak = None
+    current = policy
+    if type(current) is ClutchPolicy:
+        clutch = current.config
+        current = current.inner
+    if type(current) is StreakinessPolicy:
+        streak = current.config
+        current = current.inner
+    if type(current) is not IndependentPolicy:
+        return policy
+    return fused_policy(current.base_probability, streak=streak, clutch=clutch)
@@ -1,8 +1,10 @@
 from ..state import PointContext
-from .base import ProbabilityPolicy, clamp_probability
+from .base import NO_CONTEXT_FIELDS, ProbabilityPolicy, clamp_probability
 
 
 class IndependentPolicy(ProbabilityPolicy):
+    context_fields = NO_CONTEXT_FIELDS
+
     def __init__(self, base_probability: float) -> None:
         self.base_probability = clamp_probability(base_probability)
 
@@ -9,6 +9,10 @@ class StreakinessPolicy(ProbabilityPolicy):
         self.config = config
         self.momentum = 0.0
 
+    @property
+    def context_fields(self) -> frozenset[str] | None:
+        return self.inner.context_fields
+
     def reset_match(self) -> None:
         self.momentum = 0.0
         self.inner.reset_match()
@@ -0,0 +1,124 @@
+import math
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+
+from .config import MatchConfig
+from .engine import _validate_match_config
+from .tournament import Player, head_to_head_win_probability
+
+# Pairs filled per block when writing the matrix, to bound temporary arrays.
+_BLOCK_ROWS = 256
+
+
+def players_from_ratings(names: list[str], ratings: list[float]) -> list[Player]:
+    """Players whose rating is their point log-odds against a 0.5 (average) opponent."""
+    if len(names) != len(ratings):
+        raise ValueError("names and ratings must have the same length.")
+    return [
+        Player(name, 1.0 / (1.0 + math.exp(-rating))) for name, rating in zip(names, ratings)
+    ]
+
+
+@dataclass(frozen=True)
+class MatchWinCurve:
+    """P1 match win probability at increasing point win probabilities, linearly interpolated.
+
+    ``match_win_curve`` builds an even grid; ``head_to_head_matrix`` uses a draw's distinct
+    pair probabilities as the nodes.
+    """
+
+    point_probabilities: np.ndarray
+    match_win_probabilities: np.ndarray
+
+    def __call__(self, point_probabilities: np.ndarray) -> np.ndarray:
+        return np.interp(
+            point_probabilities, self.point_probabilities, self.match_win_probabilities
+        )
+
+
+def match_win_curve(
+    template: MatchConfig = MatchConfig(),
+    low: float = 0.0,
+    high: float = 1.0,
+    grid_points: int = 4001,
+    samples: int = 20000,
+    seed: int | None = 12345,
+) -> MatchWinCurve:
+    """Evaluate ``head_to_head_win_probability`` at ``grid_points`` evenly spaced values."""
+    if grid_points < 2:
+        raise ValueError("grid_points must be at least 2.")
+    if not 0.0 <= low < high <= 1.0:
+        raise ValueError("Need 0 <= low < high <= 1.")
+    _validate_match_config(template)
+    grid = np.linspace(low, high, grid_points)
+    values = np.array(
+        [
+            head_to_head_win_probability(
+                replace(template, p1_point_win_probability=float(p)), samples, seed
+            )
+            for p in grid
+        ]
+    )
+    return MatchWinCurve(grid, values)
+
+
+def _point_probabilities(log_odds: np.ndarray, rows: slice) -> np.ndarray:
+    """P(row player wins a point against column player) for a block of rows."""
+    return 1.0 / (1.0 + np.exp(log_odds[np.newaxis, :] - log_odds[rows, np.newaxis]))
+
+
+def pool_matrix(
+    players: list[Player],
+    template: MatchConfig = MatchConfig(),
+    grid_points: int = 4001,
+    samples: int = 20000,
+    seed: int | None = 12345,
+    path: Path | None = None,
+    curve: MatchWinCurve | None = None,
+) -> np.ndarray:
+    """All-pairs ``matrix[i, j]`` = P(players[i] beats players[j]).
+
+    Each pair is evaluated once, with the earlier-listed player as P1, by interpolating a
+    match win curve over the pool's range of point probabilities; the mirrored entry is
+    its complement. With ``path`` the matrix is written to a ``.npy`` file and returned
+    as a memory map of it.
+    """
+    n = len(players)
+    if n < 2:
+        raise ValueError("The pool needs at least two players.")
+    for player in players:
+        if not 0.0 < player.point_win_probability < 1.0:
+            raise ValueError(
+                f"{player.name}: point_win_probability must be strictly between 0 and 1."
+            )
+    probabilities = np.array([player.point_win_probability for player in players])
+    log_odds = np.log(probabilities / (1.0 - probabilities))
+    if curve is None:
+        spread = log_odds.max() - log_odds.min()
+        low = 1.0 / (1.0 + math.exp(spread))
+        curve = match_win_curve(template, low, 1.0 - low, grid_points, samples, seed)
+
+    if path is not None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        matrix = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(n, n))
+    else:
+        matrix = np.empty((n, n))
+    for start in range(0, n, _BLOCK_ROWS):
+        rows = slice(start, min(start + _BLOCK_ROWS, n))
+        # Upper triangle only (columns after each row); the lower one is mirrored below.
+        block = curve(_point_probabilities(log_odds, rows))
+        matrix[rows] = np.triu(block, k=start + 1)
+    lower = np.tril_indices(n, k=-1)
+    matrix[lower] = 1.0 - matrix.T[lower]
+    np.fill_diagonal(matrix, 0.5)
+    if path is not None:
+        matrix.flush()
+    return matrix
+
+
+def load_pool_matrix(path: Path) -> np.ndarray:
+    """A matrix written by ``pool_matrix(..., path=...)``, memory-mapped read-only."""
+    return np.load(path, mmap_mode="r")
@@ -0,0 +1,98 @@
+from dataclasses import dataclass, field
+
+# Pressure flags in bit order. A point counts under every flag its context carries;
+# "tiebreak" is any tiebreak point.
+PRESSURE_FLAGS = (
+    "break_point",
+    "set_point",
+    "match_point",
+    "tiebreak",
+    "primary_clutch",
+    "secondary_clutch",
+)
+# One slot per (flag combination, P1 serving, P1 won the point).
+PRESSURE_SLOTS = (1 << len(PRESSURE_FLAGS)) * 4
+
+
+def pressure_index(
+    p1_serving: bool,
+    is_break_point: bool,
+    is_set_point: bool,
+    is_match_point: bool,
+    in_tiebreak: bool,
+    is_primary_clutch: bool,
+    is_secondary_clutch: bool,
+) -> int:
+    """Slot of a point P1 loses in this context; the slot after it is the point P1 wins."""
+    mask = (
+        is_break_point
+        | is_set_point << 1
+        | is_match_point << 2
+        | in_tiebreak << 3
+        | is_primary_clutch << 4
+        | is_secondary_clutch << 5
+    )
+    return (mask << 2) | (p1_serving << 1)
+
+
+def _flag_slots(bit: int | None, p1_serving: bool) -> tuple[int, ...]:
+    """Lost-point slots of every flag combination including ``bit`` (None: all of them)."""
+    return tuple(
+        (mask << 2) | (p1_serving << 1)
+        for mask in range(1 << len(PRESSURE_FLAGS))
+        if bit is None or mask >> bit & 1
+    )
+
+
+_SLOTS = {
+    (name, p1_serving): _flag_slots(bit, p1_serving)
+    for bit, name in [(None, "all"), *enumerate(PRESSURE_FLAGS)]
+    for p1_serving in (True, False)
+}
+
+
+@dataclass
+class PressureStats:
+    """Points played and won by P1 in every pressure situation, on serve and on return.
+
+    ``counts[context.pressure_index + p1_won_point]`` is bumped once per point, so every
+    flag is tracked without a branch per flag; ``add`` merges two collectors slot by slot.
+    """
+
+    counts: list[int] = field(default_factory=lambda: [0] * PRESSURE_SLOTS)
+
+    def played(self, flag: str, p1_serving: bool) -> int:
+        """Points P1 served (or returned) carrying ``flag``; ``"all"`` counts every point."""
+        counts = self.counts
+        return sum(counts[slot] + counts[slot + 1] for slot in _SLOTS[flag, p1_serving])
+
+    def won(self, flag: str, p1_serving: bool) -> int:
+        counts = self.counts
+        return sum(counts[slot + 1] for slot in _SLOTS[flag, p1_serving])
+
+    def add(self, other: "PressureStats") -> None:
+        self.counts = [left + right for left, right in zip(self.counts, other.counts)]
+
+
+def pressure_columns() -> list[str]:
+    columns = []
+    for flag in ("all", *PRESSURE_FLAGS):
+        name = "points" if flag == "all" else f"{flag}_points"
+        for side in ("serve", "return"):
+            columns += [
+                f"p1_{name}_on_{side}_per_match",
+                f"p1_{name}_won_on_{side}_per_match",
+            ]
+    return columns
+
+
+def pressure_values(stats: PressureStats, n_matches: int) -> list[float]:
+    """Per-match counts in ``pressure_columns`` order."""
+    values = []
+    for flag in ("all", *PRESSURE_FLAGS):
+        for p1_serving in (True, False):
+            values += [
+                stats.played(flag, p1_serving) / n_matches,
+                stats.won(flag, p1_serving) / n_matches,
+            ]
+    return values
@@ -0,0 +1,316 @@
+import math
+from dataclasses import dataclass, field, replace
+from typing import Callable
+
+from .config import MatchConfig
+from .engine import (
+    BreakPointMetrics,
+    BreakPointStats,
+    _sample_rngs,
+    _sample_seeds,
+    _simulate_standard_game,
+    _validate_match_config,
+    simulate_match,
+    simulate_set,
+)
+from .events import get_context_table
+from .policies import ProbabilityPolicy, build_policy
+from .state import PointContext
+
+
+class PointCountingPolicy(ProbabilityPolicy):
+    """Delegates to ``inner`` and counts the points each player wins since ``reset_match``."""
+
+    def __init__(self, inner: ProbabilityPolicy) -> None:
+        self.inner = inner
+        self.p1_points = 0
+        self.p2_points = 0
+
+    @property
+    def context_fields(self) -> frozenset[str] | None:
+        return self.inner.context_fields
+
+    def point_probability(self, context: PointContext) -> float:
+        return self.inner.point_probability(context)
+
+    def on_point_end(self, context: PointContext, p1_won_point: bool) -> None:
+        if p1_won_point:
+            self.p1_points += 1
+        else:
+            self.p2_points += 1
+        self.inner.on_point_end(context, p1_won_point)
+
+    def reset_match(self) -> None:
+        self.p1_points = 0
+        self.p2_points = 0
+        self.inner.reset_match()
+
+
+# Per (P1 points won, P2 points won): samples, P1 wins, and break points earned,
+# converted, faced and saved summed over those samples.
+_SAMPLES, _P1_WINS = 0, 1
+
+
+@dataclass
+class PointCountLog:
+    """Samples simulated at ``reference_probability``, grouped by the points each player won.
+
+    With independent points a sample's probability under any p is
+    p^(P1 points) * (1 - p)^(P2 points), so every sample in a group has the same weight
+    and only the group's sums are kept.
+    """
+
+    reference_probability: float
+    groups: dict[tuple[int, int], list[int]] = field(default_factory=dict)
+
+    @property
+    def samples(self) -> int:
+        return sum(sums[_SAMPLES] for sums in self.groups.values())
+
+    def record(
+        self,
+        p1_points: int,
+        p2_points: int,
+        p1_won: bool,
+        break_points: tuple[int, int, int, int] = (0, 0, 0, 0),
+    ) -> None:
+        sums = self.groups.get((p1_points, p2_points))
+        if sums is None:
+            sums = self.groups[p1_points, p2_points] = [0] * 6
+        sums[_SAMPLES] += 1
+        sums[_P1_WINS] += p1_won
+        for index, value in enumerate(break_points, start=2):
+            sums[index] += value
+
+    def add(self, other: "PointCountLog") -> None:
+        if other.reference_probability != self.reference_probability:
+            raise ValueError("Only logs with the same reference probability can be merged.")
+        for points, other_sums in other.groups.items():
+            sums = self.groups.setdefault(points, [0] * 6)
+            for index, value in enumerate(other_sums):
+                sums[index] += value
+
+
+@dataclass(frozen=True)
+class ReweightedEstimate:
+    probability: float
+    # Self-normalized weighted P1 win rate and its delta-method standard error.
+    estimate: float
+    standard_error: float
+    # (sum of weights)^2 / sum of squared weights; compare with the log's sample count.
+    effective_sample_size: float
+    # Weighted means of break points earned, converted, faced and saved per sample.
+    break_points: tuple[float, float, float, float]
+
+    def break_point_metrics(self) -> BreakPointMetrics:
+        earned, converted, faced, saved = self.break_points
+        return BreakPointMetrics(
+            p1_break_points_earned_per_match=earned,
+            p1_break_points_converted_per_match=converted,
+            p1_break_points_faced_per_match=faced,
+            p1_break_points_saved_per_match=saved,
+            p1_break_point_conversion_rate=converted / earned if earned > 0 else 0.0,
+            p1_break_point_save_rate=saved / faced if faced > 0 else 0.0,
+        )
+
+
+def _validate_reweighting_config(config: MatchConfig) -> None:
+    _validate_match_config(config)
+    if config.streak.enabled or config.clutch.enabled:
+        raise ValueError(
+            "Reweighting requires independent points (streak and clutch disabled)."
+        )
+    if not 0.0 < config.p1_point_win_probability < 1.0:
+        raise ValueError("The reference probability must be strictly between 0 and 1.")
+
+
+def record_game_point_counts(
+    config: MatchConfig, n_games: int, seed: int | None = None
+) -> PointCountLog:
+    """The games estimate_game_win_rate plays for ``seed``, as a PointCountLog."""
+    if n_games <= 0:
+        raise ValueError("n_games must be greater than 0.")
+    _validate_reweighting_config(config)
+    table = get_context_table(config)
+    log = PointCountLog(config.p1_point_win_probability)
+    policy = PointCountingPolicy(build_policy(config))
+    for rng in _sample_rngs(seed, n_games):
+        policy.reset_match()
+        winner = _simulate_standard_game(
+            policy=policy,
+            config=config,
+            rng=rng,
+            p1_sets=0,
+            p2_sets=0,
+            p1_games=0,
+            p2_games=0,
+            p1_serving=True,
+            context_table=table,
+        )
+        log.record(policy.p1_points, policy.p2_points, winner == 1)
+    return log
+
+
+def record_set_point_counts(
+    config: MatchConfig, n_sets: int, seed: int | None = None
+) -> PointCountLog:
+    """The sets estimate_set_win_rate plays for ``seed``, as a PointCountLog."""
+    if n_sets <= 0:
+        raise ValueError("n_sets must be greater than 0.")
+    _validate_reweighting_config(config)
+    table = get_context_table(config)
+    log = PointCountLog(config.p1_point_win_probability)
+    policy = PointCountingPolicy(build_policy(config))
+    for rng in _sample_rngs(seed, n_sets):
+        policy.reset_match()
+        # The first server is a fair coin whatever p is, so it carries no weight.
+        p1_serving = rng.random() < 0.5
+        set_winner, _, _, _ = simulate_set(
+            config=config,
+            rng=rng,
+            policy=policy,
+            p1_serving_first_game=p1_serving,
+            context_table=table,
+        )
+        log.record(policy.p1_points, policy.p2_points, set_winner == 1)
+    return log
+
+
+def record_match_point_counts(
+    config: MatchConfig, n_matches: int, seed: int | None = None
+) -> PointCountLog:
+    """The matches run_monte_carlo plays for ``seed`` (serially), with break point counts."""
+    if n_matches <= 0:
+        raise ValueError("n_matches must be greater than 0.")
+    _validate_reweighting_config(config)
+    log = PointCountLog(config.p1_point_win_probability)
+    policy = PointCountingPolicy(build_policy(config))
+    for match_seed, _ in _sample_seeds(seed, n_matches):
+        stats = BreakPointStats()
+        result = simulate_match(
+            config=config, seed=match_seed, policy=policy, break_point_stats=stats
+        )
+        log.record(
+            policy.p1_points,
+            policy.p2_points,
+            result.winner == "Player 1",
+            (
+                stats.p1_break_points_earned,
+                stats.p1_break_points_converted,
+                stats.p1_break_points_faced,
+                stats.p1_break_points_saved,
+            ),
+        )
+    return log
+
+
+def reweight(log: PointCountLog, probability: float) -> ReweightedEstimate:
+    """Estimates at ``probability`` from samples played at ``log.reference_probability``."""
+    if not 0.0 < probability < 1.0:
+        raise ValueError("probability must be strictly between 0 and 1.")
+    if not log.groups:
+        raise ValueError("The log is empty.")
+    reference = log.reference_probability
+    won_step = math.log(probability / reference)
+    lost_step = math.log((1.0 - probability) / (1.0 - reference))
+    groups = list(log.groups.items())
+    log_weights = [
+        p1_points * won_step + p2_points * lost_step for (p1_points, p2_points), _ in groups
+    ]
+    # Weights are only needed up to a constant; shifting by the largest avoids overflow.
+    shift = max(log_weights)
+    weight_sum = 0.0
+    weight_square_sum = 0.0
+    totals = [0.0] * 5
+    per_sample = []
+    for value, (_, sums) in zip(log_weights, groups):
+        weight = math.exp(value - shift)
+        samples = sums[_SAMPLES]
+        weight_sum += samples * weight
+        weight_square_sum += samples * weight * weight
+        for index in range(5):
+            totals[index] += weight * sums[index + 1]
+        per_sample.append((weight, samples, sums[_P1_WINS]))
+    estimate, *break_points = (total / weight_sum for total in totals)
+    # Delta-method variance of the self-normalized (ratio) estimator: the weighted sum of
+    # squared deviations, which for a 0/1 outcome needs only each group's win count.
+    deviations = sum(
+        weight * weight * (wins * (1.0 - estimate) ** 2 + (samples - wins) * estimate**2)
+        for weight, samples, wins in per_sample
+    )
+    variance = deviations / (weight_sum * weight_sum)
+    return ReweightedEstimate(
+        probability=probability,
+        estimate=estimate,
+        standard_error=math.sqrt(variance),
+        effective_sample_size=weight_sum * weight_sum / weight_square_sum,
+        break_points=tuple(break_points),
+    )
+
+
+def reweight_curve(
+    logs: list[PointCountLog], probabilities: list[float]
+) -> list[ReweightedEstimate]:
+    """For each probability, the estimate from whichever log gives the largest effective
+    sample size (usually the anchor closest to it)."""
+    if not logs:
+        raise ValueError("At least one log is required.")
+    return [
+        max(
+            (reweight(log, probability) for log in logs),
+            key=lambda estimate: estimate.effective_sample_size,
+        )
+        for probability in probabilities
+    ]
+
+
+def reweighted_sweep_values(
+    probabilities: list[float],
+    template: MatchConfig,
+    anchors: list[float],
+    games: int,
+    sets: int,
+    matches: int,
+    seed: int,
+    on_anchor: Callable[[float], None] | None = None,
+) -> list[tuple[list[float], list[float]]]:
+    """Sweep rows (game, set and match win rates, then break point metrics) reweighted from
+    simulations at ``anchors`` only, each with its game/set/match effective sample sizes.
+
+    Anchor k is seeded like sweep row k, so an anchor's own row matches a plain sweep.
+    ``on_anchor(anchor)`` is called once each anchor's games, sets and matches are done.
+    """
+    logs: tuple[list[PointCountLog], ...] = ([], [], [])
+    for k, anchor in enumerate(anchors):
+        config = replace(template, p1_point_win_probability=anchor)
+        base_seed = seed + k * 1000
+        logs[0].append(record_game_point_counts(config, games, base_seed))
+        logs[1].append(record_set_point_counts(config, sets, base_seed + 1))
+        logs[2].append(record_match_point_counts(config, matches, base_seed + 2))
+        if on_anchor is not None:
+            on_anchor(anchor)
+    game, set_, match = (reweight_curve(metric_logs, probabilities) for metric_logs in logs)
+    rows = []
+    for game_estimate, set_estimate, match_estimate in zip(game, set_, match):
+        metrics = match_estimate.break_point_metrics()
+        rows.append(
+            (
+                [
+                    game_estimate.estimate,
+                    set_estimate.estimate,
+                    match_estimate.estimate,
+                    metrics.p1_break_points_earned_per_match,
+                    metrics.p1_break_points_converted_per_match,
+                    metrics.p1_break_points_faced_per_match,
+                    metrics.p1_break_points_saved_per_match,
+                    metrics.p1_break_point_conversion_rate,
+                    metrics.p1_break_point_save_rate,
+                ],
+                [
+                    game_estimate.effective_sample_size,
+                    set_estimate.effective_sample_size,
+                    match_estimate.effective_sample_size,
+                ],
+            )
+        )
+    return rows
@@ -0,0 +1,34 @@
+import hashlib
+import random
+
+_SEED_BITS = 63
+
+
+def derive_seed(root_seed: int, *path: int) -> int:
+    """Seed for the node ``path`` under ``root_seed`` (e.g. a match index).
+
+    Children are derived by hashing, so any node can be recomputed on its own and results
+    do not depend on how work is split into chunks or workers.
+    """
+    digest = hashlib.blake2b(
+        ":".join(str(part) for part in (root_seed, *path)).encode("ascii"),
+        digest_size=8,
+    ).digest()
+    return int.from_bytes(digest, "big") >> (64 - _SEED_BITS)
+
+
+def resolve_root_seed(seed: int | None) -> int:
+    if seed is not None:
+        return seed
+    return random.SystemRandom().getrandbits(_SEED_BITS)
+
+
+class AntitheticRandom(random.Random):
+    """``random.Random`` whose ``random()`` returns ``1 - U`` for the same seed's ``U``.
+
+    A match played on ``AntitheticRandom(seed)`` mirrors every point draw of the match
+    played on ``random.Random(seed)``, so the pair's outcomes are negatively correlated.
+    """
+
+    def random(self) -> float:
+        return 1.0 - super().random()
@@ -0,0 +1,443 @@
+import asyncio
+import bisect
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Awaitable, Callable
+
+from .cache import ResultCache
+from .config import ClutchConfig, MatchConfig, StreakConfig
+from .engine import (
+    BreakPointStats,
+    _break_point_metrics,
+    _cache_key,
+    _simulate_match_chunk,
+    _validate_match_config,
+)
+from .events import get_context_table
+from .pressure import PressureStats
+from .seeding import resolve_root_seed
+
+# (config, seed or None, antithetic): requests with the same key share one run.
+GroupKey = tuple[MatchConfig, int | None, bool]
+
+
+def config_from_dict(values: dict) -> MatchConfig:
+    values = dict(values)
+    streak = StreakConfig(**values.pop("streak", {}))
+    clutch = ClutchConfig(**values.pop("clutch", {}))
+    return MatchConfig(**values, streak=streak, clutch=clutch)
+
+
+@dataclass
+class _Totals:
+    p1_wins: int = 0
+    matches: int = 0
+    stats: PressureStats = field(default_factory=PressureStats)
+
+    def add(self, p1_wins: int, p2_wins: int, stats: PressureStats) -> None:
+        self.p1_wins += p1_wins
+        self.matches += p1_wins + p2_wins
+        self.stats.add(stats)
+
+    def merged(self, other: "_Totals") -> "_Totals":
+        totals = _Totals()
+        for part in (self, other):
+            totals.add(part.p1_wins, part.matches - part.p1_wins, part.stats)
+        return totals
+
+
+@dataclass
+class _Request:
+    request_id: object
+    n_matches: int
+    send: Callable[[dict], None]
+    stream: bool
+    coalesced: bool
+    # Set for requests that joined after a chunk spanning n_matches was planned: they
+    # combine the run's totals at ``base`` with their own chunk of matches base..n_matches.
+    base: int | None = None
+    tail: _Totals | None = None
+    reported: int = 0
+    finished: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class _Group:
+    """One seeded run of a config, planned in chunks that end at every request's size."""
+
+    def __init__(self, config: MatchConfig, seed: int | None, antithetic: bool) -> None:
+        self.config = config
+        self.seed = seed
+        self.root_seed = resolve_root_seed(seed)
+        self.antithetic = antithetic
+        self.requests: list[_Request] = []
+        self.frontier = 0
+        self.boundaries = [0]
+        self.prefix = 0
+        self.totals = _Totals()
+        self.snapshots = {0: _Totals()}
+        self.finished: dict[int, tuple[int, tuple]] = {}
+        self.wake = asyncio.Event()
+
+    def target(self) -> int:
+        return max(request.n_matches for request in self.requests)
+
+    def next_stop(self, chunk_size: int) -> int:
+        stop = min(self.frontier + chunk_size, self.target())
+        for request in self.requests:
+            if self.frontier < request.n_matches < stop:
+                stop = request.n_matches
+        return stop
+
+
+class SimulationServer:
+    """Answers JSON-lines match estimate requests from a warm process pool.
+
+    Open requests with the same (config, seed, antithetic) share one run on the chunked,
+    per-match derived seed stream. Each request gets the totals of the first ``n_matches``
+    matches, the same numbers as ``estimate_match_profile(..., workers=N)`` with that seed,
+    and optional partial results as chunks land. Unseeded requests share a random seed.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        chunk_size: int = 2000,
+        max_chunks_in_flight: int | None = None,
+        cache: ResultCache | None = None,
+    ) -> None:
+        if workers <= 0:
+            raise ValueError("workers must be greater than 0.")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be greater than 0.")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.max_chunks_in_flight = max_chunks_in_flight or 2 * workers
+        self.cache = cache
+        self.executor: ProcessPoolExecutor | None = None
+        self.groups: dict[GroupKey, _Group] = {}
+        self.started = time.monotonic()
+        self.requests_received = 0
+        self.requests_completed = 0
+        self.requests_coalesced = 0
+        self.requests_failed = 0
+        self.cache_hits = 0
+        self.chunks_in_flight = 0
+        self.matches_simulated = 0
+
+    async def start(self) -> None:
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        loop = asyncio.get_running_loop()
+        # Start every worker now and build the default context table in each.
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self.executor, get_context_table, MatchConfig())
+                for _ in range(self.workers)
+            )
+        )
+        self.started = time.monotonic()
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def open_requests(self) -> int:
+        return sum(len(group.requests) for group in self.groups.values())
+
+    def metrics(self) -> dict:
+        uptime = time.monotonic() - self.started
+        return {
+            "queue_depth": self.open_requests(),
+            "active_runs": len(self.groups),
+            "chunks_in_flight": self.chunks_in_flight,
+            "requests_received": self.requests_received,
+            "requests_completed": self.requests_completed,
+            "requests_coalesced": self.requests_coalesced,
+            "requests_failed": self.requests_failed,
+            "cache_hits": self.cache_hits,
+            "matches_simulated": self.matches_simulated,
+            "matches_per_second": self.matches_simulated / uptime if uptime > 0 else 0.0,
+            "uptime_seconds": uptime,
+        }
+
+    def handle_message(
+        self, message: dict, send: Callable[[dict], None]
+    ) -> asyncio.Event | None:
+        """Answer or enqueue one request; returns an event set once a queued one is answered."""
+        request_id = message.get("id")
+        op = message.get("op", "estimate")
+        if op == "metrics":
+            send({"id": request_id, "metrics": self.metrics()})
+            return None
+        if op != "estimate":
+            send({"id": request_id, "error": f"Unknown op {op!r}."})
+            return None
+
+        self.requests_received += 1
+        try:
+            config = config_from_dict(message.get("config", {}))
+            _validate_match_config(config)
+            n_matches = int(message["n_matches"])
+            if n_matches <= 0:
+                raise ValueError("n_matches must be greater than 0.")
+            seed = message.get("seed")
+            seed = None if seed is None else int(seed)
+            antithetic = bool(message.get("antithetic", False))
+        except (KeyError, TypeError, ValueError) as error:
+            self.requests_failed += 1
+            send({"id": request_id, "error": str(error)})
+            return None
+
+        # Chunked runs match estimate_match_profile(..., workers=N), whose cache key this is.
+        key = _cache_key(
+            self.cache, "match_profile", config, seed, n_matches, workers=1, antithetic=antithetic
+        )
+        cached = self.cache.get(key) if key is not None else None
+        if cached is not None:
+            self.cache_hits += 1
+            self.requests_completed += 1
+            match_win_rate, metrics = cached
+            send(
+                {
+                    "id": request_id,
+                    "done": True,
+                    "n_matches": n_matches,
+                    "match_win_rate": match_win_rate,
+                    "break_point_metrics": metrics,
+                    "cached": True,
+                }
+            )
+            return None
+
+        group_key = (config, seed, antithetic)
+        group = self.groups.get(group_key)
+        request = _Request(
+            request_id=request_id,
+            n_matches=n_matches,
+            send=send,
+            stream=bool(message.get("stream", False)),
+            coalesced=group is not None,
+        )
+        if group is None:
+            group = _Group(config, seed, antithetic)
+            self.groups[group_key] = group
+            group.requests.append(request)
+            asyncio.get_running_loop().create_task(self._run_group(group_key, group))
+            return request.finished
+
+        self.requests_coalesced += 1
+        group.requests.append(request)
+        if n_matches < group.frontier and n_matches not in group.snapshots:
+            position = bisect.bisect_right(group.boundaries, n_matches) - 1
+            if group.boundaries[position] != n_matches:
+                request.base = group.boundaries[position]
+                asyncio.get_running_loop().create_task(self._run_tail(group, request))
+        group.wake.set()
+        return request.finished
+
+    async def _run_chunk(self, group: _Group, start: int, stop: int) -> tuple:
+        self.chunks_in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                _simulate_match_chunk,
+                group.config,
+                group.root_seed,
+                start,
+                stop,
+                group.antithetic,
+            )
+        finally:
+            self.chunks_in_flight -= 1
+
+    async def _run_tail(self, group: _Group, request: _Request) -> None:
+        try:
+            p1_wins, p2_wins, stats, _, _ = await self._run_chunk(
+                group, request.base, request.n_matches
+            )
+        except Exception as error:
+            self._fail(group, request, error)
+            return
+        self.matches_simulated += p1_wins + p2_wins
+        request.tail = _Totals()
+        request.tail.add(p1_wins, p2_wins, stats)
+        group.wake.set()
+
+    async def _run_group(self, group_key: GroupKey, group: _Group) -> None:
+        pending: dict[asyncio.Future, tuple[int, int]] = {}
+        try:
+            while group.requests:
+                while (
+                    len(pending) < self.max_chunks_in_flight
+                    and group.frontier < group.target()
+                ):
+                    start = group.frontier
+                    stop = group.next_stop(self.chunk_size)
+                    future = asyncio.ensure_future(self._run_chunk(group, start, stop))
+                    pending[future] = (start, stop)
+                    group.frontier = stop
+                    group.boundaries.append(stop)
+
+                wake = asyncio.ensure_future(group.wake.wait())
+                done, _ = await asyncio.wait(
+                    [*pending, wake], return_when=asyncio.FIRST_COMPLETED
+                )
+                if wake not in done:
+                    wake.cancel()
+                group.wake.clear()
+                for future in done:
+                    if future is wake:
+                        continue
+                    start, stop = pending.pop(future)
+                    group.finished[start] = (stop, future.result())
+                self._advance(group)
+        except Exception as error:
+            for request in list(group.requests):
+                self._fail(group, request, error)
+        finally:
+            for future in pending:
+                future.cancel()
+            if self.groups.get(group_key) is group:
+                del self.groups[group_key]
+
+    def _advance(self, group: _Group) -> None:
+        while group.prefix in group.finished:
+            stop, (p1_wins, p2_wins, stats, _, _) = group.finished.pop(group.prefix)
+            group.totals.add(p1_wins, p2_wins, stats)
+            self.matches_simulated += p1_wins + p2_wins
+            group.prefix = stop
+            group.snapshots[stop] = group.totals.merged(_Totals())
+
+        for request in list(group.requests):
+            totals = None
+            if request.base is None:
+                if group.prefix >= request.n_matches:
+                    totals = group.snapshots[request.n_matches]
+            elif request.tail is not None and request.base in group.snapshots:
+                totals = group.snapshots[request.base].merged(request.tail)
+            if totals is not None:
+                self._finish(group, request, totals)
+            elif request.stream and request.reported < group.prefix < request.n_matches:
+                request.reported = group.prefix
+                request.send(
+                    {
+                        "id": request.request_id,
+                        "partial": True,
+                        "matches": group.prefix,
+                        "match_win_rate": group.totals.p1_wins / group.totals.matches,
+                    }
+                )
+
+    def _finish(self, group: _Group, request: _Request, totals: _Totals) -> None:
+        group.requests.remove(request)
+        self.requests_completed += 1
+        match_win_rate = totals.p1_wins / totals.matches
+        metrics = asdict(
+            _break_point_metrics(BreakPointStats.from_pressure(totals.stats), totals.matches)
+        )
+        key = _cache_key(
+            self.cache,
+            "match_profile",
+            group.config,
+            group.seed,
+            totals.matches,
+            workers=1,
+            antithetic=group.antithetic,
+        )
+        if key is not None:
+            self.cache.put(key, [match_win_rate, metrics])
+        request.send(
+            {
+                "id": request.request_id,
+                "done": True,
+                "n_matches": totals.matches,
+                "match_win_rate": match_win_rate,
+                "break_point_metrics": metrics,
+                "coalesced": request.coalesced,
+            }
+        )
+        request.finished.set()
+
+    def _fail(self, group: _Group, request: _Request, error: Exception) -> None:
+        if request in group.requests:
+            group.requests.remove(request)
+        self.requests_failed += 1
+        request.send({"id": request.request_id, "error": f"{type(error).__name__}: {error}"})
+        request.finished.set()
+        group.wake.set()
+
+    async def serve_stream(
+        self, readline: Callable[[], Awaitable[bytes]], send: Callable[[dict], None]
+    ) -> None:
+        """Handle one JSON-lines connection until EOF and every request it sent is answered."""
+        queued = []
+        while True:
+            line = await readline()
+            if not line:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                message = json.loads(line)
+                if not isinstance(message, dict):
+                    raise ValueError("Each request must be a JSON object.")
+            except ValueError as error:
+                send({"error": f"Invalid request: {error}"})
+                continue
+            finished = self.handle_message(message, send)
+            if finished is not None:
+                queued.append(finished)
+        for finished in queued:
+            await finished.wait()
+
+
+def _line_sender(write: Callable[[bytes], None]) -> Callable[[dict], None]:
+    def send(response: dict) -> None:
+        write((json.dumps(response) + "\n").encode("utf-8"))
+
+    return send
+
+
+async def serve_unix_socket(server: SimulationServer, path: str) -> None:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        def write(data: bytes) -> None:
+            if not writer.is_closing():
+                writer.write(data)
+
+        try:
+            await server.serve_stream(reader.readline, _line_sender(write))
+            await writer.drain()
+        finally:
+            writer.close()
+
+    await server.start()
+    unix_server = await asyncio.start_unix_server(handle, path=path)
+    try:
+        async with unix_server:
+            await unix_server.serve_forever()
+    finally:
+        server.close()
+
+
+async def serve_stdio(server: SimulationServer, stdin, stdout) -> None:
+    """Serve requests read from ``stdin``; after EOF, finish open requests and return.
+
+    ``stdin`` is a binary file read on a thread, so files, pipes and consoles all work.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def readline() -> bytes:
+        return await loop.run_in_executor(None, stdin.readline)
+
+    def write(data: bytes) -> None:
+        stdout.write(data)
+        stdout.flush()
+
+    await server.start()
+    try:
+        await server.serve_stream(readline, _line_sender(write))
+    finally:
+        server.close()
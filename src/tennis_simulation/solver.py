@@ -0,0 +1,372 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+from .config import MatchConfig
+from .engine import BreakPointMetrics, _validate_match_config
+from .events import get_context_table, points_fold_floor
+from .policies import ProbabilityPolicy, build_policy
+from .policies.base import clamp_probability
+
+# Components of a state value vector. Probabilities refer to the match, set and game in
+# progress; counts are expected numbers of such points still to be played in the match.
+_MATCH_WIN = 0
+_SET_WIN = 1
+_GAME_WIN = 2
+_BP_EARNED = 3
+_BP_CONVERTED = 4
+_BP_FACED = 5
+_BP_SAVED = 6
+_SET_POINTS = 7
+_MATCH_POINTS = 8
+_VALUE_SIZE = 9
+
+Vector = tuple[float, ...]
+_ZERO: Vector = (0.0,) * _VALUE_SIZE
+
+# (p1_sets, p2_sets, p1_games, p2_games, p1_serving)
+GameKey = tuple[int, int, int, int, bool]
+
+
+@dataclass(frozen=True)
+class StateValue:
+    match_win_probability: float
+    set_win_probability: float
+    game_win_probability: float
+    expected_p1_break_points_earned: float
+    expected_p1_break_points_converted: float
+    expected_p1_break_points_faced: float
+    expected_p1_break_points_saved: float
+    expected_set_points: float
+    expected_match_points: float
+
+    @classmethod
+    def from_vector(cls, vector: Vector) -> "StateValue":
+        return cls(*vector)
+
+
+def _add(left: Vector, right: Vector) -> Vector:
+    return tuple(a + b for a, b in zip(left, right))
+
+
+def _scale(vector: Vector, factor: float) -> Vector:
+    return tuple(value * factor for value in vector)
+
+
+def _mix(p: float, won: Vector, lost: Vector) -> Vector:
+    q = 1.0 - p
+    return tuple(p * a + q * b for a, b in zip(won, lost))
+
+
+def _with(vector: Vector, index: int, value: float) -> Vector:
+    return vector[:index] + (value,) + vector[index + 1 :]
+
+
+def _solve_birth_death(
+    up_probabilities: list[float],
+    rewards: list[Vector],
+    win_exit: Vector,
+    lose_exit: Vector,
+) -> list[Vector]:
+    """Solve V[i] = r[i] + p[i] V[i+1] + (1 - p[i]) V[i-1] with V[n] = win, V[-1] = lose.
+
+    Deuce games, long tiebreaks and advantage sets reduce to this chain once only the lead
+    matters, so the solver stays finite without truncating the score.
+    """
+    offsets: list[Vector] = []
+    slopes: list[float] = []
+    previous_offset = lose_exit
+    previous_slope = 0.0
+    for p, reward in zip(up_probabilities, rewards):
+        q = 1.0 - p
+        denominator = 1.0 - q * previous_slope
+        if denominator <= 0.0:
+            raise ValueError("Policy makes a game or set that can never finish.")
+        previous_offset = _scale(_add(reward, _scale(previous_offset, q)), 1.0 / denominator)
+        previous_slope = p / denominator
+        offsets.append(previous_offset)
+        slopes.append(previous_slope)
+
+    values: list[Vector] = [_ZERO] * len(offsets)
+    following = win_exit
+    for index in range(len(offsets) - 1, -1, -1):
+        following = _add(offsets[index], _scale(following, slopes[index]))
+        values[index] = following
+    return values
+
+
+class MatchStateSolver:
+    """Exact match values for a memoryless policy, by backward induction over every score.
+
+    The policy must depend only on the ``PointContext`` (``on_point_end`` is never called).
+    Scores past deuce are folded onto their first equivalent score (e.g. 5-4 onto 4-3),
+    which leaves every context flag unchanged.
+    """
+
+    def __init__(
+        self, config: MatchConfig, policy: ProbabilityPolicy | None = None
+    ) -> None:
+        _validate_match_config(config)
+        if policy is None:
+            if config.streak.enabled:
+                raise ValueError(
+                    "StreakinessPolicy depends on past points; the state solver needs a "
+                    "memoryless policy."
+                )
+            policy = build_policy(config)
+        policy.reset_match()
+        self.config = config
+        self.policy = policy
+        self.sets_needed = config.best_of_sets // 2 + 1
+        self.contexts = get_context_table(config)
+        self.games_floor = self.contexts.games_floor
+        self._game_values: dict[GameKey, Vector] = {}
+        self._point_values: dict[GameKey, dict[tuple[int, int], Vector]] = {}
+        self._solve()
+
+    @property
+    def n_states(self) -> int:
+        return sum(len(points) for points in self._point_values.values())
+
+    def _in_tiebreak(self, p1_games: int, p2_games: int) -> bool:
+        return p1_games == self.config.tiebreak_at and p2_games == self.config.tiebreak_at
+
+    def _point_rules(self, tiebreak: bool) -> tuple[int, int, int]:
+        if tiebreak:
+            target = self.config.tiebreak_points_to_win
+            margin = self.config.tiebreak_win_margin
+        else:
+            target, margin = 4, 2
+        return target, margin, points_fold_floor(target, margin)
+
+    def _set_over(self, p1_games: int, p2_games: int, tiebreak: bool) -> bool:
+        if tiebreak:
+            return True
+        target = self.config.games_to_win_set
+        margin = self.config.set_win_margin
+        return (p1_games >= target and p1_games - p2_games >= margin) or (
+            p2_games >= target and p2_games - p1_games >= margin
+        )
+
+    def _continuation(self, key: GameKey, p1_won_game: bool) -> Vector:
+        """Value right after the game at ``key`` ends (game-win component zeroed)."""
+        p1_sets, p2_sets, p1_games, p2_games, p1_serving = key
+        tiebreak = self._in_tiebreak(p1_games, p2_games)
+        if p1_won_game:
+            p1_games += 1
+        else:
+            p2_games += 1
+
+        if not self._set_over(p1_games, p2_games, tiebreak):
+            p1_games, p2_games = self.contexts.fold_games(p1_games, p2_games)
+            next_key = (p1_sets, p2_sets, p1_games, p2_games, not p1_serving)
+            return _with(self._game_values[next_key], _GAME_WIN, 0.0)
+
+        if p1_won_game:
+            p1_sets += 1
+        else:
+            p2_sets += 1
+        set_won = 1.0 if p1_won_game else 0.0
+        if p1_sets == self.sets_needed or p2_sets == self.sets_needed:
+            return _with(_with(_ZERO, _MATCH_WIN, set_won), _SET_WIN, set_won)
+        next_value = self._game_values[(p1_sets, p2_sets, 0, 0, not p1_serving)]
+        return _with(_with(next_value, _SET_WIN, set_won), _GAME_WIN, 0.0)
+
+    def _point_reward(self, key: GameKey, p1_points: int, p2_points: int) -> tuple[float, Vector]:
+        context = self.contexts.game_contexts(*key)[p1_points][p2_points]
+        p1_serving = key[4]
+        p = clamp_probability(self.policy.point_probability(context))
+        reward = [0.0] * _VALUE_SIZE
+        if context.is_break_point:
+            if p1_serving:
+                reward[_BP_FACED] = 1.0
+                reward[_BP_SAVED] = p
+            else:
+                reward[_BP_EARNED] = 1.0
+                reward[_BP_CONVERTED] = p
+        if context.is_set_point:
+            reward[_SET_POINTS] = 1.0
+        if context.is_match_point:
+            reward[_MATCH_POINTS] = 1.0
+        return p, tuple(reward)
+
+    def _solve_game(self, key: GameKey) -> dict[tuple[int, int], Vector]:
+        """In-game values: game-win probability plus expected counts until the game ends."""
+        target, margin, floor = self._point_rules(self._in_tiebreak(key[2], key[3]))
+        won_game = _with(_ZERO, _GAME_WIN, 1.0)
+        values: dict[tuple[int, int], Vector] = {}
+
+        # Scores with min(points) == floor form a chain on the lead.
+        leads = range(-(margin - 1), margin)
+        row = [(floor + max(lead, 0), floor + max(-lead, 0)) for lead in leads]
+        solved = [self._point_reward(key, p1_points, p2_points) for p1_points, p2_points in row]
+        row_values = _solve_birth_death(
+            [p for p, _ in solved], [reward for _, reward in solved], won_game, _ZERO
+        )
+        values.update(zip(row, row_values))
+
+        def solve(p1_points: int, p2_points: int) -> Vector:
+            if p1_points >= target and p1_points - p2_points >= margin:
+                return won_game
+            if p2_points >= target and p2_points - p1_points >= margin:
+                return _ZERO
+            shift = min(p1_points, p2_points) - floor
+            if shift > 0:
+                p1_points -= shift
+                p2_points -= shift
+            if (p1_points, p2_points) not in values:
+                p, reward = self._point_reward(key, p1_points, p2_points)
+                values[(p1_points, p2_points)] = _add(
+                    reward, _mix(p, solve(p1_points + 1, p2_points), solve(p1_points, p2_points + 1))
+                )
+            return values[(p1_points, p2_points)]
+
+        solve(0, 0)
+        self._point_values[key] = values
+        return values
+
+    def _game_value(self, key: GameKey) -> Vector:
+        local = self._solve_game(key)[(0, 0)]
+        p = local[_GAME_WIN]
+        return _add(local, _mix(p, self._continuation(key, True), self._continuation(key, False)))
+
+    def _solve_games_row(self, p1_sets: int, p2_sets: int, first_serving: bool) -> None:
+        """Solve games with min(games) == games_floor, where no tiebreak can follow."""
+        margin = self.config.set_win_margin
+        floor = self.games_floor
+        keys = []
+        for lead in range(-(margin - 1), margin):
+            p1_serving = first_serving != bool((lead + margin - 1) % 2)
+            keys.append(
+                (p1_sets, p2_sets, floor + max(lead, 0), floor + max(-lead, 0), p1_serving)
+            )
+        locals_ = [self._solve_game(key)[(0, 0)] for key in keys]
+        probabilities = [local[_GAME_WIN] for local in locals_]
+        rewards = [_with(local, _GAME_WIN, 0.0) for local in locals_]
+        values = _solve_birth_death(
+            probabilities,
+            rewards,
+            self._continuation(keys[-1], True),
+            self._continuation(keys[0], False),
+        )
+        for key, value, p in zip(keys, values, probabilities):
+            self._game_values[key] = _with(value, _GAME_WIN, p)
+
+    def _solve(self) -> None:
+        margin = self.config.set_win_margin
+        floor = self.games_floor
+        limit = floor + margin
+        set_scores = [
+            (p1_sets, p2_sets)
+            for p1_sets in range(self.sets_needed)
+            for p2_sets in range(self.sets_needed)
+        ]
+        set_scores.sort(key=lambda score: -(score[0] + score[1]))
+        game_scores = [
+            (p1_games, p2_games)
+            for p1_games in range(limit + 1)
+            for p2_games in range(limit + 1)
+            if min(p1_games, p2_games) < floor
+            and not self._set_over(p1_games, p2_games, False)
+        ]
+        game_scores.sort(key=lambda score: -(score[0] + score[1]))
+
+        for p1_sets, p2_sets in set_scores:
+            for first_serving in (True, False):
+                self._solve_games_row(p1_sets, p2_sets, first_serving)
+            for p1_games, p2_games in game_scores:
+                for p1_serving in (True, False):
+                    key = (p1_sets, p2_sets, p1_games, p2_games, p1_serving)
+                    self._game_values[key] = self._game_value(key)
+
+    def value(
+        self,
+        p1_sets: int = 0,
+        p2_sets: int = 0,
+        p1_games: int = 0,
+        p2_games: int = 0,
+        p1_points: int = 0,
+        p2_points: int = 0,
+        p1_serving: bool = True,
+    ) -> StateValue:
+        """Value of the match from a live score (tiebreak follows from the game score)."""
+        if max(p1_sets, p2_sets) >= self.sets_needed:
+            raise ValueError("Match is already over.")
+        tiebreak = self._in_tiebreak(p1_games, p2_games)
+        if self._set_over(p1_games, p2_games, False):
+            raise ValueError("Set is already over.")
+        p1_games, p2_games = self.contexts.fold_games(p1_games, p2_games)
+        key = (p1_sets, p2_sets, p1_games, p2_games, p1_serving)
+
+        target, margin, floor = self._point_rules(tiebreak)
+        if (p1_points >= target and p1_points - p2_points >= margin) or (
+            p2_points >= target and p2_points - p1_points >= margin
+        ):
+            raise ValueError("Game is already over.")
+        shift = min(p1_points, p2_points) - floor
+        if shift > 0:
+            p1_points -= shift
+            p2_points -= shift
+
+        local = self._point_values[key][(p1_points, p2_points)]
+        p = local[_GAME_WIN]
+        return StateValue.from_vector(
+            _add(local, _mix(p, self._continuation(key, True), self._continuation(key, False)))
+        )
+
+    def match_win_probabilities(self) -> dict[GameKey, dict[tuple[int, int], float]]:
+        """P1 match-win probability at every solved score, with points and games folded."""
+        probabilities: dict[GameKey, dict[tuple[int, int], float]] = {}
+        for key, points in self._point_values.items():
+            won = self._continuation(key, True)[_MATCH_WIN]
+            lost = self._continuation(key, False)[_MATCH_WIN]
+            probabilities[key] = {
+                score: value[_GAME_WIN] * won + (1.0 - value[_GAME_WIN]) * lost
+                for score, value in points.items()
+            }
+        return probabilities
+
+    def start_value(self) -> StateValue:
+        """Value at 0-0 with the first server chosen by a fair coin, as in simulate_match."""
+        serving = self._game_values[(0, 0, 0, 0, True)]
+        returning = self._game_values[(0, 0, 0, 0, False)]
+        return StateValue.from_vector(_mix(0.5, serving, returning))
+
+    def match_profile(self) -> tuple[float, BreakPointMetrics]:
+        start = self.start_value()
+        earned = start.expected_p1_break_points_earned
+        faced = start.expected_p1_break_points_faced
+        metrics = BreakPointMetrics(
+            p1_break_points_earned_per_match=earned,
+            p1_break_points_converted_per_match=start.expected_p1_break_points_converted,
+            p1_break_points_faced_per_match=faced,
+            p1_break_points_saved_per_match=start.expected_p1_break_points_saved,
+            p1_break_point_conversion_rate=(
+                start.expected_p1_break_points_converted / earned if earned > 0 else 0.0
+            ),
+            p1_break_point_save_rate=(
+                start.expected_p1_break_points_saved / faced if faced > 0 else 0.0
+            ),
+        )
+        return start.match_win_probability, metrics
+
+
+@lru_cache(maxsize=32)
+def get_match_solver(config: MatchConfig) -> MatchStateSolver:
+    """Solver for the policy ``build_policy(config)`` builds, cached per config."""
+    return MatchStateSolver(config)
+
+
+def solved_game_win_rate(config: MatchConfig) -> float:
+    return get_match_solver(config).value(p1_serving=True).game_win_probability
+
+
+def solved_set_win_rate(config: MatchConfig) -> float:
+    return get_match_solver(config).start_value().set_win_probability
+
+
+def solved_match_win_rate(config: MatchConfig) -> float:
+    return get_match_solver(config).start_value().match_win_probability
+
+
+def solved_match_profile(config: MatchConfig) -> tuple[float, BreakPointMetrics]:
+    return get_match_solver(config).match_profile()
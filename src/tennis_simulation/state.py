@@ -9,7 +9,7 @@ class MatchState:
     p2_games: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PointContext:
     p1_sets: int
     p2_sets: int
@@ -24,3 +24,5 @@ class PointContext:
     is_break_point: bool
     is_set_point: bool
     is_match_point: bool
+    # PressureStats slot for this context (see pressure.pressure_index).
+    pressure_index: int = 0
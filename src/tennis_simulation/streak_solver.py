@@ -0,0 +1,330 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from .config import MatchConfig
+from .engine import BreakPointMetrics, _validate_match_config
+from .events import get_context_table
+
+GAME_LEVEL = "game"
+SET_LEVEL = "set"
+MATCH_LEVEL = "match"
+
+# (p1_sets, p2_sets, p1_games, p2_games, p1_serving, p1_points, p2_points), folded.
+ScoreKey = tuple[int, int, int, int, bool, int, int]
+
+
+@dataclass(frozen=True)
+class StreakSolution:
+    win_probability: float
+    break_point_metrics: BreakPointMetrics | None
+    # |win_probability - the same solve on a grid with half the momentum bins|. An estimate,
+    # not a bound: the two grids can agree while both are off.
+    discretization_error_estimate: float
+    # Probability mass still in play when propagation stopped (counted as neither win).
+    unfinished_mass: float
+    points_propagated: int
+
+
+class _ScoreChain:
+    """Every reachable folded score for ``level`` with its successors and point flags.
+
+    Successor indices ``n_states`` and ``n_states + 1`` are the absorbing P1-won and
+    P2-won states. Scoring follows the engine, including how points and games fold.
+    """
+
+    def __init__(self, config: MatchConfig, level: str) -> None:
+        self.config = config
+        self.level = level
+        self.table = get_context_table(config)
+        self.sets_needed = config.best_of_sets // 2 + 1
+        self.keys: list[ScoreKey] = []
+        self.index: dict[ScoreKey, int] = {}
+        if level == GAME_LEVEL:
+            self.starts = [((0, 0, 0, 0, True, 0, 0), 1.0)]
+        else:
+            # simulate_match and estimate_set_win_rate pick the first server with a coin.
+            self.starts = [((0, 0, 0, 0, True, 0, 0), 0.5), ((0, 0, 0, 0, False, 0, 0), 0.5)]
+
+        pending = [key for key, _ in self.starts]
+        for key in pending:
+            self._add(key)
+        successors = []
+        position = 0
+        while position < len(self.keys):
+            key = self.keys[position]
+            position += 1
+            pair = []
+            for p1_won in (True, False):
+                following = self._after_point(key, p1_won)
+                if isinstance(following, tuple) and following not in self.index:
+                    self._add(following)
+                pair.append(following)
+            successors.append(pair)
+
+        self.n_states = len(self.keys)
+        p1_won_index = self.n_states
+        p2_won_index = self.n_states + 1
+
+        def resolve(following) -> int:
+            if following is True:
+                return p1_won_index
+            if following is False:
+                return p2_won_index
+            return self.index[following]
+
+        self.win_next = np.array([resolve(won) for won, _ in successors], dtype=np.int64)
+        self.lose_next = np.array([resolve(lost) for _, lost in successors], dtype=np.int64)
+        contexts = [self._context(key) for key in self.keys]
+        clutch = config.clutch
+        self.boost = np.array(
+            [
+                (
+                    clutch.primary_boost
+                    if context.is_primary_clutch
+                    else clutch.secondary_boost if context.is_secondary_clutch else 0.0
+                )
+                if clutch.enabled
+                else 0.0
+                for context in contexts
+            ]
+        )
+        self.break_point_serving = np.array(
+            [context.is_break_point and context.p1_serving for context in contexts]
+        )
+        self.break_point_returning = np.array(
+            [context.is_break_point and not context.p1_serving for context in contexts]
+        )
+
+    def _add(self, key: ScoreKey) -> None:
+        self.index[key] = len(self.keys)
+        self.keys.append(key)
+
+    def _context(self, key: ScoreKey):
+        p1_sets, p2_sets, p1_games, p2_games, p1_serving, p1_points, p2_points = key
+        grid = self.table.game_contexts(p1_sets, p2_sets, p1_games, p2_games, p1_serving)
+        return grid[p1_points][p2_points]
+
+    def _after_point(self, key: ScoreKey, p1_won: bool) -> ScoreKey | bool:
+        """Next score, or True/False once P1 has won/lost the game, set or match."""
+        config = self.config
+        p1_sets, p2_sets, p1_games, p2_games, p1_serving, p1_points, p2_points = key
+        tiebreak = p1_games == config.tiebreak_at and p2_games == config.tiebreak_at
+        if tiebreak:
+            target = config.tiebreak_points_to_win
+            margin = config.tiebreak_win_margin
+            floor = self.table.tiebreak_floor
+        else:
+            target, margin, floor = 4, 2, self.table.standard_floor
+        if p1_won:
+            p1_points += 1
+        else:
+            p2_points += 1
+
+        game_over = (p1_points >= target and p1_points - p2_points >= margin) or (
+            p2_points >= target and p2_points - p1_points >= margin
+        )
+        if not game_over:
+            if p1_points > floor and p2_points > floor:
+                p1_points -= 1
+                p2_points -= 1
+            return (p1_sets, p2_sets, p1_games, p2_games, p1_serving, p1_points, p2_points)
+        if self.level == GAME_LEVEL:
+            return p1_won
+
+        if p1_won:
+            p1_games += 1
+        else:
+            p2_games += 1
+        set_over = (
+            tiebreak
+            or (
+                p1_games >= config.games_to_win_set
+                and p1_games - p2_games >= config.set_win_margin
+            )
+            or (
+                p2_games >= config.games_to_win_set
+                and p2_games - p1_games >= config.set_win_margin
+            )
+        )
+        if not set_over:
+            p1_games, p2_games = self.table.fold_games(p1_games, p2_games)
+            return (p1_sets, p2_sets, p1_games, p2_games, not p1_serving, 0, 0)
+        if self.level == SET_LEVEL:
+            return p1_won
+
+        if p1_won:
+            p1_sets += 1
+        else:
+            p2_sets += 1
+        if p1_sets == self.sets_needed or p2_sets == self.sets_needed:
+            return p1_won
+        return (p1_sets, p2_sets, 0, 0, not p1_serving, 0, 0)
+
+
+@lru_cache(maxsize=32)
+def _score_chain(config: MatchConfig, level: str) -> _ScoreChain:
+    return _ScoreChain(config, level)
+
+
+def _momentum_split(
+    grid: np.ndarray, decay: float, step: float, direction: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Next momentum of each bin, split linearly between its two nearest bins.
+
+    Returns (lower bin, weight of lower + 1). Linear splitting keeps the expected momentum
+    after every point exact.
+    """
+    bins = len(grid)
+    if bins == 1:
+        return np.zeros(1, dtype=np.int64), np.zeros(1)
+    following = np.clip(grid * decay + direction * step, -1.0, 1.0)
+    position = (following + 1.0) / 2.0 * (bins - 1)
+    lower = np.clip(np.floor(position).astype(np.int64), 0, bins - 2)
+    return lower, position - lower
+
+
+def _propagate(
+    config: MatchConfig,
+    level: str,
+    momentum_bins: int,
+    tolerance: float,
+    max_points: int,
+) -> tuple[float, list[float], float, int]:
+    chain = _score_chain(config, level)
+    streak = config.streak
+    if streak.enabled:
+        grid = np.linspace(-1.0, 1.0, momentum_bins)
+        intensity = streak.intensity
+    else:
+        grid = np.zeros(1)
+        intensity = 0.0
+    bins = len(grid)
+    n_states = chain.n_states
+
+    # Flat (next state, next bin) index of each of the four ways mass leaves a (state, bin):
+    # won/lost point x lower/upper momentum neighbour, and the share each one gets.
+    targets = []
+    shares = []
+    for next_states, direction in ((chain.win_next, 1.0), (chain.lose_next, -1.0)):
+        lower, upper_weight = _momentum_split(
+            grid, streak.decay, streak.momentum_step, direction
+        )
+        for offset, share in ((0, 1.0 - upper_weight), (1, upper_weight)):
+            if bins == 1 and offset == 1:
+                continue
+            targets.append(next_states[:, None] * bins + (lower + offset)[None, :])
+            shares.append(share)
+    targets = np.stack(targets)
+    shares = np.stack(shares)[:, None, :]
+    size = (n_states + 2) * bins
+
+    # Same operations as the policy chain: streak adjustment, clamp, clutch boost, clamp.
+    base = min(1.0, max(0.0, config.p1_point_win_probability))
+    momentum_probability = np.clip(base + intensity * grid, 0.0, 1.0)
+    probability = np.clip(momentum_probability[None, :] + chain.boost[:, None], 0.0, 1.0)
+
+    mass = np.zeros((n_states + 2, bins))
+    zero_bin = bins // 2
+    for key, weight in chain.starts:
+        mass[chain.index[key], zero_bin] += weight
+
+    # Expected P1 break points earned, converted, faced and saved.
+    counts = [0.0, 0.0, 0.0, 0.0]
+    returning = chain.break_point_returning
+    serving = chain.break_point_serving
+    flat_targets = targets.ravel()
+    half = len(shares) // 2
+    outcomes = np.empty((len(shares), n_states, bins))
+    points = 0
+    while points < max_points:
+        live = mass[:n_states]
+        if live.sum() < tolerance:
+            break
+        won = live * probability
+        lost = live - won
+        if level == MATCH_LEVEL:
+            counts[0] += float(live[returning].sum())
+            counts[1] += float(won[returning].sum())
+            counts[2] += float(live[serving].sum())
+            counts[3] += float(won[serving].sum())
+
+        np.multiply(won[None], shares[:half], out=outcomes[:half])
+        np.multiply(lost[None], shares[half:], out=outcomes[half:])
+        following = np.bincount(
+            flat_targets, weights=outcomes.ravel(), minlength=size
+        ).reshape(n_states + 2, bins)
+        following[n_states:] += mass[n_states:]
+        mass = following
+        points += 1
+
+    return float(mass[n_states].sum()), counts, float(mass[:n_states].sum()), points
+
+
+def solve_streak(
+    config: MatchConfig,
+    level: str = MATCH_LEVEL,
+    momentum_bins: int = 101,
+    tolerance: float = 1e-12,
+    max_points: int = 100000,
+) -> StreakSolution:
+    """P1 win probability of a game, set or match under streak (and clutch) by forward
+    propagation over (score, momentum bin), with momentum discretized on ``momentum_bins``
+    evenly spaced values in [-1, 1].
+
+    ``level="game"`` is a game from 0-0 with P1 serving, as estimate_game_win_rate;
+    ``"set"`` and ``"match"`` start from 0-0 with a fair coin for the first server.
+    """
+    _validate_match_config(config)
+    if level not in (GAME_LEVEL, SET_LEVEL, MATCH_LEVEL):
+        raise ValueError("level must be 'game', 'set' or 'match'.")
+    if momentum_bins < 3 or momentum_bins % 2 == 0:
+        raise ValueError("momentum_bins must be odd and at least 3 (0 must be a grid value).")
+
+    win_probability, counts, unfinished, points = _propagate(
+        config, level, momentum_bins, tolerance, max_points
+    )
+    discretization_error_estimate = 0.0
+    if config.streak.enabled:
+        coarse_bins = (momentum_bins - 1) // 2 + 1
+        if coarse_bins % 2 == 0:
+            coarse_bins += 1
+        coarse_probability, _, _, _ = _propagate(
+            config, level, coarse_bins, tolerance, max_points
+        )
+        discretization_error_estimate = abs(win_probability - coarse_probability)
+
+    metrics = None
+    if level == MATCH_LEVEL:
+        earned, converted, faced, saved = counts
+        metrics = BreakPointMetrics(
+            p1_break_points_earned_per_match=earned,
+            p1_break_points_converted_per_match=converted,
+            p1_break_points_faced_per_match=faced,
+            p1_break_points_saved_per_match=saved,
+            p1_break_point_conversion_rate=converted / earned if earned > 0 else 0.0,
+            p1_break_point_save_rate=saved / faced if faced > 0 else 0.0,
+        )
+    return StreakSolution(
+        win_probability=float(win_probability),
+        break_point_metrics=metrics,
+        discretization_error_estimate=float(discretization_error_estimate),
+        unfinished_mass=float(unfinished),
+        points_propagated=points,
+    )
+
+
+def streak_game_win_rate(config: MatchConfig, momentum_bins: int = 101) -> float:
+    return solve_streak(config, GAME_LEVEL, momentum_bins).win_probability
+
+
+def streak_set_win_rate(config: MatchConfig, momentum_bins: int = 101) -> float:
+    return solve_streak(config, SET_LEVEL, momentum_bins).win_probability
+
+
+def streak_match_profile(
+    config: MatchConfig, momentum_bins: int = 101
+) -> tuple[float, BreakPointMetrics]:
+    solution = solve_streak(config, MATCH_LEVEL, momentum_bins)
+    return solution.win_probability, solution.break_point_metrics
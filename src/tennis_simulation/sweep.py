@@ -0,0 +1,410 @@
+import hashlib
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Callable, Iterable, TextIO
+
+from .cache import ENGINE_VERSION, ResultCache
+from .config import MatchConfig
+from .distributions import MatchDistributions, summary_values
+from .engine import (
+    estimate_game_win_rate,
+    estimate_match_profile,
+    estimate_match_statistics,
+    estimate_set_win_rate,
+)
+from .instrumentation import Instrumentation, instrumented
+from .pressure import PressureStats, pressure_values
+
+GAME_METRIC = "game"
+SET_METRIC = "set"
+MATCH_METRIC = "match"
+# Game, set and match columns from one match run (estimate_match_statistics).
+ALL_METRIC = "all"
+
+
+@dataclass(frozen=True)
+class SweepJob:
+    row: int
+    metric: str
+    config: MatchConfig
+    samples: int
+    seed: int
+    method: str = "monte-carlo"
+    engine: str = "scalar"
+    match_workers: int | None = None
+    target_ci: float | None = None
+    antithetic: bool = False
+    # Append distributions.summary_values of the match run (match and all jobs).
+    distributions: bool = False
+    # Append pressure.pressure_values of the match run (match and all jobs).
+    pressure: bool = False
+    # Win rates by importance sampling (tilted to fair points), each followed by its
+    # standard error as the job's last value.
+    importance_sampling: bool = False
+
+    def key(self) -> str:
+        """Checkpoint key: everything that affects the result, but not the row position."""
+        payload = {
+            "metric": self.metric,
+            "config": asdict(self.config),
+            "samples": self.samples,
+            "seed": self.seed,
+            "method": self.method,
+            "engine": self.engine,
+            # Chunked runs use per-match derived seeds, a different stream from serial runs.
+            "seed_stream": "sequential" if self.match_workers is None else "derived",
+            "target_ci": self.target_ci,
+            "antithetic": self.antithetic,
+            "distributions": self.distributions,
+            "pressure": self.pressure,
+            "importance_sampling": self.importance_sampling,
+            "engine_version": ENGINE_VERSION,
+        }
+        encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+
+def probability_sweep_jobs(
+    probabilities: list[float],
+    template: MatchConfig,
+    games: int,
+    sets: int,
+    matches: int,
+    seed: int,
+    method: str = "monte-carlo",
+    engine: str = "scalar",
+    match_workers: int | None = None,
+    target_ci: float | None = None,
+    common_random_numbers: bool = False,
+    antithetic: bool = False,
+    single_pass: bool = False,
+    distributions: bool = False,
+    importance_sampling: bool = False,
+    pressure: bool = False,
+) -> list[SweepJob]:
+    """Game, set and match jobs for each probability, seeded as the sweep CLI always has.
+
+    With ``common_random_numbers`` every row reuses the first row's seeds, so all
+    probabilities are driven by the same uniforms and neighbouring rows share their noise.
+    With ``single_pass`` each row is one ``ALL_METRIC`` job on the match seed and budget.
+    With ``distributions`` the match (or all) job also reports length distributions, and
+    with ``pressure`` its pressure point counters.
+    """
+    jobs = []
+    for i, probability in enumerate(probabilities):
+        config = replace(template, p1_point_win_probability=probability)
+        base_seed = seed if common_random_numbers else seed + i * 1000
+        metrics = [(GAME_METRIC, games), (SET_METRIC, sets), (MATCH_METRIC, matches)]
+        for offset, (metric, samples) in enumerate(metrics):
+            if single_pass:
+                if metric != MATCH_METRIC:
+                    continue
+                metric = ALL_METRIC
+            jobs.append(
+                SweepJob(
+                    row=i,
+                    metric=metric,
+                    config=config,
+                    samples=samples,
+                    seed=base_seed + offset,
+                    method=method,
+                    engine=engine,
+                    match_workers=match_workers,
+                    target_ci=target_ci,
+                    antithetic=antithetic,
+                    distributions=distributions and metric in (MATCH_METRIC, ALL_METRIC),
+                    pressure=pressure and metric in (MATCH_METRIC, ALL_METRIC),
+                    importance_sampling=importance_sampling,
+                )
+            )
+    return jobs
+
+
+def _match_values(match_win_rate, metrics) -> list[float]:
+    return [
+        match_win_rate,
+        metrics.p1_break_points_earned_per_match,
+        metrics.p1_break_points_converted_per_match,
+        metrics.p1_break_points_faced_per_match,
+        metrics.p1_break_points_saved_per_match,
+        metrics.p1_break_point_conversion_rate,
+        metrics.p1_break_point_save_rate,
+    ]
+
+
+def _adaptive_values(job: SweepJob) -> list[float]:
+    """Estimate to ``job.target_ci`` (``job.samples`` is the budget), then CI bounds and n."""
+    from .adaptive import (
+        adaptive_game_win_rate,
+        adaptive_match_profile,
+        adaptive_set_win_rate,
+    )
+
+    if job.metric == GAME_METRIC:
+        estimate = adaptive_game_win_rate(job.config, job.target_ci, job.samples, job.seed)
+        values = [estimate.estimate]
+    elif job.metric == SET_METRIC:
+        estimate = adaptive_set_win_rate(job.config, job.target_ci, job.samples, job.seed)
+        values = [estimate.estimate]
+    else:
+        estimate, metrics = adaptive_match_profile(
+            job.config, job.target_ci, job.samples, job.seed
+        )
+        values = _match_values(estimate.estimate, metrics)
+    low, high = estimate.interval
+    return values + [low, high, estimate.trials]
+
+
+def _importance_values(job: SweepJob, cache: ResultCache | None) -> list[float]:
+    """Win rate by importance sampling and, for match jobs, break point columns from the
+    ordinary run (reweighting them by the tilt's likelihood ratio is far noisier)."""
+    from .importance import (
+        importance_game_win_rate,
+        importance_match_win_rate,
+        importance_set_win_rate,
+    )
+
+    config = job.config
+    if job.metric == GAME_METRIC:
+        estimate = importance_game_win_rate(config, job.samples, job.seed)
+        return [estimate.estimate, estimate.standard_error]
+    if job.metric == SET_METRIC:
+        estimate = importance_set_win_rate(config, job.samples, job.seed)
+        return [estimate.estimate, estimate.standard_error]
+
+    estimate = importance_match_win_rate(config, job.samples, job.seed)
+    ordinary = compute_job(replace(job, importance_sampling=False), cache)
+    values = [estimate.estimate] + ordinary[1:]
+    return values + [estimate.standard_error]
+
+
+def compute_job(job: SweepJob, cache: ResultCache | None = None) -> list[float]:
+    """Values of one job; scalar Monte Carlo estimates are read from and stored in ``cache``."""
+    config = job.config
+    if job.target_ci is not None:
+        return _adaptive_values(job)
+    if job.method == "exact":
+        from .exact import exact_game_win_rate, exact_match_profile, exact_set_win_rate
+
+        if job.metric == GAME_METRIC:
+            return [exact_game_win_rate(config.p1_point_win_probability, config=config)]
+        if job.metric == SET_METRIC:
+            return [exact_set_win_rate(config)]
+        return _match_values(*exact_match_profile(config))
+
+    if job.method == "solver" and config.streak.enabled:
+        from .streak_solver import (
+            streak_game_win_rate,
+            streak_match_profile,
+            streak_set_win_rate,
+        )
+
+        if job.metric == GAME_METRIC:
+            return [streak_game_win_rate(config)]
+        if job.metric == SET_METRIC:
+            return [streak_set_win_rate(config)]
+        return _match_values(*streak_match_profile(config))
+
+    if job.method == "solver":
+        from .solver import solved_game_win_rate, solved_match_profile, solved_set_win_rate
+
+        if job.metric == GAME_METRIC:
+            return [solved_game_win_rate(config)]
+        if job.metric == SET_METRIC:
+            return [solved_set_win_rate(config)]
+        return _match_values(*solved_match_profile(config))
+
+    if job.importance_sampling:
+        return _importance_values(job, cache)
+
+    if job.engine == "batch":
+        from .batch import (
+            estimate_game_win_rate_batch,
+            estimate_match_profile_batch,
+            estimate_set_win_rate_batch,
+        )
+
+        if job.metric == GAME_METRIC:
+            return [
+                estimate_game_win_rate_batch(
+                    config.p1_point_win_probability, job.samples, job.seed, config
+                )
+            ]
+        if job.metric == SET_METRIC:
+            return [estimate_set_win_rate_batch(config, job.samples, job.seed)]
+        return _match_values(*estimate_match_profile_batch(config, job.samples, job.seed))
+
+    if job.metric == GAME_METRIC:
+        return [
+            estimate_game_win_rate(
+                p1_point_win_probability=config.p1_point_win_probability,
+                n_games=job.samples,
+                seed=job.seed,
+                config=config,
+                antithetic=job.antithetic,
+                cache=cache,
+            )
+        ]
+    if job.metric == SET_METRIC:
+        return [
+            estimate_set_win_rate(
+                config=config,
+                n_sets=job.samples,
+                seed=job.seed,
+                antithetic=job.antithetic,
+                cache=cache,
+            )
+        ]
+    distributions = None
+    if job.distributions:
+        # Distributions are not cached, so these runs always simulate.
+        distributions = MatchDistributions()
+        cache = None
+    pressure_stats = None
+    if job.pressure:
+        pressure_stats = PressureStats()
+        cache = None
+    if job.metric == ALL_METRIC:
+        game_win_rate, set_win_rate, match_win_rate, metrics = estimate_match_statistics(
+            config=config,
+            n_matches=job.samples,
+            seed=job.seed,
+            workers=job.match_workers,
+            antithetic=job.antithetic,
+            distributions=distributions,
+            cache=cache,
+            pressure_stats=pressure_stats,
+        )
+        values = [game_win_rate, set_win_rate] + _match_values(match_win_rate, metrics)
+    else:
+        values = _match_values(
+            *estimate_match_profile(
+                config=config,
+                n_matches=job.samples,
+                seed=job.seed,
+                workers=job.match_workers,
+                antithetic=job.antithetic,
+                distributions=distributions,
+                cache=cache,
+                pressure_stats=pressure_stats,
+            )
+        )
+    if distributions is not None:
+        values += summary_values(distributions)
+    if pressure_stats is not None:
+        values += pressure_values(pressure_stats, job.samples)
+    return values
+
+
+def _instrumented_job(
+    job: SweepJob, cache: ResultCache | None, instrumentation: Instrumentation | None
+) -> list[float]:
+    if instrumentation is None:
+        return compute_job(job, cache)
+    with instrumented(instrumentation), instrumentation.phase(f"{job.metric}_jobs"):
+        return compute_job(job, cache)
+
+
+def _compute_job_in_worker(
+    job: SweepJob, cache: ResultCache | None, time_points: bool
+) -> tuple[list[float], dict]:
+    """compute_job under a fresh Instrumentation, returned as a snapshot to merge."""
+    instrumentation = Instrumentation(time_points)
+    return _instrumented_job(job, cache, instrumentation), instrumentation.snapshot()
+
+
+def load_checkpoint(path: Path) -> dict[str, list[float]]:
+    done: dict[str, list[float]] = {}
+    if not path.exists():
+        return done
+    with path.open("r", encoding="utf-8") as checkpoint_file:
+        for line in checkpoint_file:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash mid-write can leave a truncated last line; that job just reruns.
+                continue
+            done[record["key"]] = record["values"]
+    return done
+
+
+def append_checkpoint(checkpoint_file: TextIO, job: SweepJob, values: list[float]) -> None:
+    """Append one finished job and fsync, so a crash loses at most the job in flight."""
+    checkpoint_file.write(json.dumps({"key": job.key(), "values": values}) + "\n")
+    checkpoint_file.flush()
+    os.fsync(checkpoint_file.fileno())
+
+
+def run_jobs(
+    jobs: Iterable[SweepJob],
+    workers: int = 1,
+    checkpoint: Path | None = None,
+    cache: ResultCache | None = None,
+    instrumentation: Instrumentation | None = None,
+    on_result: Callable[[SweepJob, list[float]], None] | None = None,
+) -> dict[SweepJob, list[float]]:
+    """Run sweep jobs on a process pool, appending each result to ``checkpoint`` as it lands.
+
+    Jobs whose key is already in the checkpoint are not rerun, so an interrupted sweep
+    resumes where it stopped. Results only depend on each job, so the merged output is the
+    same for any ``workers``. ``cache`` is shared with the worker processes. Worker
+    counters and phase times are merged into ``instrumentation`` as each job finishes,
+    before ``on_result`` is called with it.
+    """
+    if workers <= 0:
+        raise ValueError("workers must be greater than 0.")
+
+    jobs = list(jobs)
+    done = load_checkpoint(checkpoint) if checkpoint is not None else {}
+    results = {job: done[job.key()] for job in jobs if job.key() in done}
+    pending = [job for job in jobs if job not in results]
+    if not pending:
+        return results
+
+    checkpoint_file = None
+    if checkpoint is not None:
+        checkpoint.parent.mkdir(parents=True, exist_ok=True)
+        checkpoint_file = checkpoint.open("a", encoding="utf-8")
+
+    def record(job: SweepJob, values: list[float]) -> None:
+        results[job] = values
+        if checkpoint_file is not None:
+            append_checkpoint(checkpoint_file, job, values)
+        if on_result is not None:
+            on_result(job, values)
+
+    try:
+        if workers == 1:
+            for job in pending:
+                record(job, _instrumented_job(job, cache, instrumentation))
+        elif instrumentation is None:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(compute_job, job, cache): job for job in pending}
+                while futures:
+                    finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        record(futures.pop(future), future.result())
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(
+                        _compute_job_in_worker, job, cache, instrumentation.time_points
+                    ): job
+                    for job in pending
+                }
+                while futures:
+                    finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        values, snapshot = future.result()
+                        instrumentation.merge_snapshot(snapshot)
+                        record(futures.pop(future), values)
+    finally:
+        if checkpoint_file is not None:
+            checkpoint_file.close()
+    return results
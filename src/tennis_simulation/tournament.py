@@ -0,0 +1,193 @@
+import math
+from dataclasses import dataclass, replace
+from functools import lru_cache
+
+import numpy as np
+
+from .config import MatchConfig
+from .engine import _validate_match_config, estimate_match_win_rate
+from .exact import exact_match_win_rate
+from .solver import solved_match_win_rate
+
+# Bracket replays simulated per NumPy pass; bounds memory for large draws.
+_REPLAY_CHUNK = 8192
+
+
+@dataclass(frozen=True)
+class Player:
+    name: str
+    # Point win probability against a 0.5 (average) opponent.
+    point_win_probability: float = 0.5
+
+
+def head_to_head_point_probability(player: Player, opponent: Player) -> float:
+    """P(``player`` wins a point against ``opponent``): the difference of their log-odds."""
+    p = player.point_win_probability
+    q = opponent.point_win_probability
+    log_odds = math.log(p / (1.0 - p)) - math.log(q / (1.0 - q))
+    return 1.0 / (1.0 + math.exp(-log_odds))
+
+
+@lru_cache(maxsize=65536)
+def head_to_head_win_probability(
+    config: MatchConfig, samples: int = 20000, seed: int | None = 12345
+) -> float:
+    """P1 match win probability, memoized per config.
+
+    Independent points use the closed forms and clutch the state-space solver. Streak
+    configs fall back to ``estimate_match_win_rate`` with ``samples`` matches.
+    """
+    if config.streak.enabled:
+        return estimate_match_win_rate(config=config, n_matches=samples, seed=seed)
+    if config.clutch.enabled:
+        return solved_match_win_rate(config)
+    return exact_match_win_rate(config)
+
+
+def _validate_draw(draw: list[Player | None]) -> None:
+    size = len(draw)
+    if size < 2 or size & (size - 1):
+        raise ValueError("The draw size must be a power of two (e.g. 32, 64 or 128).")
+    for player in draw:
+        if player is not None and not 0.0 < player.point_win_probability < 1.0:
+            raise ValueError(
+                f"{player.name}: point_win_probability must be strictly between 0 and 1."
+            )
+    if sum(player is not None for player in draw) < 2:
+        raise ValueError("The draw needs at least two players.")
+
+
+def head_to_head_matrix(
+    players: list[Player],
+    template: MatchConfig = MatchConfig(),
+    samples: int = 20000,
+    seed: int | None = 12345,
+    grid_points: int = 401,
+) -> np.ndarray:
+    """``matrix[i, j]`` = P(players[i] beats players[j]); the earlier-listed player is P1.
+
+    A pairing's odds only depend on its point probability, so
+    ``head_to_head_win_probability`` runs once per distinct pair probability, or, when
+    the draw has more of those than ``grid_points``, at ``grid_points`` values of a match
+    win curve that every pairing interpolates (see ``pool.pool_matrix``).
+    """
+    # pool builds on this module, so it is imported here.
+    from .pool import MatchWinCurve, _point_probabilities, pool_matrix
+
+    _validate_match_config(template)
+    n = len(players)
+    probabilities = np.array([player.point_win_probability for player in players])
+    log_odds = np.log(probabilities / (1.0 - probabilities))
+    pair_probabilities = np.unique(
+        _point_probabilities(log_odds, slice(0, n))[np.triu_indices(n, k=1)]
+    )
+    curve = None
+    if pair_probabilities.size <= grid_points:
+        # Interpolating at the curve's own nodes returns each node value exactly.
+        curve = MatchWinCurve(
+            pair_probabilities,
+            np.array(
+                [
+                    head_to_head_win_probability(
+                        replace(template, p1_point_win_probability=float(p)), samples, seed
+                    )
+                    for p in pair_probabilities
+                ]
+            ),
+        )
+    return np.asarray(
+        pool_matrix(players, template, grid_points, samples, seed, curve=curve)
+    )
+
+
+def round_names(draw_size: int) -> list[str]:
+    """Column names for ``TournamentResult.reach_probabilities``, e.g. R32 ... F, W."""
+    names = []
+    remaining = draw_size
+    while remaining > 1:
+        names.append({8: "QF", 4: "SF", 2: "F"}.get(remaining, f"R{remaining}"))
+        remaining //= 2
+    names.append("W")
+    return names
+
+
+@dataclass
+class TournamentResult:
+    players: list[Player]
+    # reach_probabilities[i, r]: P(players[i] reaches round r); column 0 is the first round
+    # and the last column is winning the title.
+    reach_probabilities: np.ndarray
+    round_names: list[str]
+    replays: int
+
+    def rows(self) -> list[list]:
+        return [
+            [player.name, *map(float, probabilities)]
+            for player, probabilities in zip(self.players, self.reach_probabilities)
+        ]
+
+
+def simulate_tournament(
+    draw: list[Player | None],
+    n_replays: int,
+    template: MatchConfig = MatchConfig(),
+    seed: int | None = None,
+    samples: int = 20000,
+    matrix: np.ndarray | None = None,
+    grid_points: int = 401,
+) -> TournamentResult:
+    """Replay a single-elimination bracket ``n_replays`` times.
+
+    ``draw`` lists the bracket in order, so slots 0 and 1 meet in the first round; ``None``
+    is a bye. Each match is one uniform draw against the head-to-head matrix, which is
+    built with ``head_to_head_matrix(players, template, samples, seed, grid_points)``
+    unless ``matrix`` (over the non-bye players, in draw order) is given. All replays
+    advance a round at a time.
+    """
+    if n_replays <= 0:
+        raise ValueError("n_replays must be greater than 0.")
+    _validate_draw(draw)
+    players = [player for player in draw if player is not None]
+    n = len(players)
+    if matrix is None:
+        matrix = head_to_head_matrix(players, template, samples, seed, grid_points)
+    elif matrix.shape != (n, n):
+        raise ValueError(f"matrix must have shape ({n}, {n}).")
+
+    # Index n is the bye: it loses to every player.
+    bye = n
+    win = np.zeros((n + 1, n + 1))
+    win[:n, :n] = matrix
+    win[:n, bye] = 1.0
+    slots = []
+    index = 0
+    for player in draw:
+        if player is None:
+            slots.append(bye)
+        else:
+            slots.append(index)
+            index += 1
+    slots = np.asarray(slots, dtype=np.intp)
+
+    names = round_names(len(draw))
+    counts = np.zeros((n + 1, len(names)), dtype=np.int64)
+    counts[:n, 0] = n_replays
+    rng = np.random.default_rng(seed)
+    remaining = n_replays
+    while remaining > 0:
+        chunk = min(remaining, _REPLAY_CHUNK)
+        remaining -= chunk
+        alive = np.broadcast_to(slots, (chunk, slots.size))
+        for round_index in range(1, len(names)):
+            first = alive[:, 0::2]
+            second = alive[:, 1::2]
+            first_won = rng.random(first.shape) < win[first, second]
+            alive = np.where(first_won, first, second)
+            counts[:, round_index] += np.bincount(alive.ravel(), minlength=n + 1)
+
+    return TournamentResult(
+        players=players,
+        reach_probabilities=counts[:n] / n_replays,
+        round_names=names,
+        replays=n_replays,
+    )
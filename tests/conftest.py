@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The package and the CLI scripts live in src/ and are run from there, not installed.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
@@ -0,0 +1,70 @@
+import math
+
+import pytest
+
+from tennis_simulation import ClutchConfig, MatchConfig, StreakConfig
+from tennis_simulation.batch import simulate_matches_batch
+from tennis_simulation.engine import run_monte_carlo
+from tennis_simulation.exact import (
+    exact_game_win_rate,
+    exact_match_profile,
+    exact_set_win_rate,
+)
+from tennis_simulation.solver import (
+    solved_game_win_rate,
+    solved_match_profile,
+    solved_set_win_rate,
+)
+from tennis_simulation.streak_solver import solve_streak
+
+# Monte Carlo agreement is checked at this many standard errors.
+Z = 4.0
+
+STREAK_CLUTCH = MatchConfig(
+    p1_point_win_probability=0.52,
+    streak=StreakConfig(enabled=True, intensity=0.05),
+    clutch=ClutchConfig(enabled=True, primary_boost=0.03, secondary_boost=0.01),
+)
+
+
+def _standard_error(rate: float, samples: int) -> float:
+    return math.sqrt(rate * (1.0 - rate) / samples)
+
+
+@pytest.mark.parametrize("best_of_sets", [3, 5])
+@pytest.mark.parametrize("p", [0.3, 0.45, 0.5, 0.55, 0.62])
+def test_exact_matches_solver(p, best_of_sets):
+    config = MatchConfig(best_of_sets=best_of_sets, p1_point_win_probability=p)
+    assert solved_game_win_rate(config) == pytest.approx(exact_game_win_rate(p), abs=1e-9)
+    assert solved_set_win_rate(config) == pytest.approx(exact_set_win_rate(config), abs=1e-9)
+    exact_rate, exact_metrics = exact_match_profile(config)
+    solved_rate, solved_metrics = solved_match_profile(config)
+    assert solved_rate == pytest.approx(exact_rate, abs=1e-9)
+    assert solved_metrics.p1_break_points_earned_per_match == pytest.approx(
+        exact_metrics.p1_break_points_earned_per_match, abs=1e-9
+    )
+    assert solved_metrics.p1_break_points_saved_per_match == pytest.approx(
+        exact_metrics.p1_break_points_saved_per_match, abs=1e-9
+    )
+
+
+def test_streak_solver_agrees_with_batch_monte_carlo():
+    n_matches = 40000
+    solution = solve_streak(STREAK_CLUTCH, momentum_bins=21)
+    results = simulate_matches_batch(STREAK_CLUTCH, n_matches, seed=1)
+    rate = results.p1_wins / n_matches
+    tolerance = Z * _standard_error(rate, n_matches) + solution.discretization_error_estimate
+    assert abs(solution.win_probability - rate) < tolerance
+
+
+def test_batch_agrees_with_scalar_monte_carlo():
+    batch_matches = 40000
+    scalar_matches = 4000
+    batch_wins = simulate_matches_batch(STREAK_CLUTCH, batch_matches, seed=2).p1_wins
+    batch_rate = batch_wins / batch_matches
+    scalar_wins, _ = run_monte_carlo(scalar_matches, STREAK_CLUTCH, seed=2)
+    scalar_rate = scalar_wins / scalar_matches
+    standard_error = math.hypot(
+        _standard_error(batch_rate, batch_matches), _standard_error(scalar_rate, scalar_matches)
+    )
+    assert abs(batch_rate - scalar_rate) < Z * standard_error